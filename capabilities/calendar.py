@@ -10,160 +10,235 @@ Actions:
     get_upcoming(hours_ahead) — events within the next N hours
     get_today() — all events for today
     create(event) — create a new calendar event
+    create_many(events) — create several events in one transaction
     get_range(start_date, end_date) — events within a date range
 """
 
 import json
 import logging
 import sqlite3
-import uuid
 from datetime import datetime, timedelta
 
-from storage.schema import CALENDAR_SCHEMA
+from storage.ids import new_id
+from storage.pool import ConnectionPool, run_in_thread
+from storage.schema import CALENDAR_INDEXES, CALENDAR_SCHEMA, JOURNAL_MODE_PRAGMA, RETURNING_ALL
 
 logger = logging.getLogger(__name__)
 
+# Stored value for an event with no participants (also the column default)
+EMPTY_PARTICIPANTS = "[]"
+
+INSERT_EVENT_SQL = """INSERT INTO events
+    (id, title, date, time, duration_minutes, notes, participants)
+    VALUES (?, ?, ?, ?, ?, ?, ?)"""
+
 
 class Calendar:
     """Manages the local calendar store."""
 
+    # Column order of the events table, so rows convert positionally with SELECT *
+    _COLUMNS = ("id", "title", "date", "time", "duration_minutes", "notes", "participants")
+
     def __init__(self, db_path: str):
         self.db_path = db_path
+        self._pool = ConnectionPool(db_path)
         self._init_db()
 
     def _init_db(self):
-        """Ensure the events table exists."""
+        """Ensure the events table and its indexes exist and the database is in WAL mode."""
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.execute(CALENDAR_SCHEMA)
-            conn.commit()
-            conn.close()
+            with self._conn(write=True) as conn:
+                if self.db_path != ":memory:":
+                    conn.execute(JOURNAL_MODE_PRAGMA)
+                conn.execute(CALENDAR_SCHEMA)
+                for index_sql in CALENDAR_INDEXES:
+                    conn.execute(index_sql)
+                conn.commit()
         except sqlite3.Error as e:
             logger.error("Failed to initialize calendar database: %s", e)
 
-    def _get_conn(self) -> sqlite3.Connection:
-        """Return a connection with row factory for dict-like access."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+    def _conn(self, write: bool = False):
+        """Borrow a pooled connection with row factory for dict-like access."""
+        return self._pool.connection(write=write)
+
+    def close(self):
+        """Close pooled database connections. Call on shutdown."""
+        self._pool.close()
+
+    @run_in_thread
+    def checkpoint(self):
+        """Checkpoint the WAL without blocking. Called by the proactive loop when idle."""
+        try:
+            self._pool.checkpoint()
+        except sqlite3.Error as e:
+            logger.warning("Failed to checkpoint calendar database: %s", e)
 
     def _row_to_dict(self, row: sqlite3.Row) -> dict:
-        """Convert a sqlite3.Row to a plain dict."""
-        participants = row["participants"]
-        # participants is stored as JSON string
+        """Convert a sqlite3.Row to a plain dict, matching columns by position."""
+        result = dict(zip(self._COLUMNS, row))
+        # participants is stored as JSON string; most events have none, so skip parsing "[]"
+        participants = result["participants"]
+        if not participants or participants == EMPTY_PARTICIPANTS:
+            result["participants"] = []
+            return result
         try:
-            participants = json.loads(participants)
+            result["participants"] = json.loads(participants)
         except (json.JSONDecodeError, TypeError):
-            participants = []
-
-        return {
-            "id": row["id"],
-            "title": row["title"],
-            "date": row["date"],
-            "time": row["time"],
-            "duration_minutes": row["duration_minutes"],
-            "notes": row["notes"],
-            "participants": participants,
-        }
-
-    async def get_upcoming(self, hours_ahead: int) -> list[dict]:
+            result["participants"] = []
+        return result
+
+    @run_in_thread
+    def get_upcoming(self, hours_ahead: int) -> list[dict]:
         """Return events scheduled within the next N hours.
 
         Compares event date+time against current time through current time + hours_ahead.
+        date and time are compared as separate columns so the (date, time) index is used.
         """
         try:
             now = datetime.now()
             cutoff = now + timedelta(hours=hours_ahead)
 
-            now_str = now.strftime("%Y-%m-%d %H:%M")
-            cutoff_str = cutoff.strftime("%Y-%m-%d %H:%M")
+            now_date, now_time = now.strftime("%Y-%m-%d"), now.strftime("%H:%M")
+            cutoff_date, cutoff_time = cutoff.strftime("%Y-%m-%d"), cutoff.strftime("%H:%M")
 
-            conn = self._get_conn()
-            rows = conn.execute(
-                """SELECT * FROM events
-                   WHERE (date || ' ' || time) >= ?
-                   AND (date || ' ' || time) <= ?
-                   ORDER BY date, time""",
-                (now_str, cutoff_str),
-            ).fetchall()
-            conn.close()
+            with self._conn() as conn:
+                cursor = conn.execute(
+                    """SELECT * FROM events
+                       WHERE date >= ? AND date <= ?
+                       AND (date > ? OR time >= ?)
+                       AND (date < ? OR time <= ?)
+                       ORDER BY date, time""",
+                    (now_date, cutoff_date, now_date, now_time, cutoff_date, cutoff_time),
+                )
+                results = [self._row_to_dict(row) for row in cursor]
 
-            return [self._row_to_dict(row) for row in rows]
+            return results
 
         except sqlite3.Error as e:
             logger.error("Failed to get upcoming events: %s", e)
             return []
 
-    async def get_today(self) -> list[dict]:
+    @run_in_thread
+    def get_today(self) -> list[dict]:
         """Return all events for today, ordered by time."""
         try:
             today = datetime.now().date().isoformat()
 
-            conn = self._get_conn()
-            rows = conn.execute(
-                "SELECT * FROM events WHERE date = ? ORDER BY time",
-                (today,),
-            ).fetchall()
-            conn.close()
+            with self._conn() as conn:
+                cursor = conn.execute(
+                    "SELECT * FROM events WHERE date = ? ORDER BY time",
+                    (today,),
+                )
+                results = [self._row_to_dict(row) for row in cursor]
 
-            return [self._row_to_dict(row) for row in rows]
+            return results
 
         except sqlite3.Error as e:
             logger.error("Failed to get today's events: %s", e)
             return []
 
-    async def create(self, event: dict) -> dict:
+    def _new_event_params(self, event: dict) -> tuple:
+        """Validate a new event and build its INSERT parameters, in column order.
+
+        Raises ValueError with a user-facing message when required fields are missing.
+        """
+        title = event.get("title")
+        date = event.get("date")
+        time = event.get("time")
+
+        if not all([title, date, time]):
+            raise ValueError("Missing required fields: title, date, time")
+
+        participants = event.get("participants")
+
+        return (
+            new_id(),
+            title,
+            date,
+            time,
+            event.get("duration_minutes", 60),
+            event.get("notes", ""),
+            json.dumps(participants) if participants else EMPTY_PARTICIPANTS,
+        )
+
+    @run_in_thread
+    def create(self, event: dict) -> dict:
         """Create a new calendar event. ID is auto-generated.
 
         Required fields: title, date, time
         Optional fields: duration_minutes (default 60), notes, participants
         """
         try:
-            title = event.get("title")
-            date = event.get("date")
-            time = event.get("time")
-
-            if not all([title, date, time]):
-                return {"error": "Missing required fields: title, date, time"}
-
-            event_id = str(uuid.uuid4())
-            duration = event.get("duration_minutes", 60)
-            notes = event.get("notes", "")
-            participants = json.dumps(event.get("participants", []))
-
-            conn = self._get_conn()
-            conn.execute(
-                """INSERT INTO events
-                   (id, title, date, time, duration_minutes, notes, participants)
-                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
-                (event_id, title, date, time, duration, notes, participants),
-            )
-            conn.commit()
-
-            row = conn.execute("SELECT * FROM events WHERE id = ?", (event_id,)).fetchone()
-            conn.close()
+            params = self._new_event_params(event)
+        except ValueError as e:
+            return {"error": str(e)}
+
+        try:
+            with self._conn(write=True) as conn:
+                row = conn.execute(INSERT_EVENT_SQL + RETURNING_ALL, params).fetchone()
+                if row is None:
+                    row = conn.execute("SELECT * FROM events WHERE id = ?", (params[0],)).fetchone()
+                conn.commit()
 
             result = self._row_to_dict(row)
-            logger.info("Created event: %s on %s at %s", title, date, time)
+            logger.info("Created event: %s on %s at %s", result["title"], result["date"], result["time"])
             return result
 
         except sqlite3.Error as e:
             logger.error("Failed to create event: %s", e)
             return {"error": f"Storage failure: {e}"}
 
-    async def get_range(self, start_date: str, end_date: str) -> list[dict]:
+    @run_in_thread
+    def create_many(self, events: list[dict]) -> list[dict]:
+        """Create several events in a single transaction.
+
+        Each event is validated as in create(). Returns one result per input, in
+        order: the created event, or {"error": ...} for an entry that failed validation.
+        """
+        results = []
+        params_list = []
+        for event in events:
+            try:
+                params = self._new_event_params(event)
+            except ValueError as e:
+                results.append({"error": str(e)})
+                continue
+            params_list.append(params)
+            results.append(params)
+
+        try:
+            with self._conn(write=True) as conn:
+                # Insert row by row so each result is the stored row, exactly as create() returns it
+                rows = {}
+                for params in params_list:
+                    row = conn.execute(INSERT_EVENT_SQL + RETURNING_ALL, params).fetchone()
+                    if row is None:
+                        row = conn.execute("SELECT * FROM events WHERE id = ?", (params[0],)).fetchone()
+                    rows[params[0]] = row
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.error("Failed to create events: %s", e)
+            # Entries that failed validation keep their own error; only the
+            # ones written in the rolled-back transaction report the failure
+            return [r if isinstance(r, dict) else {"error": f"Storage failure: {e}"} for r in results]
+
+        logger.info("Created %d events", len(params_list))
+        return [r if isinstance(r, dict) else self._row_to_dict(rows[r[0]]) for r in results]
+
+    @run_in_thread
+    def get_range(self, start_date: str, end_date: str) -> list[dict]:
         """Return events within a date range (inclusive), ordered by date and time."""
         try:
-            conn = self._get_conn()
-            rows = conn.execute(
-                """SELECT * FROM events
-                   WHERE date >= ? AND date <= ?
-                   ORDER BY date, time""",
-                (start_date, end_date),
-            ).fetchall()
-            conn.close()
-
-            return [self._row_to_dict(row) for row in rows]
+            with self._conn() as conn:
+                cursor = conn.execute(
+                    """SELECT * FROM events
+                       WHERE date >= ? AND date <= ?
+                       ORDER BY date, time""",
+                    (start_date, end_date),
+                )
+                results = [self._row_to_dict(row) for row in cursor]
+
+            return results
 
         except sqlite3.Error as e:
             logger.error("Failed to get events in range: %s", e)
@@ -10,6 +10,7 @@ Actions:
     get(name) — find contact by name or partial name
     list() — return all contacts
     create(contact) — create a new contact
+    create_many(contacts) — create several contacts in one transaction
     update(id, fields) — update specific fields on a contact
     note_interaction(id) — update last_interaction to now
     get_neglected(days_threshold) — contacts not interacted with recently
@@ -17,68 +18,106 @@ Actions:
 
 import logging
 import sqlite3
-import uuid
 from datetime import datetime, timedelta
 
-from storage.schema import CONTACTS_SCHEMA
+from storage.epoch import epoch_seconds
+from storage.ids import new_id
+from storage.pool import ConnectionPool, run_in_thread
+from storage.schema import (
+    CONTACTS_INDEXES,
+    CONTACTS_SCHEMA,
+    JOURNAL_MODE_PRAGMA,
+    LAST_INTERACTION_EPOCH,
+    RETURNING_ALL,
+)
 
 logger = logging.getLogger(__name__)
 
+INSERT_CONTACT_SQL = """INSERT INTO contacts
+    (id, name, relationship, phone, email, notes, last_interaction, communication_preference)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)"""
+
 # Fields that can be set on a contact
-VALID_FIELDS = {
+VALID_FIELDS = frozenset({
     "name", "relationship", "phone", "email",
     "notes", "last_interaction", "communication_preference",
-}
+})
 
 
 class Contacts:
     """Manages the local contact store."""
 
+    # Column order of the contacts table, so rows convert positionally with SELECT *
+    _COLUMNS = (
+        "id",
+        "name",
+        "relationship",
+        "phone",
+        "email",
+        "notes",
+        "last_interaction",
+        "communication_preference",
+    )
+
     def __init__(self, db_path: str):
         self.db_path = db_path
+        self._pool = ConnectionPool(db_path)
         self._init_db()
 
     def _init_db(self):
-        """Ensure the contacts table exists."""
+        """Ensure the contacts table and its indexes exist and the database is in WAL mode."""
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.execute(CONTACTS_SCHEMA)
-            conn.commit()
-            conn.close()
+            with self._conn(write=True) as conn:
+                if self.db_path != ":memory:":
+                    conn.execute(JOURNAL_MODE_PRAGMA)
+                conn.execute(CONTACTS_SCHEMA)
+                for index_sql in CONTACTS_INDEXES:
+                    conn.execute(index_sql)
+                conn.commit()
         except sqlite3.Error as e:
             logger.error("Failed to initialize contacts database: %s", e)
 
-    def _get_conn(self) -> sqlite3.Connection:
-        """Return a connection with row factory for dict-like access."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+    def _conn(self, write: bool = False):
+        """Borrow a pooled connection with row factory for dict-like access."""
+        return self._pool.connection(write=write)
+
+    def close(self):
+        """Close pooled database connections. Call on shutdown."""
+        self._pool.close()
+
+    @run_in_thread
+    def checkpoint(self):
+        """Checkpoint the WAL without blocking. Called by the proactive loop when idle."""
+        try:
+            self._pool.checkpoint()
+        except sqlite3.Error as e:
+            logger.warning("Failed to checkpoint contacts database: %s", e)
 
     def _row_to_dict(self, row: sqlite3.Row) -> dict:
-        """Convert a sqlite3.Row to a plain dict."""
-        return {
-            "id": row["id"],
-            "name": row["name"],
-            "relationship": row["relationship"],
-            "phone": row["phone"],
-            "email": row["email"],
-            "notes": row["notes"],
-            "last_interaction": row["last_interaction"],
-            "communication_preference": row["communication_preference"],
-        }
-
-    async def get(self, name: str) -> dict | None:
+        """Convert a sqlite3.Row to a plain dict, matching columns by position."""
+        return dict(zip(self._COLUMNS, row))
+
+    @run_in_thread
+    def get(self, name: str) -> dict | None:
         """Find a contact by name or partial name (case-insensitive).
 
-        Returns the first matching contact, or None if not found.
+        Returns the first matching contact, or None if not found. A prefix match
+        is tried first since it can use the name index; the substring scan is
+        only the fallback. A name that starts with the query therefore wins over
+        one that merely contains it: with "Joanna" and "Anna Lee", get("anna")
+        returns Anna Lee.
         """
         try:
-            conn = self._get_conn()
-            row = conn.execute(
-                "SELECT * FROM contacts WHERE name LIKE ? COLLATE NOCASE",
-                (f"%{name}%",),
-            ).fetchone()
-            conn.close()
+            with self._conn() as conn:
+                row = conn.execute(
+                    "SELECT * FROM contacts WHERE name LIKE ? COLLATE NOCASE",
+                    (f"{name}%",),
+                ).fetchone()
+                if row is None:
+                    row = conn.execute(
+                        "SELECT * FROM contacts WHERE name LIKE ? COLLATE NOCASE",
+                        (f"%{name}%",),
+                    ).fetchone()
 
             if row is None:
                 return None
@@ -88,88 +127,133 @@ class Contacts:
             logger.error("Failed to get contact '%s': %s", name, e)
             return None
 
-    async def list(self) -> list[dict]:
+    @run_in_thread
+    def list(self) -> list[dict]:
         """Return all contacts, ordered by name."""
         try:
-            conn = self._get_conn()
-            rows = conn.execute("SELECT * FROM contacts ORDER BY name").fetchall()
-            conn.close()
-            return [self._row_to_dict(row) for row in rows]
+            with self._conn() as conn:
+                cursor = conn.execute("SELECT * FROM contacts ORDER BY name")
+                results = [self._row_to_dict(row) for row in cursor]
+            return results
 
         except sqlite3.Error as e:
             logger.error("Failed to list contacts: %s", e)
             return []
 
-    async def create(self, contact: dict) -> dict:
+    def _new_contact_params(self, contact: dict) -> tuple:
+        """Validate a new contact and build its INSERT parameters, in column order.
+
+        Raises ValueError with a user-facing message when the name is missing.
+        """
+        name = contact.get("name")
+        if not name:
+            raise ValueError("Missing required field: name")
+
+        return (
+            new_id(),
+            name,
+            contact.get("relationship"),
+            contact.get("phone"),
+            contact.get("email"),
+            contact.get("notes", ""),
+            datetime.now().date().isoformat(),
+            contact.get("communication_preference", ""),
+        )
+
+    @run_in_thread
+    def create(self, contact: dict) -> dict:
         """Create a new contact. ID is auto-generated.
 
         Required fields: name
         Optional fields: relationship, phone, email, notes, communication_preference
         """
         try:
-            name = contact.get("name")
-            if not name:
-                return {"error": "Missing required field: name"}
-
-            contact_id = str(uuid.uuid4())
-            now = datetime.now().date().isoformat()
+            params = self._new_contact_params(contact)
+        except ValueError as e:
+            return {"error": str(e)}
 
-            conn = self._get_conn()
-            conn.execute(
-                """INSERT INTO contacts
-                   (id, name, relationship, phone, email, notes, last_interaction, communication_preference)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    contact_id,
-                    name,
-                    contact.get("relationship"),
-                    contact.get("phone"),
-                    contact.get("email"),
-                    contact.get("notes", ""),
-                    now,
-                    contact.get("communication_preference", ""),
-                ),
-            )
-            conn.commit()
-
-            row = conn.execute("SELECT * FROM contacts WHERE id = ?", (contact_id,)).fetchone()
-            conn.close()
+        try:
+            with self._conn(write=True) as conn:
+                row = conn.execute(INSERT_CONTACT_SQL + RETURNING_ALL, params).fetchone()
+                if row is None:
+                    row = conn.execute("SELECT * FROM contacts WHERE id = ?", (params[0],)).fetchone()
+                conn.commit()
 
             result = self._row_to_dict(row)
-            logger.info("Created contact: %s", name)
+            logger.info("Created contact: %s", result["name"])
             return result
 
         except sqlite3.Error as e:
             logger.error("Failed to create contact: %s", e)
             return {"error": f"Storage failure: {e}"}
 
-    async def update(self, contact_id: str, fields: dict) -> dict:
-        """Update specific fields on an existing contact.
+    @run_in_thread
+    def create_many(self, contacts: list[dict]) -> list[dict]:
+        """Create several contacts in a single transaction.
 
-        Only fields in VALID_FIELDS are accepted.
+        Each contact is validated as in create(). Returns one result per input, in
+        order: the created contact, or {"error": ...} for an entry that failed validation.
         """
+        results = []
+        params_list = []
+        for contact in contacts:
+            try:
+                params = self._new_contact_params(contact)
+            except ValueError as e:
+                results.append({"error": str(e)})
+                continue
+            params_list.append(params)
+            results.append(params)
+
         try:
-            # Filter to valid fields only
-            updates = {k: v for k, v in fields.items() if k in VALID_FIELDS}
-            if not updates:
-                return {"error": "No valid fields to update"}
+            with self._conn(write=True) as conn:
+                # Insert row by row so each result is the stored row, exactly as create() returns it
+                rows = {}
+                for params in params_list:
+                    row = conn.execute(INSERT_CONTACT_SQL + RETURNING_ALL, params).fetchone()
+                    if row is None:
+                        row = conn.execute("SELECT * FROM contacts WHERE id = ?", (params[0],)).fetchone()
+                    rows[params[0]] = row
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.error("Failed to create contacts: %s", e)
+            # Entries that failed validation keep their own error; only the
+            # ones written in the rolled-back transaction report the failure
+            return [r if isinstance(r, dict) else {"error": f"Storage failure: {e}"} for r in results]
 
-            conn = self._get_conn()
+        logger.info("Created %d contacts", len(params_list))
+        return [r if isinstance(r, dict) else self._row_to_dict(rows[r[0]]) for r in results]
 
-            # Check contact exists
-            row = conn.execute("SELECT * FROM contacts WHERE id = ?", (contact_id,)).fetchone()
-            if row is None:
-                conn.close()
-                return {"error": f"Contact not found: {contact_id}"}
-
-            # Build dynamic UPDATE
-            set_clause = ", ".join(f"{k} = ?" for k in updates)
-            values = [*list(updates.values()), contact_id]
-            conn.execute(f"UPDATE contacts SET {set_clause} WHERE id = ?", values)
-            conn.commit()
+    @run_in_thread
+    def update(self, contact_id: str, fields: dict) -> dict:
+        """Update specific fields on an existing contact.
 
-            row = conn.execute("SELECT * FROM contacts WHERE id = ?", (contact_id,)).fetchone()
-            conn.close()
+        Only fields in VALID_FIELDS are accepted.
+        """
+        try:
+            # Filter to valid fields only, collecting SET terms and values in one pass
+            assignments = []
+            values = []
+            for key, value in fields.items():
+                if key in VALID_FIELDS:
+                    assignments.append(key + " = ?")
+                    values.append(value)
+            if not assignments:
+                return {"error": "No valid fields to update"}
+            values.append(contact_id)
+
+            with self._conn(write=True) as conn:
+                # Build dynamic UPDATE — no row back means the contact does not exist
+                set_clause = ", ".join(assignments)
+                cursor = conn.execute(
+                    f"UPDATE contacts SET {set_clause} WHERE id = ?" + RETURNING_ALL, values,
+                )
+                row = cursor.fetchone()
+                if row is None and not RETURNING_ALL and cursor.rowcount:
+                    row = conn.execute("SELECT * FROM contacts WHERE id = ?", (contact_id,)).fetchone()
+                if row is None:
+                    return {"error": f"Contact not found: {contact_id}"}
+                conn.commit()
 
             result = self._row_to_dict(row)
             logger.info("Updated contact: %s", contact_id)
@@ -179,25 +263,24 @@ class Contacts:
             logger.error("Failed to update contact %s: %s", contact_id, e)
             return {"error": f"Update failure: {e}"}
 
-    async def note_interaction(self, contact_id: str) -> dict:
+    @run_in_thread
+    def note_interaction(self, contact_id: str) -> dict:
         """Update last_interaction date to now."""
         try:
-            conn = self._get_conn()
             now = datetime.now().date().isoformat()
 
-            row = conn.execute("SELECT * FROM contacts WHERE id = ?", (contact_id,)).fetchone()
-            if row is None:
-                conn.close()
-                return {"error": f"Contact not found: {contact_id}"}
-
-            conn.execute(
-                "UPDATE contacts SET last_interaction = ? WHERE id = ?",
-                (now, contact_id),
-            )
-            conn.commit()
-
-            row = conn.execute("SELECT * FROM contacts WHERE id = ?", (contact_id,)).fetchone()
-            conn.close()
+            with self._conn(write=True) as conn:
+                cursor = conn.execute(
+                    "UPDATE contacts SET last_interaction = ? WHERE id = ?" + RETURNING_ALL,
+                    (now, contact_id),
+                )
+                row = cursor.fetchone()
+                # Without RETURNING, read the row back only if the UPDATE matched one
+                if row is None and not RETURNING_ALL and cursor.rowcount:
+                    row = conn.execute("SELECT * FROM contacts WHERE id = ?", (contact_id,)).fetchone()
+                if row is None:
+                    return {"error": f"Contact not found: {contact_id}"}
+                conn.commit()
 
             result = self._row_to_dict(row)
             logger.info("Noted interaction with: %s", result["name"])
@@ -207,25 +290,25 @@ class Contacts:
             logger.error("Failed to note interaction for %s: %s", contact_id, e)
             return {"error": f"Update failure: {e}"}
 
-    async def get_neglected(self, days_threshold: int) -> list[dict]:
+    @run_in_thread
+    def get_neglected(self, days_threshold: int) -> list[dict]:
         """Return contacts whose last_interaction is older than threshold.
 
         Used by the proactive loop to surface neglected relationships.
         """
         try:
-            cutoff = (datetime.now().date() - timedelta(days=days_threshold)).isoformat()
-
-            conn = self._get_conn()
-            rows = conn.execute(
-                """SELECT * FROM contacts
-                   WHERE last_interaction IS NOT NULL
-                   AND last_interaction < ?
-                   ORDER BY last_interaction ASC""",
-                (cutoff,),
-            ).fetchall()
-            conn.close()
-
-            results = [self._row_to_dict(row) for row in rows]
+            cutoff = epoch_seconds(datetime.now().date() - timedelta(days=days_threshold))
+
+            with self._conn() as conn:
+                # Unparseable dates give NULL here, so they never count as neglected
+                cursor = conn.execute(
+                    f"""SELECT * FROM contacts
+                        WHERE {LAST_INTERACTION_EPOCH} < ?
+                        ORDER BY {LAST_INTERACTION_EPOCH} ASC""",
+                    (cutoff,),
+                )
+                results = [self._row_to_dict(row) for row in cursor]
+
             logger.info("Neglected contacts (>%d days): %d found", days_threshold, len(results))
             return results
 
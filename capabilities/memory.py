@@ -12,8 +12,9 @@ Sources: stated (confidence 1.0), inferred (0.5-0.9)
 
 Actions:
     store(entry) — save a new memory entry
+    store_many(entries) — save several memory entries in one transaction
     get_context() — return formatted context block for LLM injection
-    search(query) — return memory entries relevant to a topic
+    search(query, limit) — return the top memory entries relevant to a topic
     update(id, content) — update an existing memory entry
     deactivate(id) — soft delete (never injected again, retained in storage)
 
@@ -23,55 +24,151 @@ Context window rules (from MEMORY_DESIGN.md):
     Never include: inactive entries, low-confidence observations (< 0.5) older than 60 days
 """
 
+import hashlib
 import logging
 import sqlite3
-import uuid
 from datetime import datetime, timedelta
-
-from storage.schema import MEMORY_SCHEMA
+from itertools import chain
+from operator import itemgetter
+
+from storage.epoch import epoch_seconds
+from storage.ids import new_id
+from storage.pool import ConnectionPool, run_in_thread
+from storage.schema import (
+    JOURNAL_MODE_PRAGMA,
+    LAST_REFERENCED_EPOCH,
+    MEMORY_FTS_SCHEMA,
+    MEMORY_INDEXES,
+    MEMORY_SCHEMA,
+    RETURNING_ALL,
+)
 
 logger = logging.getLogger(__name__)
 
+# Valid categories and sources (mirror the CHECK constraints in MEMORY_SCHEMA)
+CATEGORIES = frozenset({"preference", "fact", "observation", "relationship"})
+SOURCES = frozenset({"stated", "inferred"})
+
+INSERT_MEMORY_SQL = """INSERT INTO memories
+    (id, category, subject, content, confidence, source, contact_id, created_at, last_referenced, active)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+# Max ids per UPDATE ... IN (...) — stays well under SQLITE_MAX_VARIABLE_NUMBER
+UPDATE_BATCH_SIZE = 500
+
+# Default number of entries search() returns — results are injected into prompts
+SEARCH_LIMIT = 50
+
+# Sort key for entries within a context section — insertion order, tie-broken by id
+_ENTRY_ORDER = itemgetter("created_at", "id")
+
+
+def _block_version(block: str) -> str:
+    """Return a short content hash identifying a context block's text."""
+    return hashlib.blake2b(block.encode(), digest_size=4).hexdigest()
+
 
 class Memory:
     """The personal knowledge layer. Makes Chitra feel like it knows you."""
 
+    # Column order of the memories table, so rows convert positionally with SELECT *
+    _COLUMNS = (
+        "id",
+        "category",
+        "subject",
+        "content",
+        "confidence",
+        "source",
+        "contact_id",
+        "created_at",
+        "last_referenced",
+        "active",
+    )
+
     def __init__(self, db_path: str):
         self.db_path = db_path
+        self._pool = ConnectionPool(db_path)
         self._init_db()
 
     def _init_db(self):
-        """Ensure the memories table exists."""
+        """Ensure the memories table, its indexes and the full-text index exist, in WAL mode."""
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.execute(MEMORY_SCHEMA)
-            conn.commit()
-            conn.close()
+            with self._conn(write=True) as conn:
+                if self.db_path != ":memory:":
+                    conn.execute(JOURNAL_MODE_PRAGMA)
+                conn.execute(MEMORY_SCHEMA)
+                for index_sql in MEMORY_INDEXES:
+                    conn.execute(index_sql)
+
+                fts_exists = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE name = 'memories_fts'",
+                ).fetchone()
+                for fts_sql in MEMORY_FTS_SCHEMA:
+                    conn.execute(fts_sql)
+                if not fts_exists:
+                    # Index any entries stored before full-text search existed
+                    conn.execute("INSERT INTO memories_fts(memories_fts) VALUES ('rebuild')")
+                conn.commit()
         except sqlite3.Error as e:
             logger.error("Failed to initialize memory database: %s", e)
 
-    def _get_conn(self) -> sqlite3.Connection:
-        """Return a connection with row factory for dict-like access."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+    def _conn(self, write: bool = False):
+        """Borrow a pooled connection with row factory for dict-like access."""
+        return self._pool.connection(write=write)
+
+    def close(self):
+        """Close pooled database connections. Call on shutdown."""
+        self._pool.close()
+
+    @run_in_thread
+    def checkpoint(self):
+        """Checkpoint the WAL without blocking. Called by the proactive loop when idle."""
+        try:
+            self._pool.checkpoint()
+        except sqlite3.Error as e:
+            logger.warning("Failed to checkpoint memory database: %s", e)
 
     def _row_to_dict(self, row: sqlite3.Row) -> dict:
-        """Convert a sqlite3.Row to a plain dict."""
-        return {
-            "id": row["id"],
-            "category": row["category"],
-            "subject": row["subject"],
-            "content": row["content"],
-            "confidence": row["confidence"],
-            "source": row["source"],
-            "contact_id": row["contact_id"],
-            "created_at": row["created_at"],
-            "last_referenced": row["last_referenced"],
-            "active": bool(row["active"]),
-        }
+        """Convert a sqlite3.Row to a plain dict, matching columns by position."""
+        result = dict(zip(self._COLUMNS, row))
+        result["active"] = bool(result["active"])
+        return result
 
-    async def store(self, entry: dict) -> dict:
+    def _new_entry_params(self, entry: dict) -> tuple:
+        """Validate a new memory entry and build its INSERT parameters, in column order.
+
+        Raises ValueError with a user-facing message on missing or invalid fields.
+        """
+        category = entry.get("category")
+        subject = entry.get("subject")
+        content = entry.get("content")
+
+        if not all([category, subject, content]):
+            raise ValueError("Missing required fields: category, subject, content")
+
+        if category not in CATEGORIES:
+            raise ValueError(f"Invalid category: {category}")
+
+        source = entry.get("source", "stated")
+        if source not in SOURCES:
+            raise ValueError(f"Invalid source: {source}")
+
+        now = datetime.now().isoformat()
+        return (
+            new_id(),
+            category,
+            subject,
+            content,
+            entry.get("confidence", 1.0),
+            source,
+            entry.get("contact_id"),
+            now,
+            now,
+            1,
+        )
+
+    @run_in_thread
+    def store(self, entry: dict) -> dict:
         """Save a new memory entry. ID is auto-generated.
 
         Required fields: category, subject, content
@@ -80,47 +177,64 @@ class Memory:
         Returns the stored entry with generated id and timestamps.
         """
         try:
-            memory_id = str(uuid.uuid4())
-            now = datetime.now().isoformat()
-
-            category = entry.get("category")
-            subject = entry.get("subject")
-            content = entry.get("content")
-
-            if not all([category, subject, content]):
-                return {"error": "Missing required fields: category, subject, content"}
+            params = self._new_entry_params(entry)
+        except ValueError as e:
+            return {"error": str(e)}
 
-            if category not in ("preference", "fact", "observation", "relationship"):
-                return {"error": f"Invalid category: {category}"}
-
-            confidence = entry.get("confidence", 1.0)
-            source = entry.get("source", "stated")
-            contact_id = entry.get("contact_id")
-
-            if source not in ("stated", "inferred"):
-                return {"error": f"Invalid source: {source}"}
-
-            conn = self._get_conn()
-            conn.execute(
-                """INSERT INTO memories
-                   (id, category, subject, content, confidence, source, contact_id, created_at, last_referenced, active)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 1)""",
-                (memory_id, category, subject, content, confidence, source, contact_id, now, now),
-            )
-            conn.commit()
-
-            row = conn.execute("SELECT * FROM memories WHERE id = ?", (memory_id,)).fetchone()
-            conn.close()
+        try:
+            with self._conn(write=True) as conn:
+                row = conn.execute(INSERT_MEMORY_SQL + RETURNING_ALL, params).fetchone()
+                if row is None:
+                    row = conn.execute("SELECT * FROM memories WHERE id = ?", (params[0],)).fetchone()
+                conn.commit()
 
             result = self._row_to_dict(row)
-            logger.info("Stored memory: [%s] %s", category, subject)
+            logger.info("Stored memory: [%s] %s", result["category"], result["subject"])
             return result
 
         except sqlite3.Error as e:
             logger.error("Failed to store memory: %s", e)
             return {"error": f"Storage failure: {e}"}
 
-    async def get_context(self) -> dict:
+    @run_in_thread
+    def store_many(self, entries: list[dict]) -> list[dict]:
+        """Save several memory entries in a single transaction.
+
+        Each entry is validated as in store(). Returns one result per input, in
+        order: the stored entry, or {"error": ...} for an entry that failed validation.
+        """
+        results = []
+        params_list = []
+        for entry in entries:
+            try:
+                params = self._new_entry_params(entry)
+            except ValueError as e:
+                results.append({"error": str(e)})
+                continue
+            params_list.append(params)
+            results.append(params)
+
+        try:
+            with self._conn(write=True) as conn:
+                # Insert row by row so each result is the stored row, exactly as create() returns it
+                rows = {}
+                for params in params_list:
+                    row = conn.execute(INSERT_MEMORY_SQL + RETURNING_ALL, params).fetchone()
+                    if row is None:
+                        row = conn.execute("SELECT * FROM memories WHERE id = ?", (params[0],)).fetchone()
+                    rows[params[0]] = row
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.error("Failed to store memories: %s", e)
+            # Entries that failed validation keep their own error; only the
+            # ones written in the rolled-back transaction report the failure
+            return [r if isinstance(r, dict) else {"error": f"Storage failure: {e}"} for r in results]
+
+        logger.info("Stored %d memories", len(params_list))
+        return [r if isinstance(r, dict) else self._row_to_dict(rows[r[0]]) for r in results]
+
+    @run_in_thread
+    def get_context(self) -> dict:
         """Return all relevant memory formatted as a context block for LLM injection.
 
         Applies context window rules from MEMORY_DESIGN.md:
@@ -129,135 +243,156 @@ class Memory:
         - Include: observations with confidence >= 0.5
         - Never include: inactive entries, low-confidence observations (< 0.5) older than 60 days
 
+        The block is deterministic — entries within each section are ordered by
+        (created_at, id) — so an unchanged memory yields byte-identical text and
+        the LLM prompt prefix stays cacheable across calls. It is also returned in
+        two parts: static_block (preferences, facts, relationships — rarely
+        change) and dynamic_block (observations), so callers can place the static
+        part early in the prompt and let only the dynamic tail vary.
+
         Returns:
-            {"context_block": str} — structured natural language, not raw JSON
+            {"context_block": str, "static_block": str, "dynamic_block": str,
+             "version": str} — structured natural language, not raw JSON, plus a
+            short hash of context_block that changes only when its text does
 
         """
         try:
-            conn = self._get_conn()
             now = datetime.now()
-            thirty_days_ago = (now - timedelta(days=30)).isoformat()
-            sixty_days_ago = (now - timedelta(days=60)).isoformat()
-
-            # Fetch all active entries
-            rows = conn.execute(
-                "SELECT * FROM memories WHERE active = 1 ORDER BY category, created_at",
-            ).fetchall()
-
-            # Apply context window rules — only include entries that pass filters
-            preferences = []
-            facts = []
-            relationships = []
-            observations = []
-            included_ids = []
-
-            for row in rows:
-                entry = self._row_to_dict(row)
-                category = entry["category"]
-                confidence = entry["confidence"]
-                last_ref = entry["last_referenced"]
-
-                if category == "preference":
-                    # Always include all preferences
-                    preferences.append(entry)
-                    included_ids.append(entry["id"])
-
-                elif category == "fact":
-                    # Include facts with confidence >= 0.8
-                    if confidence >= 0.8:
-                        facts.append(entry)
-                        included_ids.append(entry["id"])
-
-                elif category == "relationship":
-                    # Include relationships referenced within 30 days
-                    if last_ref >= thirty_days_ago:
-                        relationships.append(entry)
-                        included_ids.append(entry["id"])
-
-                elif category == "observation":
-                    # Skip low-confidence observations older than 60 days
-                    if confidence < 0.5 and entry["created_at"] < sixty_days_ago:
-                        continue
-                    # Include observations with confidence >= 0.5
-                    if confidence >= 0.5:
-                        observations.append(entry)
-                        included_ids.append(entry["id"])
-
-            # Update last_referenced ONLY for entries actually included
-            # This ensures aging/recency rules work correctly — entries not
-            # included will naturally age out over time
-            if included_ids:
-                placeholders = ",".join("?" for _ in included_ids)
-                conn.execute(
-                    f"UPDATE memories SET last_referenced = ? WHERE id IN ({placeholders})",
-                    [now.isoformat(), *included_ids],
+            thirty_days_ago = epoch_seconds(now - timedelta(days=30))
+
+            with self._conn(write=True) as conn:
+                # One transaction for the read and the last_referenced write-back
+                conn.execute("BEGIN IMMEDIATE")
+
+                # Apply context window rules in the query — only entries that pass
+                # the filters are fetched. Observations need confidence >= 0.5, which
+                # also drops low-confidence observations older than 60 days. No ORDER
+                # BY — rows are bucketed by category and each bucket sorted below.
+                cursor = conn.execute(
+                    f"""SELECT * FROM memories
+                       WHERE active = 1
+                       AND (
+                           category = 'preference'
+                           OR (category = 'fact' AND confidence >= 0.8)
+                           OR (category = 'relationship' AND {LAST_REFERENCED_EPOCH} >= ?)
+                           OR (category = 'observation' AND confidence >= 0.5)
+                       )""",
+                    (thirty_days_ago,),
                 )
+
+                buckets = {category: [] for category in CATEGORIES}
+                included_ids = []
+                for row in cursor:
+                    buckets[row["category"]].append(self._row_to_dict(row))
+                    included_ids.append(row["id"])
+
+                # Update last_referenced ONLY for entries actually included
+                # This ensures aging/recency rules work correctly — entries not
+                # included will naturally age out over time
+                referenced_at = now.isoformat()
+                for i in range(0, len(included_ids), UPDATE_BATCH_SIZE):
+                    batch = included_ids[i:i + UPDATE_BATCH_SIZE]
+                    placeholders = ",".join("?" * len(batch))
+                    conn.execute(
+                        f"UPDATE memories SET last_referenced = ? WHERE id IN ({placeholders})",
+                        [referenced_at, *batch],
+                    )
                 conn.commit()
 
-            conn.close()
+            # Stable order regardless of the query plan's row order
+            for bucket in buckets.values():
+                bucket.sort(key=_ENTRY_ORDER)
 
-            # Build the context block as structured natural language
-            context_block = self._format_context_block(
-                preferences, facts, relationships, observations,
+            # Build the context blocks as structured natural language
+            static_block = self._format_static_block(
+                buckets["preference"],
+                buckets["fact"],
+                buckets["relationship"],
             )
-
-            return {"context_block": context_block}
+            dynamic_block = self._format_dynamic_block(buckets["observation"])
+            return self._context_result(static_block, dynamic_block)
 
         except sqlite3.Error as e:
             logger.error("Failed to assemble memory context: %s", e)
-            return {"context_block": ""}
+            return self._context_result("", "")
+
+    @staticmethod
+    def _context_result(static_block: str, dynamic_block: str) -> dict:
+        """Combine the static and dynamic blocks into the get_context result."""
+        context_block = "\n\n".join(block for block in (static_block, dynamic_block) if block)
+        return {
+            "context_block": context_block,
+            "static_block": static_block,
+            "dynamic_block": dynamic_block,
+            "version": _block_version(context_block),
+        }
 
-    def _format_context_block(
+    def _format_static_block(
         self,
         preferences: list[dict],
         facts: list[dict],
         relationships: list[dict],
-        observations: list[dict],
     ) -> str:
-        """Format memory entries into a natural language context block.
+        """Format the slow-changing memory entries as natural language.
 
         This is what the LLM reads as background knowledge about the user.
         """
         sections = []
 
         if preferences or facts:
-            lines = ["About the user:"]
-            lines.extend(f"- {entry['content']}" for entry in facts)
-            lines.extend(f"- {entry['content']}" for entry in preferences)
-            sections.append("\n".join(lines))
+            sections.append(self._format_section("About the user:", facts, preferences))
 
         if relationships:
-            lines = ["People:"]
-            for entry in relationships:
-                lines.append(f"- {entry['content']}")
-            sections.append("\n".join(lines))
-
-        if observations:
-            lines = ["Current patterns:"]
-            for entry in observations:
-                lines.append(f"- {entry['content']}")
-            sections.append("\n".join(lines))
+            sections.append(self._format_section("People:", relationships))
 
         return "\n\n".join(sections)
 
-    async def search(self, query: str) -> list[dict]:
-        """Return memory entries relevant to a topic or subject.
-
-        Searches both subject and content fields for the query string.
-        Only returns active entries.
+    def _format_dynamic_block(self, observations: list[dict]) -> str:
+        """Format observed patterns, which change as Chitra keeps learning."""
+        if not observations:
+            return ""
+        return self._format_section("Current patterns:", observations)
+
+    @staticmethod
+    def _format_section(header: str, *groups: list[dict]) -> str:
+        """Join a section header and a bullet per entry in a single str.join."""
+        return "\n".join(chain((header,), ("- " + entry["content"] for group in groups for entry in group)))
+
+    @run_in_thread
+    def search(self, query: str, limit: int = SEARCH_LIMIT) -> list[dict]:
+        """Return the top memory entries relevant to a topic or subject.
+
+        Matches the query as a phrase against subject and content through the
+        full-text index; the last word matches as a prefix ("cof" finds "coffee").
+        Falls back to a substring scan if the full-text query cannot be run.
+        Only returns active entries — at most limit of them, highest confidence
+        first, then best full-text rank, then newest.
         """
         try:
-            conn = self._get_conn()
-            rows = conn.execute(
-                """SELECT * FROM memories
-                   WHERE active = 1
-                   AND (subject LIKE ? OR content LIKE ?)
-                   ORDER BY confidence DESC, created_at DESC""",
-                (f"%{query}%", f"%{query}%"),
-            ).fetchall()
-            conn.close()
-
-            results = [self._row_to_dict(row) for row in rows]
+            with self._conn() as conn:
+                try:
+                    cursor = conn.execute(
+                        """SELECT m.* FROM memories_fts f
+                           JOIN memories m ON m.rowid = f.rowid
+                           WHERE memories_fts MATCH ?
+                           AND m.active = 1
+                           ORDER BY m.confidence DESC, f.rank, m.created_at DESC
+                           LIMIT ?""",
+                        (self._fts_query(query), limit),
+                    )
+                    results = [self._row_to_dict(row) for row in cursor]
+                except sqlite3.OperationalError as e:
+                    logger.warning("Full-text search failed for '%s', using LIKE: %s", query, e)
+                    cursor = conn.execute(
+                        """SELECT * FROM memories
+                           WHERE active = 1
+                           AND (subject LIKE ? OR content LIKE ?)
+                           ORDER BY confidence DESC, created_at DESC
+                           LIMIT ?""",
+                        (f"%{query}%", f"%{query}%", limit),
+                    )
+                    results = [self._row_to_dict(row) for row in cursor]
+
             logger.info("Memory search '%s': %d results", query, len(results))
             return results
 
@@ -265,25 +400,35 @@ class Memory:
             logger.error("Memory search failed: %s", e)
             return []
 
-    async def update(self, memory_id: str, content: str) -> dict:
+    def _fts_query(self, query: str) -> str:
+        """Quote user text as a single FTS5 phrase with a prefix match on the last token."""
+        escaped = query.replace('"', '""')
+        return f'"{escaped}"*'
+
+    @run_in_thread
+    def update(self, memory_id: str, content: str) -> dict:
         """Update an existing memory entry's content.
 
         Also updates last_referenced timestamp. If this is a user correction
         of an inferred memory, the caller should update confidence and source
-        separately via a follow-up store or direct update.
+        separately via a follow-up store or direct update. Deactivated entries
+        are reported as not found.
         """
         try:
-            conn = self._get_conn()
             now = datetime.now().isoformat()
 
-            conn.execute(
-                "UPDATE memories SET content = ?, last_referenced = ? WHERE id = ? AND active = 1",
-                (content, now, memory_id),
-            )
-            conn.commit()
-
-            row = conn.execute("SELECT * FROM memories WHERE id = ?", (memory_id,)).fetchone()
-            conn.close()
+            with self._conn(write=True) as conn:
+                cursor = conn.execute(
+                    "UPDATE memories SET content = ?, last_referenced = ? WHERE id = ? AND active = 1"
+                    + RETURNING_ALL,
+                    (content, now, memory_id),
+                )
+                row = cursor.fetchone()
+                if row is None and not RETURNING_ALL and cursor.rowcount:
+                    row = conn.execute(
+                        "SELECT * FROM memories WHERE id = ? AND active = 1", (memory_id,),
+                    ).fetchone()
+                conn.commit()
 
             if row is None:
                 return {"error": f"Memory not found: {memory_id}"}
@@ -296,22 +441,18 @@ class Memory:
             logger.error("Failed to update memory %s: %s", memory_id, e)
             return {"error": f"Update failure: {e}"}
 
-    async def deactivate(self, memory_id: str) -> dict:
+    @run_in_thread
+    def deactivate(self, memory_id: str) -> dict:
         """Soft delete — sets active to false. Never injected into context again.
 
         The entry is retained in storage but excluded from get_context() and search().
         """
         try:
-            conn = self._get_conn()
-            row = conn.execute("SELECT * FROM memories WHERE id = ?", (memory_id,)).fetchone()
-
-            if row is None:
-                conn.close()
-                return {"error": f"Memory not found: {memory_id}"}
-
-            conn.execute("UPDATE memories SET active = 0 WHERE id = ?", (memory_id,))
-            conn.commit()
-            conn.close()
+            with self._conn(write=True) as conn:
+                cursor = conn.execute("UPDATE memories SET active = 0 WHERE id = ?", (memory_id,))
+                if cursor.rowcount == 0:
+                    return {"error": f"Memory not found: {memory_id}"}
+                conn.commit()
 
             logger.info("Deactivated memory: %s", memory_id)
             return {"status": "deactivated"}
@@ -8,6 +8,7 @@ and surfaces it conversationally.
 
 Actions:
     create(reminder) — create a new reminder
+    create_many(reminders) — create several reminders in one transaction
     get_fired() — reminders whose trigger_at has passed and status is pending
     dismiss(id) — mark a reminder as dismissed
     list_upcoming(hours_ahead) — pending reminders due within N hours
@@ -16,108 +17,179 @@ Actions:
 
 import logging
 import sqlite3
-import uuid
 from datetime import datetime, timedelta
 
-from storage.schema import REMINDERS_SCHEMA
+from storage.epoch import epoch_seconds, to_local_naive
+from storage.ids import new_id
+from storage.pool import ConnectionPool, run_in_thread
+from storage.schema import (
+    JOURNAL_MODE_PRAGMA,
+    REMINDERS_INDEXES,
+    REMINDERS_SCHEMA,
+    RETURNING_ALL,
+    TRIGGER_AT_EPOCH,
+)
 
 logger = logging.getLogger(__name__)
 
+INSERT_REMINDER_SQL = """INSERT INTO reminders
+    (id, text, trigger_at, repeat, status, contact_id)
+    VALUES (?, ?, ?, ?, ?, ?)"""
+
+# Hot-path queries, built once so each call reuses the same SQL string and
+# hits the connection's prepared statement cache without re-formatting
+GET_FIRED_SQL = f"""SELECT * FROM reminders
+    WHERE status = 'pending'
+    AND {TRIGGER_AT_EPOCH} <= ?
+    ORDER BY {TRIGGER_AT_EPOCH} ASC"""
+
+LIST_UPCOMING_SQL = f"""SELECT * FROM reminders
+    WHERE status = 'pending'
+    AND {TRIGGER_AT_EPOCH} BETWEEN ? AND ?
+    ORDER BY {TRIGGER_AT_EPOCH} ASC"""
+
 
 class Reminders:
     """Manages time-based reminders and alarms."""
 
+    # Column order of the reminders table, so rows convert positionally with SELECT *
+    _COLUMNS = ("id", "text", "trigger_at", "repeat", "status", "contact_id")
+
     def __init__(self, db_path: str):
         self.db_path = db_path
+        self._pool = ConnectionPool(db_path)
         self._init_db()
 
     def _init_db(self):
-        """Ensure the reminders table exists."""
+        """Ensure the reminders table and its indexes exist and the database is in WAL mode."""
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.execute(REMINDERS_SCHEMA)
-            conn.commit()
-            conn.close()
+            with self._conn(write=True) as conn:
+                if self.db_path != ":memory:":
+                    conn.execute(JOURNAL_MODE_PRAGMA)
+                conn.execute(REMINDERS_SCHEMA)
+                for index_sql in REMINDERS_INDEXES:
+                    conn.execute(index_sql)
+                conn.commit()
         except sqlite3.Error as e:
             logger.error("Failed to initialize reminders database: %s", e)
 
-    def _get_conn(self) -> sqlite3.Connection:
-        """Return a connection with row factory for dict-like access."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+    def _conn(self, write: bool = False):
+        """Borrow a pooled connection with row factory for dict-like access."""
+        return self._pool.connection(write=write)
+
+    def close(self):
+        """Close pooled database connections. Call on shutdown."""
+        self._pool.close()
+
+    @run_in_thread
+    def checkpoint(self):
+        """Checkpoint the WAL without blocking. Called by the proactive loop when idle."""
+        try:
+            self._pool.checkpoint()
+        except sqlite3.Error as e:
+            logger.warning("Failed to checkpoint reminders database: %s", e)
 
     def _row_to_dict(self, row: sqlite3.Row) -> dict:
-        """Convert a sqlite3.Row to a plain dict."""
-        return {
-            "id": row["id"],
-            "text": row["text"],
-            "trigger_at": row["trigger_at"],
-            "repeat": row["repeat"],
-            "status": row["status"],
-            "contact_id": row["contact_id"],
-        }
-
-    async def create(self, reminder: dict) -> dict:
+        """Convert a sqlite3.Row to a plain dict, matching columns by position."""
+        return dict(zip(self._COLUMNS, row))
+
+    def _new_reminder_params(self, reminder: dict) -> tuple:
+        """Validate a new reminder and build its INSERT parameters, in column order.
+
+        Raises ValueError with a user-facing message when text or trigger_at is missing.
+        """
+        text = reminder.get("text")
+        trigger_at = reminder.get("trigger_at")
+
+        if not all([text, trigger_at]):
+            raise ValueError("Missing required fields: text, trigger_at")
+
+        return (
+            new_id(),
+            text,
+            to_local_naive(trigger_at),
+            reminder.get("repeat"),
+            "pending",
+            reminder.get("contact_id"),
+        )
+
+    @run_in_thread
+    def create(self, reminder: dict) -> dict:
         """Create a new reminder. ID is auto-generated.
 
         Required fields: text, trigger_at (ISO datetime string)
         Optional fields: repeat, contact_id
         """
         try:
-            text = reminder.get("text")
-            trigger_at = reminder.get("trigger_at")
-
-            if not all([text, trigger_at]):
-                return {"error": "Missing required fields: text, trigger_at"}
-
-            reminder_id = str(uuid.uuid4())
-
-            conn = self._get_conn()
-            conn.execute(
-                """INSERT INTO reminders
-                   (id, text, trigger_at, repeat, status, contact_id)
-                   VALUES (?, ?, ?, ?, 'pending', ?)""",
-                (
-                    reminder_id,
-                    text,
-                    trigger_at,
-                    reminder.get("repeat"),
-                    reminder.get("contact_id"),
-                ),
-            )
-            conn.commit()
-
-            row = conn.execute("SELECT * FROM reminders WHERE id = ?", (reminder_id,)).fetchone()
-            conn.close()
+            params = self._new_reminder_params(reminder)
+        except ValueError as e:
+            return {"error": str(e)}
+
+        try:
+            with self._conn(write=True) as conn:
+                row = conn.execute(INSERT_REMINDER_SQL + RETURNING_ALL, params).fetchone()
+                if row is None:
+                    row = conn.execute("SELECT * FROM reminders WHERE id = ?", (params[0],)).fetchone()
+                conn.commit()
 
             result = self._row_to_dict(row)
-            logger.info("Created reminder: %s at %s", text, trigger_at)
+            logger.info("Created reminder: %s at %s", result["text"], result["trigger_at"])
             return result
 
         except sqlite3.Error as e:
             logger.error("Failed to create reminder: %s", e)
             return {"error": f"Storage failure: {e}"}
 
-    async def get_fired(self) -> list[dict]:
+    @run_in_thread
+    def create_many(self, reminders: list[dict]) -> list[dict]:
+        """Create several reminders in a single transaction.
+
+        Each reminder is validated as in create(). Returns one result per input, in
+        order: the created reminder, or {"error": ...} for an entry that failed validation.
+        """
+        results = []
+        params_list = []
+        for reminder in reminders:
+            try:
+                params = self._new_reminder_params(reminder)
+            except ValueError as e:
+                results.append({"error": str(e)})
+                continue
+            params_list.append(params)
+            results.append(params)
+
+        try:
+            with self._conn(write=True) as conn:
+                # Insert row by row so each result is the stored row, exactly as create() returns it
+                rows = {}
+                for params in params_list:
+                    row = conn.execute(INSERT_REMINDER_SQL + RETURNING_ALL, params).fetchone()
+                    if row is None:
+                        row = conn.execute("SELECT * FROM reminders WHERE id = ?", (params[0],)).fetchone()
+                    rows[params[0]] = row
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.error("Failed to create reminders: %s", e)
+            # Entries that failed validation keep their own error; only the
+            # ones written in the rolled-back transaction report the failure
+            return [r if isinstance(r, dict) else {"error": f"Storage failure: {e}"} for r in results]
+
+        logger.info("Created %d reminders", len(params_list))
+        return [r if isinstance(r, dict) else self._row_to_dict(rows[r[0]]) for r in results]
+
+    @run_in_thread
+    def get_fired(self) -> list[dict]:
         """Return reminders whose trigger_at has passed and status is pending.
 
         Called by the proactive loop on every tick.
         """
         try:
-            now = datetime.now().isoformat()
-
-            conn = self._get_conn()
-            rows = conn.execute(
-                """SELECT * FROM reminders
-                   WHERE status = 'pending'
-                   AND trigger_at <= ?
-                   ORDER BY trigger_at ASC""",
-                (now,),
-            ).fetchall()
-            conn.close()
-
-            results = [self._row_to_dict(row) for row in rows]
+            now = epoch_seconds(datetime.now())
+
+            with self._conn() as conn:
+                cursor = conn.execute(GET_FIRED_SQL, (now,))
+                results = [self._row_to_dict(row) for row in cursor]
+
             if results:
                 logger.info("Fired reminders: %d", len(results))
             return results
@@ -126,24 +198,22 @@ class Reminders:
             logger.error("Failed to get fired reminders: %s", e)
             return []
 
-    async def dismiss(self, reminder_id: str) -> dict:
+    @run_in_thread
+    def dismiss(self, reminder_id: str) -> dict:
         """Mark a reminder as dismissed after it has been surfaced to the user."""
         try:
-            conn = self._get_conn()
-
-            row = conn.execute("SELECT * FROM reminders WHERE id = ?", (reminder_id,)).fetchone()
-            if row is None:
-                conn.close()
-                return {"error": f"Reminder not found: {reminder_id}"}
-
-            conn.execute(
-                "UPDATE reminders SET status = 'dismissed' WHERE id = ?",
-                (reminder_id,),
-            )
-            conn.commit()
-
-            row = conn.execute("SELECT * FROM reminders WHERE id = ?", (reminder_id,)).fetchone()
-            conn.close()
+            with self._conn(write=True) as conn:
+                cursor = conn.execute(
+                    "UPDATE reminders SET status = 'dismissed' WHERE id = ?" + RETURNING_ALL,
+                    (reminder_id,),
+                )
+                row = cursor.fetchone()
+                # Without RETURNING, read the row back only if the UPDATE matched one
+                if row is None and not RETURNING_ALL and cursor.rowcount:
+                    row = conn.execute("SELECT * FROM reminders WHERE id = ?", (reminder_id,)).fetchone()
+                if row is None:
+                    return {"error": f"Reminder not found: {reminder_id}"}
+                conn.commit()
 
             result = self._row_to_dict(row)
             logger.info("Dismissed reminder: %s", reminder_id)
@@ -153,42 +223,30 @@ class Reminders:
             logger.error("Failed to dismiss reminder %s: %s", reminder_id, e)
             return {"error": f"Dismiss failure: {e}"}
 
-    async def list_upcoming(self, hours_ahead: int) -> list[dict]:
+    @run_in_thread
+    def list_upcoming(self, hours_ahead: int) -> list[dict]:
         """Return pending reminders due within N hours."""
         try:
             now = datetime.now()
-            cutoff = (now + timedelta(hours=hours_ahead)).isoformat()
+            cutoff = now + timedelta(hours=hours_ahead)
 
-            conn = self._get_conn()
-            rows = conn.execute(
-                """SELECT * FROM reminders
-                   WHERE status = 'pending'
-                   AND trigger_at >= ?
-                   AND trigger_at <= ?
-                   ORDER BY trigger_at ASC""",
-                (now.isoformat(), cutoff),
-            ).fetchall()
-            conn.close()
-
-            return [self._row_to_dict(row) for row in rows]
+            with self._conn() as conn:
+                cursor = conn.execute(LIST_UPCOMING_SQL, (epoch_seconds(now), epoch_seconds(cutoff)))
+                return [self._row_to_dict(row) for row in cursor]
 
         except sqlite3.Error as e:
             logger.error("Failed to list upcoming reminders: %s", e)
             return []
 
-    async def delete(self, reminder_id: str) -> dict:
+    @run_in_thread
+    def delete(self, reminder_id: str) -> dict:
         """Delete a reminder permanently."""
         try:
-            conn = self._get_conn()
-
-            row = conn.execute("SELECT * FROM reminders WHERE id = ?", (reminder_id,)).fetchone()
-            if row is None:
-                conn.close()
-                return {"error": f"Reminder not found: {reminder_id}"}
-
-            conn.execute("DELETE FROM reminders WHERE id = ?", (reminder_id,))
-            conn.commit()
-            conn.close()
+            with self._conn(write=True) as conn:
+                cursor = conn.execute("DELETE FROM reminders WHERE id = ?", (reminder_id,))
+                if cursor.rowcount == 0:
+                    return {"error": f"Reminder not found: {reminder_id}"}
+                conn.commit()
 
             logger.info("Deleted reminder: %s", reminder_id)
             return {"status": "deleted"}
@@ -4,7 +4,9 @@ System State capability.
 Always-available device and environment context.
 Injected into every LLM call alongside Memory.
 
-No database — reads live system state on every call.
+No database — reads live system state on every call. The clock is read
+fresh each time; battery level is cached for BATTERY_TTL_SECONDS, since it
+changes slowly and reading it may spawn a subprocess (pmset on macOS).
 Uses only standard library and cross-platform interfaces (Linux + macOS).
 
 Actions:
@@ -12,16 +14,41 @@ Actions:
 """
 
 import logging
+import os
 import shutil
 import subprocess
+import time
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# How long a battery reading is reused before the platform is queried again
+BATTERY_TTL_SECONDS = 60
+
+LINUX_BATTERY_CAPACITY = "/sys/class/power_supply/BAT0/capacity"
+
 
 class SystemState:
     """Provides current device and environment context."""
 
+    def __init__(self):
+        self._battery_percent = -1
+        self._battery_read_at = None
+        # Resolved once — a PATH search per battery read is wasted work
+        self._pmset_path = shutil.which("pmset")
+        # sysfs regenerates the value on every read from offset 0, so the
+        # file stays open and each reading is a single pread
+        try:
+            self._battery_fd = os.open(LINUX_BATTERY_CAPACITY, os.O_RDONLY)
+        except OSError:
+            self._battery_fd = None
+
+    def close(self):
+        """Close the battery capacity file. Call on shutdown."""
+        if self._battery_fd is not None:
+            os.close(self._battery_fd)
+            self._battery_fd = None
+
     async def get(self) -> dict:
         """Return current system state snapshot.
 
@@ -50,7 +77,7 @@ class SystemState:
             return {
                 "datetime": now.isoformat(),
                 "day_of_week": now.strftime("%A"),
-                "battery_percent": self._get_battery_percent(),
+                "battery_percent": self._cached_battery_percent(),
                 "time_of_day": time_of_day,
             }
 
@@ -63,23 +90,31 @@ class SystemState:
                 "time_of_day": "unknown",
             }
 
+    def _cached_battery_percent(self) -> int:
+        """Return the battery percentage, re-reading it at most every BATTERY_TTL_SECONDS."""
+        now = time.monotonic()
+        if self._battery_read_at is None or now - self._battery_read_at >= BATTERY_TTL_SECONDS:
+            self._battery_percent = self._get_battery_percent()
+            self._battery_read_at = now
+        return self._battery_percent
+
     def _get_battery_percent(self) -> int:
         """Read battery percentage. Cross-platform: Linux and macOS.
 
         Returns -1 if battery info is unavailable (e.g. desktop without battery).
         """
         # Linux — read from /sys
-        try:
-            with open("/sys/class/power_supply/BAT0/capacity", "r") as f:
-                return int(f.read().strip())
-        except (FileNotFoundError, ValueError, PermissionError):
-            pass
+        if self._battery_fd is not None:
+            try:
+                return int(os.pread(self._battery_fd, 8, 0).strip())
+            except (OSError, ValueError):
+                pass
 
         # macOS — use pmset
-        if shutil.which("pmset"):
+        if self._pmset_path:
             try:
                 result = subprocess.run(
-                    ["pmset", "-g", "batt"],
+                    [self._pmset_path, "-g", "batt"],
                     capture_output=True,
                     text=True,
                     timeout=5,
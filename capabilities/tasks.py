@@ -8,6 +8,7 @@ when the user has free time or when tasks are overdue.
 
 Actions:
     create(task) — create a new task
+    create_many(tasks) — create several tasks in one transaction
     list(status) — return tasks filtered by status
     complete(id) — mark a task as done
     get_overdue() — pending tasks past their due date
@@ -16,134 +17,212 @@ Actions:
 
 import logging
 import sqlite3
-import uuid
 from datetime import datetime
 
-from storage.schema import TASKS_SCHEMA
+from storage.epoch import to_local_naive, today_range
+from storage.ids import new_id
+from storage.pool import ConnectionPool, run_in_thread
+from storage.schema import (
+    DUE_DATE_EPOCH,
+    JOURNAL_MODE_PRAGMA,
+    RETURNING_ALL,
+    TASKS_INDEXES,
+    TASKS_SCHEMA,
+)
 
 logger = logging.getLogger(__name__)
 
+INSERT_TASK_SQL = """INSERT INTO tasks
+    (id, title, notes, due_date, status, priority, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)"""
+
+# Hot-path queries, built once so each call reuses the same SQL string and
+# hits the connection's prepared statement cache without re-formatting
+LIST_ALL_SQL = "SELECT * FROM tasks ORDER BY priority DESC, created_at DESC"
+
+LIST_BY_STATUS_SQL = "SELECT * FROM tasks WHERE status = ? ORDER BY priority DESC, created_at DESC"
+
+# Missing or unparseable due dates give NULL and are never overdue
+GET_OVERDUE_SQL = f"""SELECT * FROM tasks
+    WHERE status = 'pending'
+    AND {DUE_DATE_EPOCH} < ?
+    ORDER BY {DUE_DATE_EPOCH} ASC"""
+
+GET_DUE_TODAY_SQL = f"""SELECT * FROM tasks
+    WHERE status = 'pending'
+    AND {DUE_DATE_EPOCH} >= ?
+    AND {DUE_DATE_EPOCH} < ?
+    ORDER BY priority DESC"""
+
+# Valid priorities (mirror the CHECK constraint in TASKS_SCHEMA)
+PRIORITIES = frozenset({"high", "normal", "low"})
+
 
 class Tasks:
     """Manages the local task store."""
 
+    # Column order of the tasks table, so rows convert positionally with SELECT *
+    _COLUMNS = ("id", "title", "notes", "due_date", "status", "priority", "created_at")
+
     def __init__(self, db_path: str):
         self.db_path = db_path
+        self._pool = ConnectionPool(db_path)
         self._init_db()
 
     def _init_db(self):
-        """Ensure the tasks table exists."""
+        """Ensure the tasks table and its indexes exist and the database is in WAL mode."""
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.execute(TASKS_SCHEMA)
-            conn.commit()
-            conn.close()
+            with self._conn(write=True) as conn:
+                if self.db_path != ":memory:":
+                    conn.execute(JOURNAL_MODE_PRAGMA)
+                conn.execute(TASKS_SCHEMA)
+                for index_sql in TASKS_INDEXES:
+                    conn.execute(index_sql)
+                conn.commit()
         except sqlite3.Error as e:
             logger.error("Failed to initialize tasks database: %s", e)
 
-    def _get_conn(self) -> sqlite3.Connection:
-        """Return a connection with row factory for dict-like access."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+    def _conn(self, write: bool = False):
+        """Borrow a pooled connection with row factory for dict-like access."""
+        return self._pool.connection(write=write)
+
+    def close(self):
+        """Close pooled database connections. Call on shutdown."""
+        self._pool.close()
+
+    @run_in_thread
+    def checkpoint(self):
+        """Checkpoint the WAL without blocking. Called by the proactive loop when idle."""
+        try:
+            self._pool.checkpoint()
+        except sqlite3.Error as e:
+            logger.warning("Failed to checkpoint tasks database: %s", e)
 
     def _row_to_dict(self, row: sqlite3.Row) -> dict:
-        """Convert a sqlite3.Row to a plain dict."""
-        return {
-            "id": row["id"],
-            "title": row["title"],
-            "notes": row["notes"],
-            "due_date": row["due_date"],
-            "status": row["status"],
-            "priority": row["priority"],
-            "created_at": row["created_at"],
-        }
-
-    async def create(self, task: dict) -> dict:
+        """Convert a sqlite3.Row to a plain dict, matching columns by position."""
+        return dict(zip(self._COLUMNS, row))
+
+    def _new_task_params(self, task: dict) -> tuple:
+        """Validate a new task and build its INSERT parameters, in column order.
+
+        Raises ValueError with a user-facing message for a missing title or an
+        invalid priority.
+        """
+        title = task.get("title")
+        if not title:
+            raise ValueError("Missing required field: title")
+
+        priority = task.get("priority", "normal")
+        if priority not in PRIORITIES:
+            raise ValueError(f"Invalid priority: {priority}")
+
+        return (
+            new_id(),
+            title,
+            task.get("notes", ""),
+            to_local_naive(task.get("due_date")),
+            "pending",
+            priority,
+            datetime.now().isoformat(),
+        )
+
+    @run_in_thread
+    def create(self, task: dict) -> dict:
         """Create a new task. ID is auto-generated.
 
         Required fields: title
         Optional fields: notes, due_date, priority (high/normal/low)
         """
         try:
-            title = task.get("title")
-            if not title:
-                return {"error": "Missing required field: title"}
-
-            task_id = str(uuid.uuid4())
-            now = datetime.now().isoformat()
-            priority = task.get("priority", "normal")
-
-            if priority not in ("high", "normal", "low"):
-                return {"error": f"Invalid priority: {priority}"}
-
-            conn = self._get_conn()
-            conn.execute(
-                """INSERT INTO tasks
-                   (id, title, notes, due_date, status, priority, created_at)
-                   VALUES (?, ?, ?, ?, 'pending', ?, ?)""",
-                (
-                    task_id,
-                    title,
-                    task.get("notes", ""),
-                    task.get("due_date"),
-                    priority,
-                    now,
-                ),
-            )
-            conn.commit()
-
-            row = conn.execute("SELECT * FROM tasks WHERE id = ?", (task_id,)).fetchone()
-            conn.close()
+            params = self._new_task_params(task)
+        except ValueError as e:
+            return {"error": str(e)}
+
+        try:
+            with self._conn(write=True) as conn:
+                row = conn.execute(INSERT_TASK_SQL + RETURNING_ALL, params).fetchone()
+                if row is None:
+                    row = conn.execute("SELECT * FROM tasks WHERE id = ?", (params[0],)).fetchone()
+                conn.commit()
 
             result = self._row_to_dict(row)
-            logger.info("Created task: %s (priority: %s)", title, priority)
+            logger.info("Created task: %s (priority: %s)", result["title"], result["priority"])
             return result
 
         except sqlite3.Error as e:
             logger.error("Failed to create task: %s", e)
             return {"error": f"Storage failure: {e}"}
 
-    async def list(self, status: str = "all") -> list[dict]:
-        """Return tasks filtered by status (pending, done, all)."""
+    @run_in_thread
+    def create_many(self, tasks: list[dict]) -> list[dict]:
+        """Create several tasks in a single transaction.
+
+        Each task is validated as in create(). Returns one result per input, in
+        order: the created task, or {"error": ...} for an entry that failed validation.
+        """
+        results = []
+        params_list = []
+        for task in tasks:
+            try:
+                params = self._new_task_params(task)
+            except ValueError as e:
+                results.append({"error": str(e)})
+                continue
+            params_list.append(params)
+            results.append(params)
+
         try:
-            conn = self._get_conn()
+            with self._conn(write=True) as conn:
+                # Insert row by row so each result is the stored row, exactly as create() returns it
+                rows = {}
+                for params in params_list:
+                    row = conn.execute(INSERT_TASK_SQL + RETURNING_ALL, params).fetchone()
+                    if row is None:
+                        row = conn.execute("SELECT * FROM tasks WHERE id = ?", (params[0],)).fetchone()
+                    rows[params[0]] = row
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.error("Failed to create tasks: %s", e)
+            # Entries that failed validation keep their own error; only the
+            # ones written in the rolled-back transaction report the failure
+            return [r if isinstance(r, dict) else {"error": f"Storage failure: {e}"} for r in results]
+
+        logger.info("Created %d tasks", len(params_list))
+        return [r if isinstance(r, dict) else self._row_to_dict(rows[r[0]]) for r in results]
 
+    @run_in_thread
+    def list(self, status: str = "all") -> list[dict]:
+        """Return tasks filtered by status (pending, done, all)."""
+        try:
             if status == "all":
-                rows = conn.execute(
-                    "SELECT * FROM tasks ORDER BY priority DESC, created_at DESC",
-                ).fetchall()
+                sql, params = LIST_ALL_SQL, ()
             elif status in ("pending", "done"):
-                rows = conn.execute(
-                    "SELECT * FROM tasks WHERE status = ? ORDER BY priority DESC, created_at DESC",
-                    (status,),
-                ).fetchall()
+                sql, params = LIST_BY_STATUS_SQL, (status,)
             else:
-                conn.close()
                 return []
 
-            conn.close()
-            return [self._row_to_dict(row) for row in rows]
+            with self._conn() as conn:
+                return [self._row_to_dict(row) for row in conn.execute(sql, params)]
 
         except sqlite3.Error as e:
             logger.error("Failed to list tasks: %s", e)
             return []
 
-    async def complete(self, task_id: str) -> dict:
+    @run_in_thread
+    def complete(self, task_id: str) -> dict:
         """Mark a task as done."""
         try:
-            conn = self._get_conn()
-
-            row = conn.execute("SELECT * FROM tasks WHERE id = ?", (task_id,)).fetchone()
-            if row is None:
-                conn.close()
-                return {"error": f"Task not found: {task_id}"}
-
-            conn.execute("UPDATE tasks SET status = 'done' WHERE id = ?", (task_id,))
-            conn.commit()
-
-            row = conn.execute("SELECT * FROM tasks WHERE id = ?", (task_id,)).fetchone()
-            conn.close()
+            with self._conn(write=True) as conn:
+                cursor = conn.execute(
+                    "UPDATE tasks SET status = 'done' WHERE id = ?" + RETURNING_ALL, (task_id,),
+                )
+                row = cursor.fetchone()
+                # Without RETURNING, read the row back only if the UPDATE matched one
+                if row is None and not RETURNING_ALL and cursor.rowcount:
+                    row = conn.execute("SELECT * FROM tasks WHERE id = ?", (task_id,)).fetchone()
+                if row is None:
+                    return {"error": f"Task not found: {task_id}"}
+                conn.commit()
 
             result = self._row_to_dict(row)
             logger.info("Completed task: %s", result["title"])
@@ -153,26 +232,19 @@ class Tasks:
             logger.error("Failed to complete task %s: %s", task_id, e)
             return {"error": f"Update failure: {e}"}
 
-    async def get_overdue(self) -> list[dict]:
+    @run_in_thread
+    def get_overdue(self) -> list[dict]:
         """Return pending tasks past their due date.
 
         Used by the proactive loop to surface overdue work.
         """
         try:
-            today = datetime.now().date().isoformat()
-
-            conn = self._get_conn()
-            rows = conn.execute(
-                """SELECT * FROM tasks
-                   WHERE status = 'pending'
-                   AND due_date IS NOT NULL
-                   AND due_date < ?
-                   ORDER BY due_date ASC""",
-                (today,),
-            ).fetchall()
-            conn.close()
-
-            results = [self._row_to_dict(row) for row in rows]
+            today, _ = today_range()
+
+            with self._conn() as conn:
+                cursor = conn.execute(GET_OVERDUE_SQL, (today,))
+                results = [self._row_to_dict(row) for row in cursor]
+
             if results:
                 logger.info("Overdue tasks: %d", len(results))
             return results
@@ -181,22 +253,13 @@ class Tasks:
             logger.error("Failed to get overdue tasks: %s", e)
             return []
 
-    async def get_due_today(self) -> list[dict]:
+    @run_in_thread
+    def get_due_today(self) -> list[dict]:
         """Return pending tasks due today."""
         try:
-            today = datetime.now().date().isoformat()
-
-            conn = self._get_conn()
-            rows = conn.execute(
-                """SELECT * FROM tasks
-                   WHERE status = 'pending'
-                   AND due_date = ?
-                   ORDER BY priority DESC""",
-                (today,),
-            ).fetchall()
-            conn.close()
-
-            return [self._row_to_dict(row) for row in rows]
+            with self._conn() as conn:
+                cursor = conn.execute(GET_DUE_TODAY_SQL, today_range())
+                return [self._row_to_dict(row) for row in cursor]
 
         except sqlite3.Error as e:
             logger.error("Failed to get tasks due today: %s", e)
@@ -16,11 +16,12 @@ Actions:
     speak(text) → {"status": "done"}
     display(user_text, chitra_text) → {"status": "done"}
     set_input_mode(mode) → {"status": "done", "mode": str}
+    warm_up() → {"status": "done"}
 
 Technology:
-    STT: OpenAI Whisper (local)
-    TTS: Piper TTS (local, subprocess)
-    VAD: Silero VAD
+    STT: Whisper via faster-whisper (local, int8 CTranslate2)
+    TTS: Piper TTS (local, one long-lived subprocess)
+    VAD: Silero VAD (ONNX Runtime when installed)
     Audio I/O: sounddevice + numpy
     Display: rich library
 """
@@ -28,10 +29,20 @@ Technology:
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
+import math
 import os
 import platform
+import queue
+import select
+import shutil
 import subprocess
+import tempfile
+import threading
+import wave
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +61,17 @@ except Exception:
     np = None
     logger.warning("sounddevice/numpy not available — voice mode disabled")
 
+# STT: Whisper on CTranslate2 (faster-whisper), quantized to int8 on load
+_HAS_FASTER_WHISPER = False
+try:
+    from faster_whisper import WhisperModel
+
+    _HAS_FASTER_WHISPER = True
+except Exception:
+    WhisperModel = None
+
+# Fallback STT backend: the original FP32 PyTorch Whisper, used only when
+# faster-whisper is absent
 _HAS_WHISPER = False
 try:
     import whisper
@@ -57,7 +79,8 @@ try:
     _HAS_WHISPER = True
 except Exception:
     whisper = None
-    logger.warning("openai-whisper not available — STT disabled")
+    if not _HAS_FASTER_WHISPER:
+        logger.warning("faster-whisper/openai-whisper not available — STT disabled")
 
 _HAS_SILERO_VAD = False
 try:
@@ -68,10 +91,81 @@ except Exception:
     torch = None
     logger.warning("torch not available — VAD disabled")
 
+# Optional ONNX Runtime: when present, Silero VAD runs its bundled ONNX export
+# instead of the TorchScript model
+_HAS_ONNXRUNTIME = False
+try:
+    import onnxruntime  # noqa: F401
+
+    _HAS_ONNXRUNTIME = True
+except Exception:
+    pass
+
+# Optional WebRTC VAD: a cheap gate that keeps Silero from running on the
+# silence before the user starts speaking
+_HAS_WEBRTCVAD = False
+try:
+    import webrtcvad
+
+    _HAS_WEBRTCVAD = True
+except Exception:
+    webrtcvad = None
+
 # Rich is a core dependency — always present
 from rich.console import Console
 from rich.text import Text
 
+# Speaker labels for the conversation display, as (text, style) pairs for Text.assemble
+_USER_LABEL = ("You", "bold cyan")
+_CHITRA_LABEL = ("Chitra", "bold green")
+
+
+@functools.cache
+def _piper_installed(piper_binary: str, piper_model: str, system: str) -> bool:
+    """Check that the Piper binary, its shared libraries and the voice model are present.
+
+    Checks the binary exists and is executable, then verifies the required
+    shared libraries are present in the same directory. The macOS Piper build
+    is missing bundled shared libraries (libespeak-ng, libpiper_phonemize,
+    libonnxruntime) — this catches that without running the binary, which
+    would trigger the macOS crash reporter and hang.
+
+    Cached per (binary, model, platform): the install does not change while
+    Chitra runs, and every VoiceIO would otherwise repeat the same stat calls.
+    """
+    if not os.path.isfile(piper_binary):
+        return False
+    if not os.access(piper_binary, os.X_OK):
+        return False
+
+    tts_dir = os.path.dirname(piper_binary)
+
+    if system == "Darwin":
+        required_libs = [
+            "libespeak-ng.1.dylib",
+            "libpiper_phonemize.1.dylib",
+            "libonnxruntime.1.14.1.dylib",
+        ]
+    elif system == "Linux":
+        required_libs = [
+            "libespeak-ng.so.1",
+            "libpiper_phonemize.so.1",
+            "libonnxruntime.so.1.14.1",
+        ]
+    else:
+        return False
+
+    for lib in required_libs:
+        if not os.path.isfile(os.path.join(tts_dir, lib)):
+            logger.debug("Missing Piper shared library: %s", lib)
+            return False
+
+    if not os.path.isfile(piper_model):
+        logger.debug("Missing Piper voice model: %s", piper_model)
+        return False
+
+    return True
+
 
 class VoiceIO:
     """Handles text/voice input, speech output, and conversational display."""
@@ -82,6 +176,15 @@ class VoiceIO:
     VAD_THRESHOLD = 0.5  # Silero VAD speech probability threshold
     SILENCE_DURATION_MS = 1000  # Silence before end-of-speech detection
     MAX_RECORDING_SECONDS = 30  # Safety cap on recording length
+    PRE_ROLL_MS = 320  # Audio kept from just before VAD first reports speech
+    POST_ROLL_MS = 192  # Audio kept after VAD last reports speech; the rest of the silence is dropped
+    MIN_SPEECH_SECONDS = 0.3  # Shorter recordings are VAD false triggers, not speech
+    MIN_SPEECH_RMS = 0.005  # Quieter recordings are near-silence, not worth transcribing
+    SILENCE_GATE_MODE = 2  # WebRTC VAD aggressiveness, 0 (least) to 3 (most)
+    SILENCE_GATE_FRAME_MS = 30  # WebRTC VAD accepts 10, 20 or 30 ms frames
+    PIPER_TIMEOUT_SECONDS = 30  # Max wait for Piper to synthesize one utterance
+
+    CONVERSATION_LOG_MAX = 1024  # Display log entries kept; older ones are dropped
 
     def __init__(self):
         # Input mode: "text" (default) or "voice"
@@ -90,24 +193,44 @@ class VoiceIO:
         # Rich console for terminal display
         self._console = Console()
 
-        # In-memory conversation log for display
-        self._conversation_log: list[dict] = []
+        # In-memory conversation log for display — the most recent entries only
+        self._conversation_log: deque[dict] = deque(maxlen=self.CONVERSATION_LOG_MAX)
 
         # Whisper model — loaded lazily on first voice listen()
         self._whisper_model = None
         self._whisper_model_name = os.environ.get("CHITRA_WHISPER_MODEL", "base")
+        self._whisper_compute_type = os.environ.get("CHITRA_WHISPER_COMPUTE_TYPE", "int8")
+        self._whisper_backend = None  # "faster-whisper" or "openai-whisper" once loaded
 
         # Silero VAD model — loaded lazily on first voice listen()
         self._vad_model = None
 
+        # WebRTC VAD silence gate — None when webrtcvad is not installed
+        self._silence_gate = webrtcvad.Vad(self.SILENCE_GATE_MODE) if _HAS_WEBRTCVAD else None
+
+        # Whisper is loaded and run on this one thread, so its weights and
+        # buffers stay with a single worker across turns
+        self._stt_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="whisper")
+
+        # Serializes model loading between warm_up() and the first listen()
+        self._model_lock = asyncio.Lock()
+
+        # Background warm-up started by set_input_mode("voice")
+        self._warmup_task: asyncio.Task | None = None
+
         # Piper TTS paths — resolved from CHITRA_DATA_DIR
         data_dir = os.environ.get("CHITRA_DATA_DIR", os.path.expanduser("~/.chitra/data"))
         self._piper_binary = os.path.join(data_dir, "tts", "piper")
         self._piper_model = os.path.join(data_dir, "tts", "en_US-lessac-medium.onnx")
 
+        # Piper process — started on first speech and reused for every utterance
+        self._piper_proc: subprocess.Popen | None = None
+        self._piper_output_dir: str | None = None
+        self._piper_lock = threading.Lock()
+
         # Capability flags
         self._audio_available = _HAS_SOUNDDEVICE
-        self._stt_available = _HAS_WHISPER
+        self._stt_available = _HAS_WHISPER or _HAS_FASTER_WHISPER
         self._vad_available = _HAS_SILERO_VAD
         self._tts_available = self._check_piper_available()
 
@@ -137,48 +260,18 @@ class VoiceIO:
 
     # ── Public actions ──────────────────────────────────────────────
 
+    @property
+    def input_mode(self) -> str:
+        """Current input mode: "text" or "voice"."""
+        return self._input_mode
+
     def _check_piper_available(self) -> bool:
         """Verify Piper binary and its shared libraries are present.
 
-        Checks the binary exists and is executable, then verifies the required
-        shared libraries are present in the same directory. The macOS Piper build
-        is missing bundled shared libraries (libespeak-ng, libpiper_phonemize,
-        libonnxruntime) — this catches that without running the binary, which
-        would trigger the macOS crash reporter and hang.
+        The filesystem checks run once per process for a given install; see
+        _piper_installed.
         """
-        if not os.path.isfile(self._piper_binary):
-            return False
-        if not os.access(self._piper_binary, os.X_OK):
-            return False
-
-        tts_dir = os.path.dirname(self._piper_binary)
-        system = platform.system()
-
-        if system == "Darwin":
-            required_libs = [
-                "libespeak-ng.1.dylib",
-                "libpiper_phonemize.1.dylib",
-                "libonnxruntime.1.14.1.dylib",
-            ]
-        elif system == "Linux":
-            required_libs = [
-                "libespeak-ng.so.1",
-                "libpiper_phonemize.so.1",
-                "libonnxruntime.so.1.14.1",
-            ]
-        else:
-            return False
-
-        for lib in required_libs:
-            if not os.path.isfile(os.path.join(tts_dir, lib)):
-                logger.debug("Missing Piper shared library: %s", lib)
-                return False
-
-        if not os.path.isfile(self._piper_model):
-            logger.debug("Missing Piper voice model: %s", self._piper_model)
-            return False
-
-        return True
+        return _piper_installed(self._piper_binary, self._piper_model, platform.system())
 
     async def listen(self) -> dict:
         """Return user input as text. Behavior depends on current input mode.
@@ -239,7 +332,7 @@ class VoiceIO:
     async def display(self, user_text: str, chitra_text: str) -> dict:
         """Update the conversational interface display with the latest exchange.
 
-        Appends to conversation log and renders to terminal via rich.
+        Appends to the bounded conversation log and renders to terminal via rich.
 
         Returns:
             {"status": "done"}
@@ -278,12 +371,61 @@ class VoiceIO:
 
             self._input_mode = mode
             logger.info("Input mode set to: %s", mode)
+
+            # Load voice models now, while the user is still reading or typing,
+            # so the first voice listen() does not wait on them
+            if mode == "voice" and self._whisper_model is None and (
+                self._warmup_task is None or self._warmup_task.done()
+            ):
+                self._warmup_task = asyncio.create_task(self.warm_up())
+
             return {"status": "done", "mode": mode}
 
         except Exception as e:
             logger.error("Failed to set input mode: %s", e)
             return {"error": f"Mode switch failed: {e}"}
 
+    async def warm_up(self) -> dict:
+        """Load voice models and run them once so the first voice turn is hot.
+
+        Loads Whisper and Silero VAD, transcribes one second of silence to
+        trigger Whisper's lazy allocations, and starts the Piper process with
+        one throwaway utterance so its voice model is loaded. Safe to run in
+        the background: a listen() that arrives mid-load waits for the same models.
+
+        Returns:
+            {"status": "done"}
+
+        """
+        try:
+            if not self._audio_available or not self._stt_available:
+                return {"status": "done"}
+
+            await self._ensure_voice_models_loaded()
+            if self._whisper_model is not None:
+                await self._run_stt(self._transcribe, np.zeros(self.SAMPLE_RATE, dtype=np.float32))
+            if self._tts_available:
+                await asyncio.to_thread(self._synthesize, ".")
+            logger.info("Voice models warmed up")
+            return {"status": "done"}
+
+        except Exception as e:
+            logger.error("Warm-up failed: %s", e)
+            return {"error": f"Warm-up failed: {e}"}
+
+    async def aclose(self):
+        """Cancel an unfinished background warm-up, stop Piper and the STT thread. Call on shutdown."""
+        task = self._warmup_task
+        if task and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+        await asyncio.to_thread(self._close_piper)
+        self._stt_executor.shutdown(wait=False, cancel_futures=True)
+
     # ── Text mode ───────────────────────────────────────────────────
 
     async def _listen_text(self) -> dict:
@@ -316,8 +458,9 @@ class VoiceIO:
         Pipeline:
         1. Ensure Whisper + VAD models are loaded (lazy)
         2. Record audio with VAD-based speech detection
-        3. Transcribe with Whisper
-        4. Return text with confidence score
+        3. Skip recordings too short or quiet to be speech
+        4. Transcribe with Whisper
+        5. Return text with confidence score
         """
         if not self._audio_available:
             return {"error": "Voice mode unavailable — sounddevice not installed"}
@@ -329,10 +472,10 @@ class VoiceIO:
 
             audio_data = await asyncio.to_thread(self._record_with_vad)
 
-            if audio_data is None or len(audio_data) == 0:
+            if audio_data is None or not self._worth_transcribing(audio_data):
                 return {"text": "", "confidence": 0.0}
 
-            result = await asyncio.to_thread(self._transcribe, audio_data)
+            result = await self._run_stt(self._transcribe, audio_data)
 
             text = result.get("text", "").strip()
             confidence = self._extract_confidence(result)
@@ -344,37 +487,96 @@ class VoiceIO:
             logger.error("Voice listen failed: %s", e)
             return {"error": f"Voice input failed: {e}"}
 
+    def _worth_transcribing(self, audio_data) -> bool:
+        """Return False for recordings too short or too quiet to hold speech.
+
+        Checked before Whisper so a VAD false trigger costs an RMS, not a transcription.
+        """
+        if len(audio_data) < self.MIN_SPEECH_SECONDS * self.SAMPLE_RATE:
+            logger.info("Recording too short to transcribe (%d samples)", len(audio_data))
+            return False
+
+        rms = float(np.sqrt(np.dot(audio_data, audio_data) / len(audio_data)))
+        if rms < self.MIN_SPEECH_RMS:
+            logger.info("Recording too quiet to transcribe (RMS %.4f)", rms)
+            return False
+
+        return True
+
     async def _ensure_voice_models_loaded(self):
         """Load Whisper and Silero VAD models if not already loaded.
 
-        Models are loaded in a thread since loading involves file I/O
-        and can take several seconds.
+        Models are loaded in threads since loading involves file I/O and can
+        take several seconds. The two loads are independent, so they run
+        concurrently: Whisper on the STT thread, Silero on the default pool.
+        """
+        async with self._model_lock:
+            async with asyncio.TaskGroup() as tg:
+                if self._whisper_model is None and (_HAS_FASTER_WHISPER or _HAS_WHISPER):
+                    tg.create_task(self._load_whisper_model())
+                if self._vad_model is None and _HAS_SILERO_VAD:
+                    tg.create_task(self._load_vad_model())
+
+    async def _load_whisper_model(self):
+        """Load Whisper on the STT thread and keep it on the instance."""
+        logger.info("Loading Whisper model: %s", self._whisper_model_name)
+        self._whisper_model = await self._run_stt(self._load_whisper)
+        logger.info("Whisper model loaded (%s)", self._whisper_backend)
+
+    async def _load_vad_model(self):
+        """Load Silero VAD in a worker thread and keep it on the instance."""
+        logger.info("Loading Silero VAD model")
+        self._vad_model = await asyncio.to_thread(self._load_silero_vad)
+        logger.info("Silero VAD model loaded")
+
+    async def _run_stt(self, func, *args):
+        """Run a blocking Whisper call on the dedicated STT thread and await its result."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._stt_executor, func, *args)
+
+    def _load_whisper(self):
+        """Load the Whisper model. Blocking — called on the STT thread via _run_stt.
+
+        faster-whisper is the primary backend: CTranslate2 quantizes the
+        weights to CHITRA_WHISPER_COMPUTE_TYPE (int8 by default) on load, so
+        the matmuls run as int8 dot products instead of FP32. openai-whisper
+        is loaded only when faster-whisper is not installed.
         """
-        if self._whisper_model is None and _HAS_WHISPER:
-            logger.info("Loading Whisper model: %s", self._whisper_model_name)
-            self._whisper_model = await asyncio.to_thread(
-                whisper.load_model, self._whisper_model_name,
+        if _HAS_FASTER_WHISPER:
+            self._whisper_backend = "faster-whisper"
+            return WhisperModel(
+                self._whisper_model_name,
+                device="cpu",
+                compute_type=self._whisper_compute_type,
             )
-            logger.info("Whisper model loaded")
-
-        if self._vad_model is None and _HAS_SILERO_VAD:
-            logger.info("Loading Silero VAD model")
-            self._vad_model = await asyncio.to_thread(self._load_silero_vad)
-            logger.info("Silero VAD model loaded")
+        self._whisper_backend = "openai-whisper"
+        return whisper.load_model(self._whisper_model_name)
 
     def _load_silero_vad(self):
         """Load Silero VAD model. Blocking — called via asyncio.to_thread.
 
         Uses the silero-vad pip package which bundles the model locally,
-        avoiding any network fetch at runtime.
+        avoiding any network fetch at runtime. The package's ONNX export is
+        preferred when onnxruntime is installed: per-chunk inference runs on a
+        single-threaded ORT session rather than the TorchScript interpreter,
+        and keeps the LSTM state between calls the same way.
         """
         import silero_vad as sv
-        return sv.load_silero_vad()
+        return sv.load_silero_vad(onnx=_HAS_ONNXRUNTIME)
 
     def _record_with_vad(self):
         """Record audio from microphone, using VAD to detect speech boundaries.
 
-        Blocking — always called via asyncio.to_thread.
+        Blocking — always called via asyncio.to_thread. The microphone is read
+        on a dedicated capture thread (see _capture_chunks) so VAD inference
+        never delays the next read; this thread consumes the chunks and runs
+        VAD on each as it arrives. Samples are written straight into one
+        preallocated buffer, wrapped once as a tensor, and Silero reads each
+        chunk as a slice of that tensor, so VAD never copies a chunk. Until
+        speech starts, chunks the WebRTC silence gate rejects skip Silero
+        entirely. The recording starts a short pre-roll before speech onset,
+        so the first syllable is not clipped, and ends a short post-roll
+        after the last speech chunk rather than after the full silence window.
 
         Returns numpy array of float32 audio samples, or None if no speech detected.
         """
@@ -383,54 +585,124 @@ class VoiceIO:
         chunk_samples = int(self.SAMPLE_RATE * chunk_duration_ms / 1000)
         silence_chunks = int(self.SILENCE_DURATION_MS / chunk_duration_ms)
         max_chunks = int(self.MAX_RECORDING_SECONDS * 1000 / chunk_duration_ms)
-
-        audio_chunks = []
-        speech_started = False
+        pre_roll_samples = max(1, self.PRE_ROLL_MS // chunk_duration_ms) * chunk_samples
+        post_roll_samples = self.POST_ROLL_MS // chunk_duration_ms * chunk_samples
+
+        buf = np.empty(int(self.SAMPLE_RATE * self.MAX_RECORDING_SECONDS), dtype=np.float32)
+        # One tensor sharing buf's memory for the whole recording; VAD gets slices of it
+        buf_tensor = torch.from_numpy(buf)
+        pos = 0
+        speech_start = None
+        speech_end = 0
         silence_count = 0
         total_chunks = 0
 
         self._console.print("[dim]Listening... (speak now)[/dim]")
 
-        with sd.InputStream(
+        with sd.RawInputStream(
             samplerate=self.SAMPLE_RATE,
             channels=self.CHANNELS,
             dtype="float32",
             blocksize=chunk_samples,
         ) as stream:
-            while total_chunks < max_chunks:
-                chunk, overflowed = stream.read(chunk_samples)
-                if overflowed:
-                    logger.warning("Audio buffer overflow")
+            chunks = queue.Queue()
+            stop = threading.Event()
+            reader = threading.Thread(
+                target=self._capture_chunks,
+                args=(stream, chunk_samples, chunks, stop),
+                name="voice-capture",
+                daemon=True,
+            )
+            reader.start()
 
-                total_chunks += 1
-
-                # Feed chunk to VAD
-                audio_tensor = torch.from_numpy(chunk.flatten())
-                speech_prob = self._vad_model(audio_tensor, self.SAMPLE_RATE).item()
-
-                if speech_prob >= self.VAD_THRESHOLD:
-                    if not speech_started:
-                        speech_started = True
-                        logger.info("Speech detected")
-                    silence_count = 0
-                    audio_chunks.append(chunk.copy())
-                elif speech_started:
-                    # Capture audio during brief pauses within speech
-                    audio_chunks.append(chunk.copy())
-                    silence_count += 1
-
-                    if silence_count >= silence_chunks:
-                        logger.info("End of speech detected")
-                        break
+            try:
+                while total_chunks < max_chunks:
+                    data = chunks.get()
+                    if data is None:
+                        break  # Capture thread stopped on a read error
 
-        if not audio_chunks:
+                    samples = np.frombuffer(data, dtype=np.float32)
+                    n = len(samples)
+                    if pos + n > len(buf):
+                        break
+                    buf[pos:pos + n] = samples
+                    pos += n
+                    total_chunks += 1
+
+                    chunk = buf[pos - n:pos]
+                    if speech_start is None and not self._passes_silence_gate(chunk):
+                        continue
+
+                    speech_prob = self._speech_prob(buf_tensor[pos - n:pos])
+
+                    if speech_prob >= self.VAD_THRESHOLD:
+                        if speech_start is None:
+                            speech_start = max(0, pos - n - pre_roll_samples)
+                            logger.info("Speech detected")
+                        speech_end = pos
+                        silence_count = 0
+                    elif speech_start is not None:
+                        # Keep recording through brief pauses within speech
+                        silence_count += 1
+
+                        if silence_count >= silence_chunks:
+                            logger.info("End of speech detected")
+                            break
+            finally:
+                stop.set()
+                reader.join()
+
+        if speech_start is None:
             logger.info("No speech detected")
             return None
 
-        return np.concatenate(audio_chunks, axis=0)
+        # The end-of-speech silence only served to detect the end; Whisper
+        # would spend time on it, so keep just a short tail
+        return buf[speech_start:min(pos, speech_end + post_roll_samples)]
+
+    def _speech_prob(self, chunk_tensor) -> float:
+        """Run Silero VAD on one chunk of mono samples and return its speech probability.
+
+        Runs under inference_mode so the per-chunk call skips autograd
+        bookkeeping. Chunks are fed one at a time: Silero is stateful, and
+        batching consecutive chunks would give each its own LSTM state.
+        """
+        with torch.inference_mode():
+            return self._vad_model(chunk_tensor, self.SAMPLE_RATE).item()
+
+    def _passes_silence_gate(self, samples) -> bool:
+        """Return False if WebRTC VAD hears no speech in the chunk, so Silero can be skipped.
+
+        Only used before speech starts, where almost every chunk is silence.
+        Always True when webrtcvad is not installed.
+        """
+        if self._silence_gate is None:
+            return True
+        frame = samples[: self.SAMPLE_RATE * self.SILENCE_GATE_FRAME_MS // 1000]
+        pcm = (np.clip(frame, -1.0, 1.0) * 32767).astype(np.int16)
+        return self._silence_gate.is_speech(pcm.tobytes(), self.SAMPLE_RATE)
+
+    @staticmethod
+    def _capture_chunks(stream, chunk_samples: int, chunks: queue.Queue, stop: threading.Event):
+        """Read fixed-size chunks from the input stream until stopped.
+
+        Runs on its own thread for the duration of one recording. Each read
+        returns a fresh buffer, which is queued as-is for the VAD loop; a final
+        None tells the consumer that capture has ended.
+        """
+        try:
+            while not stop.is_set():
+                data, overflowed = stream.read(chunk_samples)
+                if overflowed:
+                    logger.warning("Audio buffer overflow")
+                chunks.put(data)
+        except Exception as e:
+            logger.error("Audio capture failed: %s", e)
+        finally:
+            chunks.put(None)
 
     def _transcribe(self, audio_data) -> dict:
-        """Transcribe audio using Whisper. Blocking — called via asyncio.to_thread.
+        """Transcribe audio using Whisper. Blocking — called on the STT thread via _run_stt.
 
         Args:
             audio_data: numpy float32 array at 16kHz mono
@@ -446,6 +718,9 @@ class VoiceIO:
         if max_val > 1.0:
             audio_float = audio_float / max_val
 
+        if self._whisper_backend == "faster-whisper":
+            return self._transcribe_ctranslate2(audio_float)
+
         result = self._whisper_model.transcribe(
             audio_float,
             language="en",
@@ -453,6 +728,23 @@ class VoiceIO:
         )
         return result
 
+    def _transcribe_ctranslate2(self, audio_float) -> dict:
+        """Transcribe with faster-whisper, shaped like an openai-whisper result.
+
+        Greedy decoding (beam_size=1) matches openai-whisper's default, and
+        faster-whisper's own VAD filter is off since the audio was already cut
+        to speech by Silero. Segments are yielded lazily; they are consumed
+        here and converted to the 'text'/'segments' dict _extract_confidence reads.
+        """
+        segments, _info = self._whisper_model.transcribe(
+            audio_float, language="en", beam_size=1, vad_filter=False,
+        )
+        segments = [{"text": s.text, "avg_logprob": s.avg_logprob} for s in segments]
+        return {
+            "text": "".join(s["text"] for s in segments),
+            "segments": segments,
+        }
+
     def _extract_confidence(self, whisper_result: dict) -> float:
         """Extract a confidence score from Whisper transcription result.
 
@@ -462,8 +754,7 @@ class VoiceIO:
         if not segments:
             return 0.0
 
-        avg_logprobs = [s.get("avg_logprob", -1.0) for s in segments]
-        mean_logprob = sum(avg_logprobs) / len(avg_logprobs)
+        mean_logprob = math.fsum(s.get("avg_logprob", -1.0) for s in segments) / len(segments)
 
         # avg_logprob range: -1.0 (low) to 0.0 (perfect)
         confidence = max(0.0, min(1.0, 1.0 + mean_logprob))
@@ -474,7 +765,7 @@ class VoiceIO:
     def _speak_blocking(self, text: str) -> bool:
         """Run TTS and play the output. Blocking — called via asyncio.to_thread.
 
-        Production path: Piper TTS subprocess → raw PCM → sounddevice playback.
+        Production path: long-lived Piper process → WAV PCM → sounddevice playback.
         Dev fallback: macOS `say` command when Piper is unavailable (not for production).
 
         Returns True if speech was produced, False on failure.
@@ -483,47 +774,109 @@ class VoiceIO:
             return self._speak_dev_fallback(text)
 
         try:
-            process = subprocess.run(
-                [
-                    self._piper_binary,
-                    "--model", self._piper_model,
-                    "--output_raw",
-                ],
-                input=text.encode("utf-8"),
-                capture_output=True,
-                timeout=30,
-            )
-
-            if process.returncode != 0:
-                logger.error(
-                    "Piper TTS failed (exit %d): %s",
-                    process.returncode,
-                    process.stderr.decode("utf-8", errors="replace"),
-                )
+            synthesized = self._synthesize(text)
+            if synthesized is None:
                 return False
 
-            raw_audio = process.stdout
+            raw_audio, piper_sample_rate = synthesized
             if not raw_audio:
                 logger.warning("Piper produced no audio output")
                 return False
 
-            # Piper raw output: 16-bit signed PCM, mono
-            # Sample rate depends on model (22050 Hz for lessac model)
-            piper_sample_rate = 22050
+            # Piper output: 16-bit signed PCM, mono, at the voice model's sample rate.
+            # Played as int16 directly — a zero-copy view, no float conversion.
             audio_array = np.frombuffer(raw_audio, dtype=np.int16)
-            audio_float = audio_array.astype(np.float32) / 32768.0
 
-            sd.play(audio_float, samplerate=piper_sample_rate)
+            sd.play(audio_array, samplerate=piper_sample_rate)
             sd.wait()
             return True
 
-        except subprocess.TimeoutExpired:
-            logger.error("Piper TTS timed out")
-            return False
         except Exception as e:
             logger.error("TTS playback failed: %s", e)
             return False
 
+    def _synthesize(self, text: str) -> tuple[bytes, int] | None:
+        """Synthesize one utterance on the long-lived Piper process.
+
+        Piper reads one utterance per stdin line, writes it as a WAV file in
+        its output directory, and prints the file's path — the path marks the
+        end of that utterance. A process that exits or stalls past
+        PIPER_TIMEOUT_SECONDS is killed and restarted on the next call.
+
+        Returns (16-bit mono PCM, sample rate), or None on failure.
+        """
+        line = " ".join(text.split())
+        if not line:
+            return None
+
+        with self._piper_lock:
+            proc = self._ensure_piper_process()
+            try:
+                proc.stdin.write(line + "\n")
+                proc.stdin.flush()
+                ready, _, _ = select.select([proc.stdout], [], [], self.PIPER_TIMEOUT_SECONDS)
+                wav_path = proc.stdout.readline().strip() if ready else ""
+            except OSError as e:
+                logger.error("Piper TTS pipe failed: %s", e)
+                wav_path = ""
+
+            if not wav_path:
+                logger.error("Piper TTS failed or timed out (exit %s) — restarting", proc.poll())
+                proc.kill()
+                proc.wait()
+                self._piper_proc = None
+                return None
+
+        try:
+            with wave.open(wav_path, "rb") as wav:
+                return wav.readframes(wav.getnframes()), wav.getframerate()
+        finally:
+            os.remove(wav_path)
+
+    def _ensure_piper_process(self) -> subprocess.Popen:
+        """Return the running Piper process, starting it if needed. Caller holds _piper_lock.
+
+        Piper loads the voice model once at startup, so utterances after the
+        first skip process launch and model load entirely.
+        """
+        if self._piper_proc is not None and self._piper_proc.poll() is None:
+            return self._piper_proc
+
+        if self._piper_output_dir is None:
+            self._piper_output_dir = tempfile.mkdtemp(prefix="chitra-tts-")
+
+        self._piper_proc = subprocess.Popen(
+            [
+                self._piper_binary,
+                "--model", self._piper_model,
+                "--output_dir", self._piper_output_dir,
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+        )
+        logger.info("Piper TTS process started (pid %d)", self._piper_proc.pid)
+        return self._piper_proc
+
+    def _close_piper(self):
+        """Stop the Piper process and remove its output directory. Blocking."""
+        with self._piper_lock:
+            proc, self._piper_proc = self._piper_proc, None
+            if proc is not None:
+                # Piper exits on end of input; kill it only if it does not
+                try:
+                    proc.stdin.close()
+                    proc.wait(timeout=5)
+                except (OSError, subprocess.TimeoutExpired):
+                    proc.kill()
+                    proc.wait()
+
+            if self._piper_output_dir is not None:
+                shutil.rmtree(self._piper_output_dir, ignore_errors=True)
+                self._piper_output_dir = None
+
     def _speak_dev_fallback(self, text: str) -> bool:
         """Dev-only TTS fallback using macOS say command.
 
@@ -552,18 +905,13 @@ class VoiceIO:
         """Render a conversation exchange to the terminal using rich.
 
         Minimal design: clean speaker attribution with color, no borders or panels.
+        The whole exchange, trailing blank line included, goes out in one print.
         """
+        parts = []
         if user_text:
-            line = Text()
-            line.append("You", style="bold cyan")
-            line.append(f"  {user_text}")
-            self._console.print(line)
-
+            parts += [_USER_LABEL, f"  {user_text}\n"]
         if chitra_text:
-            line = Text()
-            line.append("Chitra", style="bold green")
-            line.append(f"  {chitra_text}")
-            self._console.print(line)
+            parts += [_CHITRA_LABEL, f"  {chitra_text}\n"]
 
-        if user_text or chitra_text:
-            self._console.print()
+        if parts:
+            self._console.print(Text.assemble(*parts))
@@ -8,6 +8,7 @@ All LLM calls go through this client. The Orchestration Core never calls
 Ollama directly.
 
 Robust JSON parsing:
+- Constrain decoding to RESPONSE_SCHEMA via Ollama's structured outputs
 - Wrap all JSON parsing in try/except
 - On malformed JSON, retry with correction prompt (max 2 retries)
 - On persistent failure, return safe fallback response
@@ -18,15 +19,81 @@ import json
 import logging
 import os
 import re
+from collections.abc import Awaitable, Callable
 
 import httpx
 
 from llm.prompts import CORRECTION_PROMPT
+from llm.streaming import ResponseSentences
 
 logger = logging.getLogger(__name__)
 
+# Optional orjson: faster JSON for request bodies and replies, with the stdlib
+# as fallback. orjson.JSONDecodeError subclasses json.JSONDecodeError, so the
+# parsing code catches either.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
 MAX_RETRIES = 2
 
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Generation can take a while on CPU; everything else against a local server should be quick
+HTTP_TIMEOUT = httpx.Timeout(connect=5.0, read=120.0, write=5.0, pool=5.0)
+
+# Calls are sequential, so a couple of connections is plenty. Keep an idle
+# connection open across the pause between turns rather than reconnecting.
+HTTP_LIMITS = httpx.Limits(max_connections=4, max_keepalive_connections=2, keepalive_expiry=300.0)
+
+# How long Ollama keeps the model loaded after a request. Its default of five
+# minutes would unload it, and drop the cached prompt prefix with it, during
+# an ordinary pause in conversation.
+KEEP_ALIVE = "30m"
+
+# One memory_store entry. The enums mirror Memory's CATEGORIES and SOURCES, so
+# an entry with an invented category cannot be generated in the first place.
+MEMORY_ENTRY_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "category": {"enum": ["preference", "fact", "observation", "relationship"]},
+        "subject": {"type": "string"},
+        "content": {"type": "string"},
+        "confidence": {"type": "number"},
+        "source": {"enum": ["stated", "inferred"]},
+    },
+    "required": ["category", "subject", "content", "confidence", "source"],
+}
+
+# Passed as Ollama's "format": decoding is constrained to a JSON object of
+# this shape, so malformed output no longer depends on the model following
+# RESPONSE_FORMAT_INSTRUCTION. Properties are generated in the order listed,
+# which puts "action" before "response" for streamed speech. "should_speak"
+# is only used by the proactive loop's prompt, so it is optional.
+RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "intent": {"type": "string"},
+        "action": {"type": ["object", "null"]},
+        "response": {"type": "string"},
+        "memory_store": {"type": "array", "items": MEMORY_ENTRY_SCHEMA},
+        "should_speak": {"type": "boolean"},
+    },
+    "required": ["intent", "action", "response", "memory_store"],
+}
+
+_JSON_DECODER = json.JSONDecoder()
+
+# A JSON object inside a markdown code fence, optionally tagged "json"
+_JSON_FENCE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+
 
 class LLMClient:
     """Interface to the local LLM via Ollama. Model is configurable, never hardcoded."""
@@ -34,7 +101,11 @@ class LLMClient:
     def __init__(self):
         self.model = os.environ.get("CHITRA_LLM_MODEL", "qwen2.5:7b")
         self.base_url = "http://localhost:11434"
-        self._client = httpx.AsyncClient(base_url=self.base_url, timeout=120.0)
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=HTTP_TIMEOUT,
+            limits=HTTP_LIMITS,
+        )
 
         logger.info("LLM client initialized — model: %s, url: %s", self.model, self.base_url)
 
@@ -63,6 +134,45 @@ class LLMClient:
             }
 
         """
+        messages = self._build_messages(system_prompt, user_message, conversation_history)
+        raw_text = await self._send(messages)
+        return await self._parse_with_retries(messages, raw_text)
+
+    async def call_streaming(
+        self,
+        system_prompt: str,
+        user_message: str,
+        conversation_history: list[dict] | None = None,
+        *,
+        on_sentence: Callable[[str], Awaitable[None]],
+        on_discard: Callable[[], Awaitable[None]] | None = None,
+    ) -> dict:
+        """Like call(), but streams the reply and passes each finished sentence to on_sentence.
+
+        Sentences of the "response" field are released while the LLM is still
+        generating, so speech can start after the first sentence rather than
+        the whole object. Nothing is released when the LLM chose an action —
+        the reply then comes from the follow-up call. Correction retries are
+        not streamed.
+
+        If the streamed attempt fails or is not valid JSON, on_discard is awaited
+        before the retry: the sentences already released are not part of the
+        reply that is returned, so the caller should drop them and present that
+        reply in full instead.
+
+        Returns the same parsed dict as call().
+        """
+        messages = self._build_messages(system_prompt, user_message, conversation_history)
+        raw_text = await self._send_streaming(messages, on_sentence)
+        return await self._parse_with_retries(messages, raw_text, on_discard)
+
+    def _build_messages(
+        self,
+        system_prompt: str,
+        user_message: str,
+        conversation_history: list[dict] | None,
+    ) -> list[dict]:
+        """Build the chat message list: system prompt, prior turns, then the user message."""
         messages = [{"role": "system", "content": system_prompt}]
 
         # Include conversation history for multi-turn continuity
@@ -70,16 +180,28 @@ class LLMClient:
             messages.extend(conversation_history)
 
         messages.append({"role": "user", "content": user_message})
+        return messages
 
-        # First attempt
-        raw_text = await self._send(messages)
-        if raw_text is None:
-            return self._fallback_response()
+    async def _parse_with_retries(
+        self,
+        messages: list[dict],
+        raw_text: str | None,
+        on_discard: Callable[[], Awaitable[None]] | None = None,
+    ) -> dict:
+        """Parse the first attempt's text, retrying with a correction prompt on malformed JSON.
 
-        parsed = self._parse_response(raw_text)
+        on_discard is awaited once the first attempt is known to be unusable.
+        """
+        parsed = None if raw_text is None else self._parse_response(raw_text)
         if parsed is not None:
             return parsed
 
+        if on_discard is not None:
+            await on_discard()
+
+        if raw_text is None:
+            return self._fallback_response()
+
         # Retry loop with correction prompt
         for attempt in range(1, MAX_RETRIES + 1):
             logger.warning(
@@ -112,39 +234,88 @@ class LLMClient:
         try:
             response = await self._client.post(
                 "/api/chat",
-                json={
-                    "model": self.model,
-                    "messages": messages,
-                    "stream": False,
-                    "format": "json",
-                },
+                content=self._chat_body(messages, stream=False),
+                headers=JSON_HEADERS,
             )
             response.raise_for_status()
 
-            data = response.json()
+            data = _json_loads(response.content)
             content = data.get("message", {}).get("content", "")
 
-            if not content:
-                logger.error("Empty response from LLM")
-                return None
+        except Exception as e:
+            self._log_send_failure(e)
+            return None
+
+        if not content:
+            logger.error("Empty response from LLM")
+            return None
+
+        return content
+
+    async def _send_streaming(
+        self,
+        messages: list[dict],
+        on_sentence: Callable[[str], Awaitable[None]],
+    ) -> str | None:
+        """Stream a chat reply from Ollama, passing response sentences to on_sentence as they complete.
+
+        Returns the full raw response text, or None on connection or API failure.
+        """
+        sentences = ResponseSentences()
+        parts = []
+        try:
+            async with self._client.stream(
+                "POST",
+                "/api/chat",
+                content=self._chat_body(messages, stream=True),
+                headers=JSON_HEADERS,
+            ) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    chunk = _json_loads(line).get("message", {}).get("content", "")
+                    parts.append(chunk)
+                    for sentence in sentences.feed(chunk):
+                        await on_sentence(sentence)
+
+            for sentence in sentences.flush():
+                await on_sentence(sentence)
+
+        except Exception as e:
+            self._log_send_failure(e)
+            return None
 
-            return content
+        content = "".join(parts)
+        if not content:
+            logger.error("Empty response from LLM")
+            return None
 
-        except httpx.ConnectError:
+        return content
+
+    def _chat_body(self, messages: list[dict], stream: bool) -> bytes:
+        """Serialize an /api/chat request body."""
+        return _json_dumps({
+            "model": self.model,
+            "messages": messages,
+            "stream": stream,
+            "format": RESPONSE_SCHEMA,
+            "keep_alive": KEEP_ALIVE,
+        })
+
+    def _log_send_failure(self, error: Exception):
+        """Log why a request to Ollama failed."""
+        if isinstance(error, httpx.ConnectError):
             logger.error(
                 "Cannot connect to Ollama at %s — is it running? (ollama serve)",
                 self.base_url,
             )
-            return None
-        except httpx.TimeoutException:
+        elif isinstance(error, httpx.TimeoutException):
             logger.error("LLM request timed out")
-            return None
-        except httpx.HTTPStatusError as e:
-            logger.error("LLM API error: %s", e)
-            return None
-        except Exception as e:
-            logger.error("LLM call failed: %s", e)
-            return None
+        elif isinstance(error, httpx.HTTPStatusError):
+            logger.error("LLM API error: %s", error)
+        else:
+            logger.error("LLM call failed: %s", error)
 
     def _parse_response(self, raw_text: str) -> dict | None:
         """Parse LLM response text into structured JSON.
@@ -155,36 +326,36 @@ class LLMClient:
         Returns parsed dict on success, None on failure.
         """
         try:
-            # First try: direct parse
-            result = json.loads(raw_text)
+            # First try: direct parse — with the schema-constrained format this is almost always enough
+            result = _json_loads(raw_text)
             return self._validate_response(result)
         except json.JSONDecodeError:
             pass
 
-        # Second try: extract JSON from markdown code blocks
-        try:
-            match = re.search(r"```(?:json)?\s*(\{.*?\})\s*```", raw_text, re.DOTALL)
-            if match:
-                result = json.loads(match.group(1))
-                return self._validate_response(result)
-        except json.JSONDecodeError:
-            pass
-
-        # Third try: find the first { ... } block in the text
         try:
             start = raw_text.index("{")
-            # Find the matching closing brace by counting braces
-            depth = 0
-            for i in range(start, len(raw_text)):
-                if raw_text[i] == "{":
-                    depth += 1
-                elif raw_text[i] == "}":
-                    depth -= 1
-                    if depth == 0:
-                        result = json.loads(raw_text[start:i + 1])
-                        return self._validate_response(result)
-        except (ValueError, json.JSONDecodeError):
-            pass
+        except ValueError:
+            start = None
+
+        # Second try: extract JSON from markdown code blocks. Text that starts
+        # with the object itself cannot be fenced, so skip the regex for it.
+        if start is None or raw_text[:start].strip():
+            try:
+                match = _JSON_FENCE.search(raw_text)
+                if match:
+                    result = _json_loads(match.group(1))
+                    return self._validate_response(result)
+            except json.JSONDecodeError:
+                pass
+
+        # Third try: decode the first { ... } object in the text, ignoring
+        # whatever follows it. raw_decode handles braces inside strings.
+        if start is not None:
+            try:
+                result, _ = _JSON_DECODER.raw_decode(raw_text, start)
+                return self._validate_response(result)
+            except json.JSONDecodeError:
+                pass
 
         # All parsing attempts failed
         logger.error("Failed to parse LLM response as JSON: %s", raw_text[:200])
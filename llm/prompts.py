@@ -5,7 +5,8 @@ Defines the system prompt structure, identity instructions, and the
 required JSON response format for all LLM calls.
 
 Every LLM call follows this structure:
-    System prompt: identity + context block (Memory + System State) + history
+    System prompt: STATIC_SYSTEM_PREFIX (identity + catalog + format) + context block
+        (Memory + events + reminders + System State) + history
     User message: current input or proactive trigger description
 """
 
@@ -21,40 +22,40 @@ If you don't know something, say so honestly. Never fabricate information."""
 
 # Catalog of available capabilities and their actions — injected into every
 # system prompt so the LLM knows exactly what it can do (and nothing more)
-CAPABILITY_CATALOG = """Available capabilities and actions you can call:
+CAPABILITY_CATALOG = """Available capabilities and actions you can call, as capability: action(params) — what it does:
 
 contacts:
-  - get(name) — find a contact by name or partial name
-  - list() — return all contacts
-  - create(contact) — create a new contact {name, relationship, phone, email, notes, communication_preference}
-  - update(id, fields) — update fields on a contact
-  - note_interaction(id) — mark that the user interacted with this contact today
+  get(name) — find by name or partial name
+  list()
+  create(contact) — {name, relationship, phone, email, notes, communication_preference}
+  update(id, fields)
+  note_interaction(id) — user interacted with them today
 
 calendar:
-  - get_upcoming(hours_ahead) — events within the next N hours
-  - get_today() — all events for today
-  - create(event) — create an event {title, date, time, duration_minutes, notes, participants}
-  - get_range(start_date, end_date) — events within a date range
+  get_upcoming(hours_ahead)
+  get_today()
+  create(event) — {title, date, time, duration_minutes, notes, participants}
+  get_range(start_date, end_date)
 
 reminders:
-  - create(reminder) — create a reminder {text, trigger_at, repeat, contact_id}
-  - list_upcoming(hours_ahead) — pending reminders due within N hours
-  - dismiss(id) — dismiss a reminder
-  - delete(id) — delete a reminder
+  create(reminder) — {text, trigger_at, repeat, contact_id}
+  list_upcoming(hours_ahead) — pending, due within N hours
+  dismiss(id)
+  delete(id)
 
 tasks:
-  - create(task) — create a task {title, notes, due_date, priority}
-  - list(status) — list tasks by status: "pending", "done", or "all"
-  - complete(id) — mark a task as done
-  - get_overdue() — pending tasks past their due date
-  - get_due_today() — pending tasks due today
+  create(task) — {title, notes, due_date, priority}
+  list(status) — status: "pending", "done" or "all"
+  complete(id)
+  get_overdue()
+  get_due_today()
 
 memory:
-  - search(query) — search memories by topic
-  - store(entry) — store a new memory (category must be one of: preference, fact, observation, relationship)
+  search(query)
+  store(entry) — category: preference, fact, observation or relationship
 
 voice_io:
-  - set_input_mode(mode) — switch between "text" and "voice" input modes
+  set_input_mode(mode) — "text" or "voice"
 
 Only use actions from this catalog. Do not invent actions or capabilities that are not listed."""
 
@@ -90,6 +91,11 @@ instead.
 
 Respond with ONLY the JSON object, no other text."""
 
+# The fixed start of every system prompt, joined once at import. Context
+# assembly appends the per-call blocks after it, so this prefix is
+# byte-identical across calls.
+STATIC_SYSTEM_PREFIX = "\n\n".join((SYSTEM_IDENTITY, CAPABILITY_CATALOG, RESPONSE_FORMAT_INSTRUCTION))
+
 # Proactive loop prompt — sent as the user message when the proactive loop
 # detects something that might be worth surfacing
 PROACTIVE_PROMPT_TEMPLATE = """You are running a background check. The following things have come up:
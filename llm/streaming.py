@@ -0,0 +1,110 @@
+"""
+Sentence extraction from a streamed LLM response.
+
+The LLM answers with a JSON object whose "response" field is what Chitra
+says. When Ollama streams that object token by token, ResponseSentences
+decodes the "response" string as it arrives and hands back each complete
+sentence, so speech can start while the rest is still being generated.
+
+Sentences are only released when the object's "action" is null and comes
+before "response" (the order RESPONSE_FORMAT_INSTRUCTION asks for). With an
+action, the spoken reply comes from the follow-up call instead, so nothing
+is released.
+"""
+
+import json
+import re
+
+# Sentence end: . ? or ! (plus any closing quote/bracket) followed by whitespace
+_SENTENCE_END = re.compile(r"[.?!]+[\"')\]]*\s+")
+
+# Words whose trailing period does not end a sentence
+_ABBREVIATIONS = frozenset({
+    "Dr.", "Mr.", "Mrs.", "Ms.", "St.", "Jr.", "Sr.",
+    "a.m.", "p.m.", "AM.", "PM.", "e.g.", "i.e.", "etc.", "vs.",
+})
+
+# Shorter fragments ("Hi!") are held and spoken with the next sentence
+MIN_SENTENCE_CHARS = 10
+
+_RESPONSE_KEY = re.compile(r'"response"\s*:\s*"')
+_NULL_ACTION = re.compile(r'"action"\s*:\s*null')
+
+# \uD800-\uDBFF: the first half of a surrogate pair, which needs its second \uXXXX
+_HIGH_SURROGATE = re.compile(r"u[dD][89abAB]")
+
+
+class ResponseSentences:
+    """Incrementally pulls complete sentences out of a streamed JSON "response" field."""
+
+    def __init__(self):
+        self._raw = ""  # Streamed JSON so far
+        self._pos = None  # Index in _raw of the next undecoded response character
+        self._pending = ""  # Decoded response text not yet released as a sentence
+        self._closed = False  # The response string's closing quote has arrived
+        self.speakable = False  # Action is null, so sentences are being released
+
+    def feed(self, chunk: str) -> list[str]:
+        """Add a streamed chunk and return any sentences it completed."""
+        self._raw += chunk
+
+        if self._pos is None:
+            match = _RESPONSE_KEY.search(self._raw)
+            if match is None:
+                return []
+            self.speakable = _NULL_ACTION.search(self._raw, 0, match.start()) is not None
+            self._pos = match.end()
+
+        if not self.speakable or self._closed:
+            return []
+
+        self._decode()
+        return self._take_sentences()
+
+    def flush(self) -> list[str]:
+        """Return whatever response text remains once the stream has ended."""
+        if not self.speakable:
+            return []
+        rest = self._pending.strip()
+        self._pending = ""
+        return [rest] if rest else []
+
+    def _decode(self):
+        """Decode the response string up to its closing quote or the last complete escape."""
+        raw, start = self._raw, self._pos
+        i, end = start, len(raw)
+        while i < end:
+            char = raw[i]
+            if char == '"':
+                self._closed = True
+                break
+            if char == "\\":
+                if raw.startswith("u", i + 1):
+                    step = 12 if _HIGH_SURROGATE.match(raw, i + 1) else 6
+                else:
+                    step = 2
+                if i + step > end:
+                    break  # Escape sequence not fully streamed yet
+                i += step
+            else:
+                i += 1
+
+        if i > start:
+            self._pending += json.loads('"' + raw[start:i] + '"')
+            self._pos = i
+
+    def _take_sentences(self) -> list[str]:
+        """Split complete sentences off the front of the pending text."""
+        text = self._pending
+        sentences = []
+        start = 0
+        for match in _SENTENCE_END.finditer(text):
+            sentence = text[start:match.end()].strip()
+            if sentence.rsplit(None, 1)[-1] in _ABBREVIATIONS:
+                continue
+            if len(sentence) < MIN_SENTENCE_CHARS:
+                continue
+            sentences.append(sentence)
+            start = match.end()
+        self._pending = text[start:]
+        return sentences
@@ -17,8 +17,10 @@ Onboarding ends with a summary of what Chitra now knows.
 Must never be skipped on first run. Must never appear on subsequent boots.
 """
 
+import asyncio
 import logging
 import os
+import re
 
 logger = logging.getLogger(__name__)
 
@@ -82,6 +84,32 @@ ONBOARDING_STEPS = [
 ]
 
 
+# Answers that mean "nothing to add", compared after lowercasing and
+# stripping trailing . and !
+_EMPTY_ANSWERS = frozenset({
+    "nothing",
+    "nothing for now",
+    "no",
+    "nope",
+    "not right now",
+    "skip",
+    "that's it",
+    "that's all",
+    "none",
+    "n/a",
+})
+
+
+# Words that pick an input mode from the onboarding answer, matched as whole
+# words so "context" does not read as "text". Text wins if both appear.
+_TEXT_MODE_WORDS = frozenset({"type", "types", "typed", "typing", "text", "texting", "keyboard"})
+_VOICE_MODE_WORDS = frozenset({
+    "speak", "speaks", "speaking", "spoken", "voice", "talk", "talks", "talking",
+})
+
+_WORD = re.compile(r"[a-z]+")
+
+
 class OnboardingFlow:
     """Guides the user through first-run setup via conversation."""
 
@@ -90,6 +118,8 @@ class OnboardingFlow:
         self._onboarding_marker = os.path.join(
             self.core.data_dir, ".onboarding_complete",
         )
+        # Whether the marker exists — checked on disk once, then kept current by _mark_complete
+        self._marker_exists: bool | None = None
 
     async def should_run(self) -> bool:
         """Check if onboarding needs to run (first boot detection).
@@ -97,7 +127,10 @@ class OnboardingFlow:
         Returns True if the onboarding marker file does not exist.
         The marker is created at the end of successful onboarding.
         """
-        if os.path.exists(self._onboarding_marker):
+        if self._marker_exists is None:
+            self._marker_exists = os.path.exists(self._onboarding_marker)
+
+        if self._marker_exists:
             logger.info("Onboarding marker found — skipping onboarding")
             return False
 
@@ -108,7 +141,9 @@ class OnboardingFlow:
         """Execute the onboarding conversation flow.
 
         Walks through each onboarding step: display the prompt, listen for
-        the user's answer, store the answer to Memory, then move to the next step.
+        the user's answer, then move to the next step. The answers are stored
+        to Memory together once the steps end, including when an interruption
+        or error ends them early.
 
         At the end, displays a summary and creates the onboarding marker
         so it never runs again.
@@ -116,61 +151,57 @@ class OnboardingFlow:
         try:
             logger.info("Starting onboarding flow")
             user_name = None
-            stored_memories = []
-
-            for step in ONBOARDING_STEPS:
-                # Personalize the prompt if we know the name
-                prompt = step["prompt"]
-                if user_name and "{name}" in prompt:
-                    prompt = prompt.format(name=user_name)
-
-                # Display the question
-                await self.core.voice_io.display("", prompt)
-                await self.core.voice_io.speak(prompt)
-
-                # Listen for the answer
-                listen_result = await self.core.voice_io.listen()
-                if "error" in listen_result:
-                    logger.error("Onboarding listen error: %s", listen_result["error"])
-                    continue
-
-                answer = listen_result.get("text", "").strip()
-                if not answer:
-                    continue
-
-                # Display the user's answer
-                await self.core.voice_io.display(answer, "")
-
-                # Extract the user's name from the first step
-                if step["memory_subject"] == "name":
-                    user_name = answer
-
-                # Handle input mode preference
-                if step.get("process_mode"):
-                    await self._process_input_mode(answer)
-
-                # Skip storage for "nothing" answers on optional steps
-                if step.get("skip_if_empty") and self._is_empty_answer(answer):
-                    continue
-
-                # Store to Memory
-                content = step["format_content"](answer)
-                memory_entry = {
-                    "category": step["memory_category"],
-                    "subject": step["memory_subject"],
-                    "content": content,
-                    "confidence": 1.0,
-                    "source": "stated",
-                }
-
-                result = await self.core.memory.store(memory_entry)
-                if "error" not in result:
-                    stored_memories.append(memory_entry)
-                    logger.info(
-                        "Onboarding stored: [%s] %s",
-                        step["memory_category"],
-                        step["memory_subject"],
-                    )
+            pending_memories = []
+
+            # The answers are stored together in one transaction — in a finally,
+            # so those already given are kept if onboarding is interrupted
+            try:
+                for step in ONBOARDING_STEPS:
+                    # Personalize the prompt if we know the name
+                    prompt = step["prompt"]
+                    if user_name and "{name}" in prompt:
+                        prompt = prompt.format(name=user_name)
+
+                    # Display the question
+                    await self.core.voice_io.display("", prompt)
+                    await self.core.voice_io.speak(prompt)
+
+                    # Listen for the answer
+                    listen_result = await self.core.voice_io.listen()
+                    if "error" in listen_result:
+                        logger.error("Onboarding listen error: %s", listen_result["error"])
+                        continue
+
+                    answer = listen_result.get("text", "").strip()
+                    if not answer:
+                        continue
+
+                    # Display the user's answer
+                    await self.core.voice_io.display(answer, "")
+
+                    # Extract the user's name from the first step
+                    if step["memory_subject"] == "name":
+                        user_name = answer
+
+                    # Handle input mode preference
+                    if step.get("process_mode"):
+                        await self._process_input_mode(answer)
+
+                    # Skip storage for "nothing" answers on optional steps
+                    if step.get("skip_if_empty") and self._is_empty_answer(answer):
+                        continue
+
+                    # Queue for Memory — stored together when the steps end
+                    content = step["format_content"](answer)
+                    pending_memories.append({
+                        "category": step["memory_category"],
+                        "subject": step["memory_subject"],
+                        "content": content,
+                        "confidence": 1.0,
+                        "source": "stated",
+                    })
+            finally:
+                stored_memories = await self._store_answers(pending_memories)
 
             # Display summary
             summary = self._build_summary(user_name, stored_memories)
@@ -178,7 +209,7 @@ class OnboardingFlow:
             await self.core.voice_io.speak(summary)
 
             # Create onboarding marker so it never runs again
-            self._mark_complete()
+            await self._mark_complete()
 
             logger.info("Onboarding flow complete — %d memories stored", len(stored_memories))
 
@@ -187,17 +218,37 @@ class OnboardingFlow:
             # Do NOT mark complete on failure — onboarding should retry
             # on next boot so the user gets a fully seeded Memory
 
+    async def _store_answers(self, memory_entries: list[dict]) -> list[dict]:
+        """Store the collected answers to Memory in one transaction.
+
+        Returns the entries that were stored.
+        """
+        if not memory_entries:
+            return []
+
+        stored = []
+        results = await self.core.memory.store_many(memory_entries)
+        for memory_entry, result in zip(memory_entries, results):
+            if "error" not in result:
+                stored.append(memory_entry)
+                logger.info(
+                    "Onboarding stored: [%s] %s",
+                    memory_entry["category"],
+                    memory_entry["subject"],
+                )
+        return stored
+
     async def _process_input_mode(self, answer: str):
         """Process the user's input mode preference.
 
         Tries to detect whether the user prefers text or voice from their answer
         and sets the input mode accordingly.
         """
-        answer_lower = answer.lower()
+        words = set(_WORD.findall(answer.lower()))
 
-        if any(word in answer_lower for word in ("type", "typing", "text", "keyboard")):
+        if words & _TEXT_MODE_WORDS:
             mode = "text"
-        elif any(word in answer_lower for word in ("speak", "speaking", "voice", "talk")):
+        elif words & _VOICE_MODE_WORDS:
             mode = "voice"
         else:
             # Default to text if the answer is ambiguous
@@ -212,19 +263,7 @@ class OnboardingFlow:
 
     def _is_empty_answer(self, answer: str) -> bool:
         """Check if the user's answer is effectively empty / 'nothing'."""
-        empty_phrases = (
-            "nothing",
-            "nothing for now",
-            "no",
-            "nope",
-            "not right now",
-            "skip",
-            "that's it",
-            "that's all",
-            "none",
-            "n/a",
-        )
-        return answer.lower().strip().rstrip(".!") in empty_phrases
+        return answer.lower().strip().rstrip(".!") in _EMPTY_ANSWERS
 
     def _build_summary(self, user_name: str | None, memories: list[dict]) -> str:
         """Build a natural language summary of what was learned during onboarding."""
@@ -248,11 +287,22 @@ class OnboardingFlow:
 
         return "\n".join(summary_parts)
 
-    def _mark_complete(self):
+    async def _mark_complete(self):
         """Create the onboarding marker file to prevent re-running."""
         try:
-            with open(self._onboarding_marker, "w") as f:
-                f.write("onboarding completed\n")
+            await asyncio.to_thread(self._write_marker)
+            self._marker_exists = True
             logger.info("Onboarding marker created: %s", self._onboarding_marker)
         except OSError as e:
             logger.error("Failed to create onboarding marker: %s", e)
+
+    def _write_marker(self):
+        """Write the marker atomically. Blocking — called via asyncio.to_thread.
+
+        The content goes to a temporary file that is then renamed over the
+        marker path, so a crash mid-write never leaves a partial marker.
+        """
+        tmp_path = self._onboarding_marker + ".tmp"
+        with open(tmp_path, "w") as f:
+            f.write("onboarding completed\n")
+        os.replace(tmp_path, self._onboarding_marker)
@@ -2,22 +2,38 @@
 Context assembly for LLM calls.
 
 Before every LLM call, assembles:
-- Chitra identity and response format instructions
+- Chitra identity, capability catalog and response format instructions
 - Memory context block (user preferences, facts, relationships)
-- System state snapshot (time, date, battery)
 - Upcoming calendar events and active reminders
+- System state snapshot (time, date, battery)
 - Conversation history (last N turns)
 
 The assembled system prompt is what makes the LLM "know" the user on every call.
 """
 
+import asyncio
+import functools
 import logging
 
-from llm.prompts import CAPABILITY_CATALOG, RESPONSE_FORMAT_INSTRUCTION, SYSTEM_IDENTITY
+from llm.prompts import STATIC_SYSTEM_PREFIX
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=4)
+def _state_line(minute: str, day: str, time_of_day: str, battery: int) -> str:
+    """Build the system state sentence.
+
+    Cached by its inputs, which change at most once a minute, so every
+    assembly within the same minute reuses the identical string.
+    """
+    lines = [f"Current state: It is {time_of_day}, {day}. Time: {minute}."]
+    if battery >= 0:
+        lines.append(f"Battery: {battery}%.")
+
+    return " ".join(lines)
+
+
 class ContextAssembler:
     """Builds the full context payload injected into every LLM call."""
 
@@ -45,23 +61,36 @@ class ContextAssembler:
         """
         try:
             # Gather context from all capabilities concurrently
-            memory_ctx = await self.memory.get_context()
-            system_state = await self.system_state.get()
-            upcoming_events = await self.calendar.get_upcoming(hours_ahead=1)
-            upcoming_reminders = await self.reminders.list_upcoming(hours_ahead=1)
-
-            # Build context sections
-            sections = [SYSTEM_IDENTITY]
-
-            # Memory context block
-            memory_block = memory_ctx.get("context_block", "")
-            if memory_block:
-                sections.append(memory_block)
-
-            # System state
-            state_block = self._format_system_state(system_state)
-            if state_block:
-                sections.append(state_block)
+            results = await asyncio.gather(
+                self.memory.get_context(),
+                self.system_state.get(),
+                self.calendar.get_upcoming(hours_ahead=1),
+                self.reminders.list_upcoming(hours_ahead=1),
+                return_exceptions=True,
+            )
+
+            # A failed source leaves its section out rather than failing the whole prompt
+            memory_ctx, system_state, upcoming_events, upcoming_reminders = (
+                self._or_default(name, result, default)
+                for name, result, default in zip(
+                    ("memory", "system state", "calendar", "reminders"),
+                    results,
+                    ({}, {"error": "unavailable"}, [], []),
+                )
+            )
+
+            # Build context sections. The fixed instructions come first and the
+            # per-call context after, ordered from slowest- to fastest-changing,
+            # so consecutive prompts share the longest possible prefix and
+            # Ollama can reuse its cached KV state for it instead of
+            # re-evaluating the whole system prompt every turn.
+            sections = [STATIC_SYSTEM_PREFIX]
+
+            # Memory context — slow-changing entries first, observations after
+            for key in ("static_block", "dynamic_block"):
+                memory_block = memory_ctx.get(key, "")
+                if memory_block:
+                    sections.append(memory_block)
 
             # Upcoming events
             events_block = self._format_upcoming_events(upcoming_events)
@@ -73,11 +102,10 @@ class ContextAssembler:
             if reminders_block:
                 sections.append(reminders_block)
 
-            # Capability catalog — tells the LLM exactly what actions exist
-            sections.append(CAPABILITY_CATALOG)
-
-            # Response format instruction — always last in system prompt
-            sections.append(RESPONSE_FORMAT_INSTRUCTION)
+            # System state — changes every minute, so it goes last
+            state_block = self._format_system_state(system_state)
+            if state_block:
+                sections.append(state_block)
 
             system_prompt = "\n\n".join(sections)
 
@@ -90,28 +118,29 @@ class ContextAssembler:
             logger.error("Context assembly failed: %s", e)
             # Minimal fallback — identity + catalog + format, so the LLM can still respond
             return {
-                "system_prompt": (
-                    f"{SYSTEM_IDENTITY}\n\n{CAPABILITY_CATALOG}"
-                    f"\n\n{RESPONSE_FORMAT_INSTRUCTION}"
-                ),
+                "system_prompt": STATIC_SYSTEM_PREFIX,
                 "conversation_history": conversation_history,
             }
 
+    @staticmethod
+    def _or_default(source: str, result, default):
+        """Return a gathered result, or the default if gathering it raised."""
+        if isinstance(result, Exception):
+            logger.warning("Context source %s failed: %s", source, result)
+            return default
+        return result
+
     def _format_system_state(self, state: dict) -> str:
         """Format system state snapshot as natural language."""
         if "error" in state:
             return ""
 
-        dt = state.get("datetime", "unknown")
-        day = state.get("day_of_week", "unknown")
-        time_of_day = state.get("time_of_day", "unknown")
-        battery = state.get("battery_percent", -1)
-
-        lines = [f"Current state: It is {time_of_day}, {day}. Time: {dt[:16]}."]
-        if battery >= 0:
-            lines.append(f"Battery: {battery}%.")
-
-        return " ".join(lines)
+        return _state_line(
+            state.get("datetime", "unknown")[:16],
+            state.get("day_of_week", "unknown"),
+            state.get("time_of_day", "unknown"),
+            state.get("battery_percent", -1),
+        )
 
     def _format_upcoming_events(self, events: list[dict]) -> str:
         """Format upcoming calendar events as natural language."""
@@ -123,12 +152,9 @@ class ContextAssembler:
             title = event.get("title", "untitled")
             time = event.get("time", "")
             duration = event.get("duration_minutes", 60)
-            participants = event.get("participants", [])
-
-            entry = f"- {title} at {time} ({duration} min)"
-            if participants:
-                entry += f" with {', '.join(participants)}"
-            lines.append(entry)
+            participants = event.get("participants")
+            with_whom = f" with {', '.join(participants)}" if participants else ""
+            lines.append(f"- {title} at {time} ({duration} min){with_whom}")
 
         return "\n".join(lines)
 
@@ -138,9 +164,8 @@ class ContextAssembler:
             return ""
 
         lines = ["Upcoming reminders:"]
-        for reminder in reminders:
-            text = reminder.get("text", "")
-            trigger_at = reminder.get("trigger_at", "")
-            lines.append(f"- {text} (at {trigger_at[:16]})")
-
+        lines.extend(
+            f"- {reminder.get('text', '')} (at {reminder.get('trigger_at', '')[:16]})"
+            for reminder in reminders
+        )
         return "\n".join(lines)
@@ -12,9 +12,11 @@ Also starts the proactive background loop.
 """
 
 import asyncio
+import functools
 import inspect
 import logging
 import os
+from collections.abc import Awaitable, Callable
 
 from capabilities.calendar import Calendar
 from capabilities.contacts import Contacts
@@ -25,9 +27,25 @@ from capabilities.tasks import Tasks
 from capabilities.voice_io import VoiceIO
 from llm.client import LLMClient
 from orchestration.context import ContextAssembler
+from orchestration.speech import SpeechQueue
 
 logger = logging.getLogger(__name__)
 
+# Parameter names of actions that take the whole params dict as one argument,
+# like create(task) or create(contact)
+_SINGLE_DICT_PARAMS = frozenset({"task", "contact", "event", "reminder", "entry"})
+
+
+@functools.cache
+def _takes_single_dict(func) -> bool:
+    """Whether an action method takes its params as one dict rather than keyword args.
+
+    Cached per function, so each action's signature is inspected once rather
+    than on every call.
+    """
+    param_names = [p.name for p in inspect.signature(func).parameters.values() if p.name != "self"]
+    return len(param_names) == 1 and param_names[0] in _SINGLE_DICT_PARAMS
+
 
 class OrchestrationCore:
     """Primary Chitra process. Orchestrates all capabilities through the LLM."""
@@ -36,6 +54,7 @@ class OrchestrationCore:
         self.is_user_active = False
         self.conversation_history: list[dict] = []
         self.max_history_turns = int(os.environ.get("CHITRA_HISTORY_TURNS", "10"))
+        self.max_history_chars = int(os.environ.get("CHITRA_HISTORY_MAX_CHARS", "8000"))
 
         # Data directory — all capability databases live here
         self.data_dir = os.environ.get(
@@ -152,12 +171,21 @@ class OrchestrationCore:
                     self.is_user_active = False
                     continue
 
-                # 2. Process the input through the full pipeline
-                response_text = await self.handle_input(user_text)
+                # 2. Process the input through the full pipeline. In voice mode the
+                # reply is spoken sentence by sentence while the LLM streams it.
+                speech = SpeechQueue(self.voice_io) if self.voice_io.input_mode == "voice" else None
+                response_text = await self.handle_input(
+                    user_text,
+                    on_sentence=speech.say if speech else None,
+                    on_discard=speech.discard if speech else None,
+                )
 
-                # 3. Display and speak the response
+                # 3. Display and speak the response (or finish speaking it)
                 await self.voice_io.display(user_text, response_text)
-                await self.voice_io.speak(response_text)
+                if speech is not None and speech.started:
+                    await speech.finish()
+                else:
+                    await self.voice_io.speak(response_text)
 
                 self.is_user_active = False
 
@@ -171,7 +199,12 @@ class OrchestrationCore:
                     "", "I'm sorry, something went wrong. Let me try again.",
                 )
 
-    async def handle_input(self, user_text: str) -> str:
+    async def handle_input(
+        self,
+        user_text: str,
+        on_sentence: Callable[[str], Awaitable[None]] | None = None,
+        on_discard: Callable[[], Awaitable[None]] | None = None,
+    ) -> str:
         """Process user input through the full pipeline: context → LLM → action → response.
 
         This is the main reasoning pipeline, also used by the proactive loop
@@ -179,6 +212,11 @@ class OrchestrationCore:
 
         Args:
             user_text: the user's input text (from text or voice mode)
+            on_sentence: if given, LLM replies are streamed and each sentence of
+                the final response is passed here as soon as it is generated
+            on_discard: awaited when sentences already passed to on_sentence turn
+                out not to belong to the final response (the streamed attempt
+                was malformed and a retry produced the reply)
 
         Returns:
             The conversational response text from Chitra
@@ -189,8 +227,14 @@ class OrchestrationCore:
             context = await self.context_assembler.assemble(self.conversation_history)
             system_prompt = context["system_prompt"]
 
+            llm_call = self.llm.call
+            if on_sentence is not None:
+                llm_call = functools.partial(
+                    self.llm.call_streaming, on_sentence=on_sentence, on_discard=on_discard,
+                )
+
             # First LLM call — understand intent and decide action
-            llm_response = await self.llm.call(
+            llm_response = await llm_call(
                 system_prompt, user_text, self.conversation_history,
             )
 
@@ -200,26 +244,38 @@ class OrchestrationCore:
 
             # Execute action if the LLM decided one is needed
             if action is not None:
-                action_result = await self.execute_action(action)
-
-                if action_result is not None:
-                    # Second LLM call — incorporate action result into response
-                    followup_message = (
-                        f"The action was executed. Here is the result:\n"
-                        f"{action_result}\n\n"
-                        f"Now formulate a natural conversational response to the user "
-                        f"incorporating this result. The user's original request was: "
-                        f"{user_text}"
-                    )
-
-                    followup_response = await self.llm.call(
-                        system_prompt, followup_message, self.conversation_history,
-                    )
-                    response_text = followup_response.get("response", response_text)
-
-                    # Collect any additional memory entries from the followup
-                    followup_memories = followup_response.get("memory_store", [])
-                    memory_entries.extend(followup_memories)
+                # Store the first call's memory entries while the action and
+                # the follow-up call run, rather than after them
+                store_task = None
+                if memory_entries:
+                    store_task = asyncio.create_task(self.store_memories(memory_entries))
+                    memory_entries = []
+
+                # Awaited even if the action or follow-up fails, so the write is
+                # neither dropped nor its failure left unretrieved
+                try:
+                    action_result = await self.execute_action(action)
+
+                    if action_result is not None:
+                        # Second LLM call — incorporate action result into response
+                        followup_message = (
+                            f"The action was executed. Here is the result:\n"
+                            f"{action_result}\n\n"
+                            f"Now formulate a natural conversational response to the user "
+                            f"incorporating this result. The user's original request was: "
+                            f"{user_text}"
+                        )
+
+                        followup_response = await llm_call(
+                            system_prompt, followup_message, self.conversation_history,
+                        )
+                        response_text = followup_response.get("response", response_text)
+
+                        # Collect any additional memory entries from the followup
+                        memory_entries = followup_response.get("memory_store", [])
+                finally:
+                    if store_task is not None:
+                        await store_task
 
             # Store any new memory entries immediately
             if memory_entries:
@@ -282,20 +338,7 @@ class OrchestrationCore:
             if params and isinstance(params, dict):
                 # Detect whether the method expects a single dict argument
                 # (like create(task), create(contact)) or keyword args
-                sig = inspect.signature(method)
-                param_names = [
-                    p.name
-                    for p in sig.parameters.values()
-                    if p.name != "self"
-                ]
-
-                if len(param_names) == 1 and param_names[0] in (
-                    "task",
-                    "contact",
-                    "event",
-                    "reminder",
-                    "entry",
-                ):
+                if _takes_single_dict(getattr(method, "__func__", method)):
                     # Single-dict methods: create(task), create(contact), etc.
                     result = await method(params)
                 else:
@@ -323,17 +366,24 @@ class OrchestrationCore:
     async def store_memories(self, memory_entries: list):
         """Store new memory entries from the LLM response.
 
-        Called immediately after every successful LLM call. Each entry in
-        memory_store is passed to Memory.store().
+        Called immediately after every successful LLM call. The entries in
+        memory_store are saved together with Memory.store_many(), in one
+        transaction.
 
         Entries that fail to store are logged but do not interrupt the flow.
         """
+        entries = []
         for entry in memory_entries:
-            if not isinstance(entry, dict):
+            if isinstance(entry, dict):
+                entries.append(entry)
+            else:
                 logger.warning("Skipping invalid memory entry: %s", entry)
-                continue
 
-            result = await self.memory.store(entry)
+        if not entries:
+            return
+
+        results = await self.memory.store_many(entries)
+        for entry, result in zip(entries, results):
             if "error" in result:
                 logger.warning(
                     "Failed to store memory entry: %s — %s",
@@ -350,16 +400,26 @@ class OrchestrationCore:
     def _update_history(self, user_text: str, chitra_text: str):
         """Append the latest exchange to conversation history.
 
-        Maintains a sliding window of the last N turns (from CHITRA_HISTORY_TURNS).
-        Each turn is a pair of user + assistant messages.
+        Maintains a sliding window of the last N turns (from CHITRA_HISTORY_TURNS),
+        further trimmed so the kept messages total at most CHITRA_HISTORY_MAX_CHARS
+        characters. The latest turn is always kept. Each turn is a pair of user +
+        assistant messages. The list is trimmed in place.
         """
-        self.conversation_history.append({"role": "user", "content": user_text})
-        self.conversation_history.append({"role": "assistant", "content": chitra_text})
+        history = self.conversation_history
+        history.append({"role": "user", "content": user_text})
+        history.append({"role": "assistant", "content": chitra_text})
 
         # Trim to max_history_turns * 2 messages (each turn = 2 messages)
         max_messages = self.max_history_turns * 2
-        if len(self.conversation_history) > max_messages:
-            self.conversation_history = self.conversation_history[-max_messages:]
+        if len(history) > max_messages:
+            del history[:-max_messages]
+
+        # A few very long turns should not crowd the prompt either — drop
+        # the oldest turns until the rest fit the character budget
+        total_chars = sum(len(message["content"]) for message in history)
+        while total_chars > self.max_history_chars and len(history) > 2:
+            total_chars -= len(history[0]["content"]) + len(history[1]["content"])
+            del history[:2]
 
     async def _shutdown(self):
         """Clean shutdown — cancel background tasks, close connections."""
@@ -373,7 +433,16 @@ class OrchestrationCore:
             except asyncio.CancelledError:
                 pass
 
+        # Stop any unfinished voice model warm-up
+        await self.voice_io.aclose()
+
         # Close LLM client
         await self.llm.close()
 
+        # Close pooled capability database connections and system state files
+        for capability in (
+            self.memory, self.contacts, self.calendar, self.reminders, self.tasks, self.system_state,
+        ):
+            capability.close()
+
         logger.info("Chitra shutdown complete")
@@ -10,17 +10,30 @@ On every tick:
 6. If yes, formulate message and speak/display
 7. If no, sleep until next tick
 
+A context identical to the one the LLM last decided on is not sent again
+until REEVALUATE_SECONDS have passed, so an unchanged overdue task or
+upcoming event costs a few queries per tick rather than an LLM call. A
+context with fired reminders is always sent.
+
+While the user is idle, each tick also checkpoints the capability databases'
+write-ahead logs, so commits during conversation rarely have to.
+
 Never interrupts an active conversation (checks is_user_active flag).
 """
 
 import asyncio
 import logging
 import os
+import time
 
 from llm.prompts import PROACTIVE_PROMPT_TEMPLATE
 
 logger = logging.getLogger(__name__)
 
+# An unchanged context is re-evaluated at most this often, so a decision not
+# to speak can change as the day moves on
+REEVALUATE_SECONDS = 30 * 60
+
 
 class ProactiveLoop:
     """Background loop that surfaces relevant information unprompted."""
@@ -29,6 +42,10 @@ class ProactiveLoop:
         self.core = core
         self.interval = int(os.environ.get("CHITRA_PROACTIVE_INTERVAL", "60"))
 
+        # Context description last sent to the LLM, and when
+        self._last_context: str | None = None
+        self._last_evaluated_at = 0.0
+
     async def run(self):
         """Run the proactive loop indefinitely.
 
@@ -43,6 +60,8 @@ class ProactiveLoop:
             try:
                 await asyncio.sleep(self.interval)
                 await self.tick()
+                if not self.core.is_user_active:
+                    await self._checkpoint_databases()
             except asyncio.CancelledError:
                 logger.info("Proactive loop cancelled — shutting down")
                 break
@@ -63,7 +82,7 @@ class ProactiveLoop:
 
         try:
             # Gather proactive context from all relevant capabilities
-            context_parts = await self._gather_proactive_context()
+            context_parts, fired = await self._gather_proactive_context()
 
             if not context_parts:
                 # Nothing to evaluate — no fired reminders, no upcoming events, etc.
@@ -73,6 +92,17 @@ class ProactiveLoop:
             # Build the proactive context description
             context_description = "\n".join(context_parts)
 
+            # Skip the LLM call if this exact context was evaluated recently.
+            # Fired reminders are one-shot, so a context with any is always asked.
+            now = time.monotonic()
+            if (
+                not fired
+                and context_description == self._last_context
+                and now - self._last_evaluated_at < REEVALUATE_SECONDS
+            ):
+                logger.debug("Proactive tick — context unchanged since last evaluation")
+                return
+
             # Build the proactive prompt
             proactive_message = PROACTIVE_PROMPT_TEMPLATE.format(
                 context=context_description,
@@ -87,6 +117,15 @@ class ProactiveLoop:
             # Lightweight LLM call — should we speak?
             llm_response = await self.core.llm.call(system_prompt, proactive_message)
 
+            # Only a real decision counts as evaluated. The fallback reply (e.g.
+            # Ollama unreachable) carries no should_speak, so ask again next tick.
+            if "should_speak" not in llm_response:
+                logger.debug("Proactive tick — no decision from the LLM")
+                self._last_context = None
+                return
+            self._last_context = context_description
+            self._last_evaluated_at = now
+
             should_speak = llm_response.get("should_speak", False)
             response_text = llm_response.get("response", "")
 
@@ -96,6 +135,8 @@ class ProactiveLoop:
                     logger.info(
                         "Proactive message ready but user became active — skipping",
                     )
+                    # Not delivered, so evaluate the same context again next tick
+                    self._last_context = None
                     return
 
                 logger.info("Proactive message: %s", response_text[:80])
@@ -105,7 +146,7 @@ class ProactiveLoop:
                 await self.core.voice_io.speak(response_text)
 
                 # Dismiss any fired reminders that were surfaced
-                await self._dismiss_fired_reminders()
+                await self._dismiss_fired_reminders(fired)
 
                 # Store any memory entries from the proactive LLM call
                 memory_entries = llm_response.get("memory_store", [])
@@ -116,93 +157,117 @@ class ProactiveLoop:
 
         except Exception as e:
             logger.error("Proactive tick error: %s", e)
+            self._last_context = None
+
+    async def _checkpoint_databases(self):
+        """Checkpoint each capability database's WAL while nothing else is happening."""
+        for capability in (
+            self.core.memory, self.core.contacts, self.core.calendar,
+            self.core.reminders, self.core.tasks,
+        ):
+            try:
+                await capability.checkpoint()
+            except Exception as e:
+                logger.error("Proactive: failed to checkpoint storage: %s", e)
 
-    async def _gather_proactive_context(self) -> list[str]:
+    async def _gather_proactive_context(self) -> tuple[list[str], list[dict]]:
         """Gather context from capabilities for proactive evaluation.
 
-        Returns a list of natural language context strings. Returns an empty
-        list if there's nothing noteworthy to evaluate.
-        """
-        parts = []
-
-        # 1. Fired reminders — reminders whose trigger_at has passed
-        try:
-            fired = await self.core.reminders.get_fired()
-            if fired:
-                lines = ["Triggered reminders:"]
-                for r in fired:
-                    text = r.get("text", "")
-                    trigger_at = r.get("trigger_at", "")[:16]
-                    lines.append(f"- {text} (was due at {trigger_at})")
-                parts.append("\n".join(lines))
-        except Exception as e:
-            logger.error("Proactive: failed to check reminders: %s", e)
-
-        # 2. Upcoming calendar events (within 1 hour)
-        try:
-            upcoming = await self.core.calendar.get_upcoming(hours_ahead=1)
-            if upcoming:
-                lines = ["Upcoming events (next hour):"]
-                for event in upcoming:
-                    title = event.get("title", "untitled")
-                    time = event.get("time", "")
-                    duration = event.get("duration_minutes", 60)
-                    participants = event.get("participants", [])
-
-                    entry = f"- {title} at {time} ({duration} min)"
-                    if participants:
-                        entry += f" with {', '.join(participants)}"
-                    lines.append(entry)
-                parts.append("\n".join(lines))
-        except Exception as e:
-            logger.error("Proactive: failed to check calendar: %s", e)
-
-        # 3. Neglected contacts (no interaction in 3+ days)
-        try:
-            neglected = await self.core.contacts.get_neglected(days_threshold=3)
-            if neglected:
-                lines = ["People you haven't been in touch with recently:"]
-                for contact in neglected[:3]:  # Limit to top 3 to avoid overload
-                    name = contact.get("name", "unknown")
-                    relationship = contact.get("relationship", "")
-                    last = contact.get("last_interaction", "unknown")
-                    entry = f"- {name}"
-                    if relationship:
-                        entry += f" ({relationship})"
-                    entry += f" — last interaction: {last}"
-                    lines.append(entry)
-                parts.append("\n".join(lines))
-        except Exception as e:
-            logger.error("Proactive: failed to check contacts: %s", e)
-
-        # 4. Overdue tasks
-        try:
-            overdue = await self.core.tasks.get_overdue()
-            if overdue:
-                lines = ["Overdue tasks:"]
-                for task in overdue:
-                    title = task.get("title", "untitled")
-                    due = task.get("due_date", "unknown")
-                    priority = task.get("priority", "normal")
-                    lines.append(f"- {title} (due: {due}, priority: {priority})")
-                parts.append("\n".join(lines))
-        except Exception as e:
-            logger.error("Proactive: failed to check tasks: %s", e)
+        The four sources are independent, so they are queried concurrently.
+        A failing source is logged and skipped without losing the others.
 
-        return parts
+        Returns a list of natural language context strings, empty if there's
+        nothing noteworthy to evaluate, and the fired reminders they describe,
+        so the ones surfaced can be dismissed without querying again.
+        """
+        sources = (
+            ("reminders", self._format_fired_reminders),
+            ("calendar", self._format_upcoming_events),
+            ("contacts", self._format_neglected_contacts),
+            ("tasks", self._format_overdue_tasks),
+        )
+        results = await asyncio.gather(
+            self.core.reminders.get_fired(),
+            self.core.calendar.get_upcoming(hours_ahead=1),
+            self.core.contacts.get_neglected(days_threshold=3),
+            self.core.tasks.get_overdue(),
+            return_exceptions=True,
+        )
 
-    async def _dismiss_fired_reminders(self):
-        """Dismiss all fired reminders after they have been surfaced.
+        parts = []
+        for (source, formatter), result in zip(sources, results):
+            if isinstance(result, Exception):
+                logger.error("Proactive: failed to check %s: %s", source, result)
+            elif result:
+                parts.append(formatter(result))
+
+        fired = results[0] if isinstance(results[0], list) else []
+        return parts, fired
+
+    @staticmethod
+    def _format_fired_reminders(fired: list[dict]) -> str:
+        """Describe reminders whose trigger_at has passed."""
+        lines = ["Triggered reminders:"]
+        for r in fired:
+            text = r.get("text", "")
+            trigger_at = r.get("trigger_at", "")[:16]
+            lines.append(f"- {text} (was due at {trigger_at})")
+        return "\n".join(lines)
+
+    @staticmethod
+    def _format_upcoming_events(upcoming: list[dict]) -> str:
+        """Describe calendar events within the next hour."""
+        lines = ["Upcoming events (next hour):"]
+        for event in upcoming:
+            title = event.get("title", "untitled")
+            time = event.get("time", "")
+            duration = event.get("duration_minutes", 60)
+            participants = event.get("participants", [])
+
+            entry = f"- {title} at {time} ({duration} min)"
+            if participants:
+                entry += f" with {', '.join(participants)}"
+            lines.append(entry)
+        return "\n".join(lines)
+
+    @staticmethod
+    def _format_neglected_contacts(neglected: list[dict]) -> str:
+        """Describe contacts with no interaction in 3+ days."""
+        lines = ["People you haven't been in touch with recently:"]
+        for contact in neglected[:3]:  # Limit to top 3 to avoid overload
+            name = contact.get("name", "unknown")
+            relationship = contact.get("relationship", "")
+            last = contact.get("last_interaction", "unknown")
+            entry = f"- {name}"
+            if relationship:
+                entry += f" ({relationship})"
+            entry += f" — last interaction: {last}"
+            lines.append(entry)
+        return "\n".join(lines)
+
+    @staticmethod
+    def _format_overdue_tasks(overdue: list[dict]) -> str:
+        """Describe tasks past their due date."""
+        lines = ["Overdue tasks:"]
+        for task in overdue:
+            title = task.get("title", "untitled")
+            due = task.get("due_date", "unknown")
+            priority = task.get("priority", "normal")
+            lines.append(f"- {title} (due: {due}, priority: {priority})")
+        return "\n".join(lines)
+
+    async def _dismiss_fired_reminders(self, fired: list[dict]):
+        """Dismiss the fired reminders gathered this tick after they have been surfaced.
 
         Called after the proactive message is displayed/spoken, so the
-        reminders don't fire again on the next tick.
+        reminders don't fire again on the next tick. A reminder that fired
+        after the context was gathered was not mentioned, so it is left for
+        the next tick.
         """
+        reminder_ids = [r["id"] for r in fired if r.get("id")]
         try:
-            fired = await self.core.reminders.get_fired()
-            for reminder in fired:
-                reminder_id = reminder.get("id")
-                if reminder_id:
-                    await self.core.reminders.dismiss(reminder_id)
-                    logger.info("Auto-dismissed fired reminder: %s", reminder_id)
+            await asyncio.gather(*(self.core.reminders.dismiss(i) for i in reminder_ids))
+            for reminder_id in reminder_ids:
+                logger.info("Auto-dismissed fired reminder: %s", reminder_id)
         except Exception as e:
             logger.error("Failed to dismiss fired reminders: %s", e)
@@ -0,0 +1,69 @@
+"""
+Speech queue — speaks a reply sentence by sentence while it is still being generated.
+
+The conversation loop hands SpeechQueue.say to the LLM client's streaming
+call. Each sentence is queued and spoken in order by a background task, so
+TTS for the first sentence overlaps generation of the rest. finish() waits
+until everything queued has been spoken, so the next listen() never picks
+up Chitra's own voice. discard() drops what is still queued when the
+streamed attempt is rejected and the reply comes from a retry instead.
+"""
+
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class SpeechQueue:
+    """Speaks queued sentences in order on a background task."""
+
+    def __init__(self, voice_io):
+        self.voice_io = voice_io
+        self.started = False
+        self._queue: asyncio.Queue[str] = asyncio.Queue()
+        self._task: asyncio.Task | None = None
+
+    async def say(self, sentence: str):
+        """Queue a sentence to be spoken after any already queued."""
+        self.started = True
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        self._queue.put_nowait(sentence)
+
+    async def finish(self):
+        """Wait until every queued sentence has been spoken, then stop the task."""
+        if self._task is None:
+            return
+
+        await self._queue.join()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+    async def discard(self):
+        """Drop sentences not yet spoken and wait for the current one to end.
+
+        Used when the streamed reply turns out not to be the real one. The
+        queue is left unstarted, so the replacement can be spoken in full or
+        streamed again from the start.
+        """
+        while not self._queue.empty():
+            self._queue.get_nowait()
+            self._queue.task_done()
+        await self.finish()
+        self._task = None
+        self.started = False
+
+    async def _run(self):
+        """Speak sentences as they are queued. Runs until finish() cancels it."""
+        while True:
+            sentence = await self._queue.get()
+            try:
+                await self.voice_io.speak(sentence)
+            except Exception as e:
+                logger.error("Failed to speak queued sentence: %s", e)
+            finally:
+                self._queue.task_done()
@@ -125,8 +125,8 @@ async def seed_contacts(data_dir: str) -> dict:
         "Priya": 0,  # today
     }
 
-    for data in contact_data:
-        result = await contacts.create(data)
+    results = await contacts.create_many(contact_data)
+    for data, result in zip(contact_data, results):
         if "error" in result:
             logger.error("Failed to create contact %s: %s", data["name"], result["error"])
             continue
@@ -174,8 +174,8 @@ async def seed_calendar(data_dir: str):
         },
     ]
 
-    for event in events:
-        result = await calendar.create(event)
+    results = await calendar.create_many(events)
+    for event, result in zip(events, results):
         if "error" in result:
             logger.error("Failed to create event: %s", result["error"])
         else:
@@ -226,8 +226,8 @@ async def seed_tasks(data_dir: str):
         },
     ]
 
-    for task in task_data:
-        result = await tasks.create(task)
+    results = await tasks.create_many(task_data)
+    for task, result in zip(task_data, results):
         if "error" in result:
             logger.error("Failed to create task: %s", result["error"])
         else:
@@ -324,8 +324,8 @@ async def seed_memory(data_dir: str, contacts: dict):
 
     all_memories = onboarding_memories + demo_memories
 
-    for entry in all_memories:
-        result = await memory.store(entry)
+    results = await memory.store_many(all_memories)
+    for entry, result in zip(all_memories, results):
         if "error" in result:
             logger.error("Failed to store memory: %s", result["error"])
         else:
@@ -9,7 +9,7 @@ import logging
 import os
 import sqlite3
 
-from storage.schema import SCHEMAS
+from storage.schema import INDEXES, SCHEMAS
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +29,8 @@ def setup_storage():
         db_path = os.path.join(data_dir, db_filename)
         conn = sqlite3.connect(db_path)
         conn.execute(schema_sql)
+        for index_sql in INDEXES.get(capability_name, ()):
+            conn.execute(index_sql)
         conn.commit()
         conn.close()
         logger.info("Initialized: %s → %s", capability_name, db_path)
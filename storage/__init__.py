@@ -1 +1 @@
-"""Storage layer — SQLite schema definitions."""
+"""Storage layer — SQLite schema definitions and connection pooling."""
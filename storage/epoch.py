@@ -0,0 +1,57 @@
+"""
+Epoch-second conversion matching SQLite's strftime('%s', ...).
+
+Timestamps are stored as naive local ISO text. SQLite reads such a string
+as if it were UTC, so comparison values are converted the same way — the
+wall-clock fields are taken as UTC — rather than through the local zone.
+Values with a UTC offset are normalized to naive local time before storage.
+"""
+
+import calendar
+import time
+from datetime import date, datetime, timedelta
+
+# (valid_until, today_start, tomorrow_start) — see today_range()
+_today_cache = (0.0, 0, 0)
+
+
+def epoch_seconds(value: date) -> int:
+    """Return the whole epoch seconds SQLite's strftime('%s', ...) gives for value.
+
+    Accepts a date (midnight) or a naive datetime (fraction truncated).
+    """
+    return calendar.timegm(value.timetuple())
+
+
+def to_local_naive(value: str | None) -> str | None:
+    """Convert an ISO datetime with a UTC offset to naive local time.
+
+    Stored times are compared as epoch seconds of the wall-clock time, and
+    SQLite would otherwise shift an offset-bearing value to UTC. Anything
+    else (naive times, dates, unparseable text, None) is returned as given.
+    """
+    try:
+        parsed = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return value
+    if parsed.tzinfo is None:
+        return value
+    return parsed.astimezone().replace(tzinfo=None).isoformat()
+
+
+def today_range() -> tuple[int, int]:
+    """Return epoch_seconds of the start of today and of tomorrow, by local date.
+
+    The pair is cached until local midnight, so the proactive tick's repeated
+    "what is today" lookups cost a single time.time() comparison.
+    """
+    global _today_cache
+    valid_until, start, end = _today_cache
+    if time.time() < valid_until:
+        return start, end
+
+    today = date.today()
+    tomorrow = today + timedelta(days=1)
+    start, end = epoch_seconds(today), epoch_seconds(tomorrow)
+    _today_cache = (datetime.combine(tomorrow, datetime.min.time()).timestamp(), start, end)
+    return start, end
@@ -0,0 +1,29 @@
+"""
+Record ID generation for capability tables.
+
+IDs stay opaque TEXT primary keys — existing databases and the LLM's action
+params already carry string IDs — but are built from a random per-process
+prefix plus a counter instead of a fresh uuid4 per row. Only process start
+(and any fork) reads the random device; each new ID is a counter increment.
+"""
+
+import itertools
+import os
+
+
+def _reseed():
+    """Draw a new random prefix and restart the counter."""
+    global _prefix, _counter
+    _prefix = os.urandom(8).hex()
+    _counter = itertools.count()
+
+
+_reseed()
+
+# A forked child would otherwise hand out the parent's IDs
+os.register_at_fork(after_in_child=_reseed)
+
+
+def new_id() -> str:
+    """Return a new unique record ID."""
+    return f"{_prefix}-{next(_counter):08x}"
@@ -0,0 +1,139 @@
+"""
+SQLite connection pool for capability databases.
+
+Each capability owns one pool over its own database file. The pool holds a
+single write connection (SQLite serializes writers anyway) and up to
+max_size read connections. Connections are opened lazily, configured once
+with CONNECTION_PRAGMAS, and reused for the life of the process, so
+individual actions no longer pay the open + PRAGMA setup cost.
+
+Connections are opened with check_same_thread=False so a borrowed
+connection may be used from a worker thread. Capability actions decorated
+with run_in_thread do exactly that, keeping SQLite work off the event loop.
+"""
+
+import asyncio
+import functools
+import logging
+import queue
+import sqlite3
+import threading
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+
+from storage.schema import CONNECTION_PRAGMAS, WAL_CHECKPOINT_PRAGMA
+
+logger = logging.getLogger(__name__)
+
+# Read connections per database — reads never block each other under WAL
+DEFAULT_MAX_SIZE = 4
+
+# Prepared statements kept per connection. Long-lived pooled connections see
+# every fixed query plus the dynamic UPDATE variants, so keep more than the
+# driver's default of 128 to avoid re-preparing on the hot paths.
+STATEMENT_CACHE_SIZE = 256
+
+
+def run_in_thread(func: Callable[..., object]) -> Callable[..., Awaitable[object]]:
+    """Expose a blocking database method as a coroutine run on a worker thread.
+
+    The wrapped method keeps its name and signature, so callers (and the
+    orchestration core's signature-based dispatch) still await it as before.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+    return wrapper
+
+
+class ConnectionPool:
+    """One long-lived write connection plus a bounded set of read connections."""
+
+    def __init__(self, db_path: str, max_size: int = DEFAULT_MAX_SIZE):
+        self.db_path = db_path
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._idle = {True: queue.Queue(maxsize=1), False: queue.Queue(maxsize=max_size)}
+        self._opened = {True: 0, False: 0}
+
+    def _open(self) -> sqlite3.Connection:
+        """Open and configure a new connection to the pool's database."""
+        conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        conn.row_factory = sqlite3.Row
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def _acquire(self, write: bool) -> sqlite3.Connection:
+        """Take an idle connection, opening a new one while under the limit."""
+        idle = self._idle[write]
+        try:
+            return idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        limit = 1 if write else self.max_size
+        with self._lock:
+            can_open = self._opened[write] < limit
+            if can_open:
+                self._opened[write] += 1
+
+        if not can_open:
+            return idle.get()
+
+        try:
+            return self._open()
+        except sqlite3.Error:
+            with self._lock:
+                self._opened[write] -= 1
+            raise
+
+    @contextmanager
+    def connection(self, write: bool = False) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection for the duration of a with-block.
+
+        write=True yields the single write connection. Any transaction left
+        open when the block exits (uncommitted or failed) is rolled back so
+        the connection goes back to the pool clean.
+        """
+        conn = self._acquire(write)
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self._idle[write].put(conn)
+
+    def checkpoint(self) -> bool:
+        """Run a passive WAL checkpoint on the write connection if it is idle.
+
+        Returns False without waiting when the writer is busy or not yet
+        open; the next idle call (or SQLite's autocheckpoint) catches up.
+        """
+        idle = self._idle[True]
+        try:
+            conn = idle.get_nowait()
+        except queue.Empty:
+            return False
+        try:
+            conn.execute(WAL_CHECKPOINT_PRAGMA)
+        finally:
+            idle.put(conn)
+        return True
+
+    def close(self):
+        """Close every idle connection. Call on shutdown."""
+        for write, idle in self._idle.items():
+            while True:
+                try:
+                    conn = idle.get_nowait()
+                except queue.Empty:
+                    break
+                conn.close()
+                with self._lock:
+                    self._opened[write] -= 1
+        logger.debug("Connection pool closed: %s", self.db_path)
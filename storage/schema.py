@@ -6,6 +6,34 @@ Schema is initialized by scripts/setup_storage.py.
 All paths come from CHITRA_DATA_DIR environment variable.
 """
 
+import sqlite3
+
+# Appended to INSERT/UPDATE so the written row comes back in the same statement.
+# RETURNING needs SQLite 3.35+; on older builds this is empty, the statement yields
+# no row, and callers fall back to a SELECT by id.
+RETURNING_ALL = " RETURNING *" if sqlite3.sqlite_version_info >= (3, 35, 0) else ""
+
+# WAL lets readers proceed while a write is in flight and avoids a full fsync
+# per commit. journal_mode is persistent in the database file, so it is set
+# once at init; it cannot be enabled on an in-memory database.
+JOURNAL_MODE_PRAGMA = "PRAGMA journal_mode=WAL"
+
+# Per-connection tuning — these do not persist and must be applied on every connect.
+# wal_autocheckpoint is raised from the default 1000 pages so a commit rarely
+# pays for a checkpoint inline; WAL_CHECKPOINT_PRAGMA is run when idle instead.
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA wal_autocheckpoint=10000",
+)
+
+# PASSIVE copies as much of the WAL back as it can without waiting on readers
+# or the writer, so it is safe to run alongside any other database work
+WAL_CHECKPOINT_PRAGMA = "PRAGMA wal_checkpoint(PASSIVE)"
+
 CONTACTS_SCHEMA = """
 CREATE TABLE IF NOT EXISTS contacts (
     id TEXT PRIMARY KEY,
@@ -27,7 +55,7 @@ CREATE TABLE IF NOT EXISTS events (
     time TEXT NOT NULL,
     duration_minutes INTEGER DEFAULT 60,
     notes TEXT DEFAULT '',
-    participants TEXT DEFAULT '[]'
+    participants TEXT DEFAULT '[]' CHECK(json_valid(participants))
 );
 """
 
@@ -69,6 +97,74 @@ CREATE TABLE IF NOT EXISTS memories (
 );
 """
 
+# Full-text index over memory subject/content for Memory.search. External-content
+# FTS5 table kept in sync by triggers; soft deletes leave the row in place, so only
+# subject/content changes are mirrored. Created by Memory._init_db, which also
+# rebuilds the index when it is added to an existing database.
+MEMORY_FTS_SCHEMA = (
+    """CREATE VIRTUAL TABLE IF NOT EXISTS memories_fts USING fts5(
+        subject, content,
+        content='memories', content_rowid='rowid',
+        tokenize='unicode61 remove_diacritics 2'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS memories_ai AFTER INSERT ON memories BEGIN
+        INSERT INTO memories_fts(rowid, subject, content)
+        VALUES (new.rowid, new.subject, new.content);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS memories_ad AFTER DELETE ON memories BEGIN
+        INSERT INTO memories_fts(memories_fts, rowid, subject, content)
+        VALUES ('delete', old.rowid, old.subject, old.content);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS memories_au AFTER UPDATE OF subject, content ON memories BEGIN
+        INSERT INTO memories_fts(memories_fts, rowid, subject, content)
+        VALUES ('delete', old.rowid, old.subject, old.content);
+        INSERT INTO memories_fts(rowid, subject, content)
+        VALUES (new.rowid, new.subject, new.content);
+    END""",
+)
+
+# Integer epoch seconds of the ISO timestamp columns. The columns stay ISO text
+# for the Python API; range filters compare these expressions instead so the
+# expression indexes below are probed with integer compares. Queries must use
+# the exact same expression text for SQLite to pick the index.
+LAST_INTERACTION_EPOCH = "CAST(strftime('%s', last_interaction) AS INTEGER)"
+LAST_REFERENCED_EPOCH = "CAST(strftime('%s', last_referenced) AS INTEGER)"
+
+# Indexes superseded by the epoch expression indexes are dropped first
+CONTACTS_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_contacts_name ON contacts(name COLLATE NOCASE)",
+    "DROP INDEX IF EXISTS idx_contacts_last_interaction",
+    f"CREATE INDEX IF NOT EXISTS idx_contacts_last_interaction_epoch ON contacts({LAST_INTERACTION_EPOCH})",
+)
+
+CALENDAR_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_events_date_time ON events(date, time)",
+)
+
+TRIGGER_AT_EPOCH = "CAST(strftime('%s', trigger_at) AS INTEGER)"
+DUE_DATE_EPOCH = "CAST(strftime('%s', due_date) AS INTEGER)"
+
+# Equality on status, then a range on the epoch time: the proactive loop's
+# get_fired / get_overdue queries walk these in order without a sort
+REMINDERS_INDEXES = (
+    "DROP INDEX IF EXISTS idx_reminders_status_trigger",
+    f"""CREATE INDEX IF NOT EXISTS idx_reminders_status_trigger_epoch
+       ON reminders(status, {TRIGGER_AT_EPOCH})""",
+)
+
+TASKS_INDEXES = (
+    "DROP INDEX IF EXISTS idx_tasks_status_due",
+    f"CREATE INDEX IF NOT EXISTS idx_tasks_status_due_epoch ON tasks(status, {DUE_DATE_EPOCH})",
+)
+
+# The composite index matches the context window filter in Memory.get_context
+MEMORY_INDEXES = (
+    "DROP INDEX IF EXISTS idx_memories_active_category",
+    f"""CREATE INDEX IF NOT EXISTS idx_memories_context
+       ON memories(active, category, confidence, {LAST_REFERENCED_EPOCH})""",
+    "CREATE INDEX IF NOT EXISTS idx_memories_subject ON memories(subject)",
+)
+
 # Map of capability name to (database filename, schema SQL)
 SCHEMAS = {
     "contacts": ("contacts.db", CONTACTS_SCHEMA),
@@ -77,3 +173,12 @@ SCHEMAS = {
     "tasks": ("tasks.db", TASKS_SCHEMA),
     "memory": ("memory.db", MEMORY_SCHEMA),
 }
+
+# Map of capability name to the CREATE INDEX statements for its database
+INDEXES = {
+    "contacts": CONTACTS_INDEXES,
+    "calendar": CALENDAR_INDEXES,
+    "reminders": REMINDERS_INDEXES,
+    "tasks": TASKS_INDEXES,
+    "memory": MEMORY_INDEXES,
+}
@@ -7,7 +7,10 @@ Tests each capability's:
 - Edge cases specific to each capability
 """
 
+import asyncio
 import os
+import threading
+import wave
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -17,7 +20,7 @@ os.environ["CHITRA_DATA_DIR"] = "/tmp/chitra_test_capabilities"
 
 from capabilities.calendar import Calendar
 from capabilities.contacts import Contacts
-from capabilities.reminders import Reminders
+from capabilities.reminders import GET_FIRED_SQL, Reminders
 from capabilities.system_state import SystemState
 from capabilities.tasks import Tasks
 from capabilities.voice_io import VoiceIO
@@ -75,6 +78,26 @@ class TestContacts:
         result = await contacts.create({"relationship": "friend"})
         assert "error" in result
 
+    @pytest.mark.asyncio
+    async def test_create_many(self, contacts):
+        """create_many stores valid contacts and reports invalid ones in place."""
+        results = await contacts.create_many([
+            {"name": "Amma", "relationship": "mother"},
+            {"relationship": "friend"},
+            {"name": "Ravi"},
+        ])
+        assert [r.get("name") for r in results] == ["Amma", None, "Ravi"]
+        assert "error" in results[1]
+        assert [c["name"] for c in await contacts.list()] == ["Amma", "Ravi"]
+
+
+    @pytest.mark.asyncio
+    async def test_create_many_storage_failure_keeps_validation_errors(self, contacts):
+        """A failed write reports storage failure only for contacts that passed validation."""
+        with patch("capabilities.contacts.INSERT_CONTACT_SQL", "INSERT INTO missing VALUES (?)"):
+            results = await contacts.create_many([{"name": "Amma"}, {"relationship": "friend"}])
+        assert "Storage failure" in results[0]["error"]
+        assert "Storage failure" not in results[1]["error"]
     # ── Get ───────────────────────────────────────────────────────
 
     @pytest.mark.asyncio
@@ -101,12 +124,31 @@ class TestContacts:
         assert result is not None
         assert result["name"] == "Amma"
 
+    @pytest.mark.asyncio
+    async def test_get_prefers_prefix_match(self, contacts):
+        """Get returns a name that starts with the query over a mid-name match."""
+        await contacts.create({"name": "Sravi"})
+        await contacts.create({"name": "Ravi"})
+        result = await contacts.get("ravi")
+        assert result["name"] == "Ravi"
+
     @pytest.mark.asyncio
     async def test_get_not_found(self, contacts):
         """Get returns None when no match."""
         result = await contacts.get("Nobody")
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_get_prefix_match_beats_earlier_substring_match(self, contacts):
+        """A prefix match wins even over an earlier-created substring match; the substring scan is the fallback."""
+        await contacts.create({"name": "Joanna"})
+        await contacts.create({"name": "Anna Lee"})
+        result = await contacts.get(name="anna")
+        assert result["name"] == "Anna Lee"
+
+        result = await contacts.get(name="oann")
+        assert result["name"] == "Joanna"
+
     # ── List ──────────────────────────────────────────────────────
 
     @pytest.mark.asyncio
@@ -157,6 +199,16 @@ class TestContacts:
         assert "error" in result
         assert "not found" in result["error"]
 
+    @pytest.mark.asyncio
+    async def test_update_without_returning(self, contacts):
+        """Update reads the row back when SQLite lacks RETURNING."""
+        created = await contacts.create({"name": "Amma"})
+        with patch("capabilities.contacts.RETURNING_ALL", ""):
+            result = await contacts.update(created["id"], {"phone": "+91-1234"})
+            missing = await contacts.update("nonexistent-id", {"name": "New"})
+        assert result["phone"] == "+91-1234"
+        assert "not found" in missing["error"]
+
     # ── Note interaction ──────────────────────────────────────────
 
     @pytest.mark.asyncio
@@ -219,6 +271,17 @@ class TestContacts:
         assert len(result) == 2
         assert result[0]["name"] == "Older"
 
+    # ── Storage ───────────────────────────────────────────────────
+
+    def test_database_uses_wal(self, contacts):
+        """Contacts database is initialized in WAL journal mode."""
+        import sqlite3
+
+        conn = sqlite3.connect(contacts.db_path)
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        conn.close()
+        assert mode == "wal"
+
 
 # ═══════════════════════════════════════════════════════════════════
 # Calendar
@@ -290,6 +353,29 @@ class TestCalendar:
         result = await calendar.create({"title": "Meeting", "date": "2026-02-22"})
         assert "error" in result
 
+    @pytest.mark.asyncio
+    async def test_create_many(self, calendar):
+        """create_many stores valid events in one call and reports invalid ones in place."""
+        results = await calendar.create_many([
+            {"title": "Standup", "date": "2026-02-22", "time": "09:00", "participants": ["Priya"]},
+            {"title": "No time", "date": "2026-02-22"},
+            {"title": "Lunch", "date": "2026-02-22", "time": "13:00"},
+        ])
+        assert "error" in results[1]
+        assert results[0]["participants"] == ["Priya"]
+        assert results[2]["duration_minutes"] == 60
+        stored = await calendar.get_range("2026-02-22", "2026-02-22")
+        assert [e["title"] for e in stored] == ["Standup", "Lunch"]
+
+    @pytest.mark.asyncio
+    async def test_create_many_returns_stored_row(self, calendar):
+        """Each create_many result is the row as stored, the same as create() returns."""
+        event = {"title": "Walk", "date": "2026-02-22", "time": "07:00", "duration_minutes": "45"}
+        single = await calendar.create(event)
+        [bulk] = await calendar.create_many([event])
+        assert bulk["duration_minutes"] == 45
+        assert {**bulk, "id": None} == {**single, "id": None}
+
     # ── Get today ─────────────────────────────────────────────────
 
     @pytest.mark.asyncio
@@ -368,6 +454,40 @@ class TestCalendar:
         result = await calendar.get_upcoming(hours_ahead=1)
         assert result == []
 
+    @pytest.mark.asyncio
+    async def test_get_upcoming_across_midnight(self, calendar):
+        """get_upcoming spans the date boundary when the window crosses midnight."""
+        await calendar.create({"title": "Late", "date": "2026-03-01", "time": "23:50"})
+        await calendar.create({"title": "Early", "date": "2026-03-02", "time": "00:20"})
+        await calendar.create({"title": "Too late", "date": "2026-03-02", "time": "01:00"})
+        await calendar.create({"title": "Too early", "date": "2026-03-01", "time": "23:00"})
+        with patch("capabilities.calendar.datetime") as mock_dt:
+            mock_dt.now.return_value = datetime(2026, 3, 1, 23, 40, 0)
+            result = await calendar.get_upcoming(hours_ahead=1)
+        assert [e["title"] for e in result] == ["Late", "Early"]
+
+    # ── Storage ───────────────────────────────────────────────────
+
+    def test_database_uses_wal(self, calendar):
+        """Calendar database is initialized in WAL journal mode."""
+        import sqlite3
+
+        conn = sqlite3.connect(calendar.db_path)
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        conn.close()
+        assert mode == "wal"
+
+    def test_participants_must_be_json(self, calendar):
+        """The participants column rejects values that are not valid JSON."""
+        import sqlite3
+
+        conn = sqlite3.connect(calendar.db_path)
+        with pytest.raises(sqlite3.IntegrityError):
+            conn.execute(
+                "INSERT INTO events (id, title, date, time, participants) VALUES ('e1', 'x', '2026-01-01', '10:00', 'Priya')",
+            )
+        conn.close()
+
 
 # ═══════════════════════════════════════════════════════════════════
 # Reminders
@@ -419,6 +539,29 @@ class TestReminders:
         result = await reminders.create({"text": "Do something"})
         assert "error" in result
 
+    @pytest.mark.asyncio
+    async def test_create_many(self, reminders):
+        """create_many stores valid reminders and reports invalid ones in place."""
+        future = (datetime.now() + timedelta(minutes=30)).isoformat()
+        results = await reminders.create_many([
+            {"text": "Call mom", "trigger_at": future},
+            {"text": "No time"},
+            {"text": "Stretch", "trigger_at": future},
+        ])
+        assert [r.get("text") for r in results] == ["Call mom", None, "Stretch"]
+        assert "error" in results[1]
+        assert results[0]["status"] == "pending"
+        assert len(await reminders.list_upcoming(hours_ahead=1)) == 2
+
+
+    @pytest.mark.asyncio
+    async def test_create_many_storage_failure_keeps_validation_errors(self, reminders):
+        """A failed write reports storage failure only for reminders that passed validation."""
+        future = (datetime.now() + timedelta(minutes=30)).isoformat()
+        with patch("capabilities.reminders.INSERT_REMINDER_SQL", "INSERT INTO missing VALUES (?)"):
+            results = await reminders.create_many([{"text": "Call mom", "trigger_at": future}, {"text": "No time"}])
+        assert "Storage failure" in results[0]["error"]
+        assert "Missing required fields" in results[1]["error"]
     # ── Get fired ─────────────────────────────────────────────────
 
     @pytest.mark.asyncio
@@ -447,6 +590,22 @@ class TestReminders:
         result = await reminders.get_fired()
         assert result == []
 
+    @pytest.mark.asyncio
+    async def test_get_fired_compares_times_not_text(self, reminders):
+        """A space-separated trigger_at earlier today still fires."""
+        past = (datetime.now() - timedelta(minutes=5)).isoformat(sep=" ", timespec="seconds")
+        await reminders.create({"text": "Spaced", "trigger_at": past})
+        result = await reminders.get_fired()
+        assert [r["text"] for r in result] == ["Spaced"]
+
+    @pytest.mark.asyncio
+    async def test_create_converts_offset_to_local_time(self, reminders):
+        """A trigger_at with a UTC offset is stored as naive local time."""
+        local = datetime.now().replace(microsecond=0)
+        aware = local.astimezone().isoformat()
+        result = await reminders.create({"text": "Offset", "trigger_at": aware})
+        assert result["trigger_at"] == local.isoformat()
+
     # ── Dismiss ───────────────────────────────────────────────────
 
     @pytest.mark.asyncio
@@ -515,6 +674,27 @@ class TestReminders:
         result = await reminders.delete("nonexistent-id")
         assert "error" in result
 
+    # ── Storage ───────────────────────────────────────────────────
+
+    def test_database_uses_wal(self, reminders):
+        """Reminders database is initialized in WAL journal mode."""
+        import sqlite3
+
+        conn = sqlite3.connect(reminders.db_path)
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        conn.close()
+        assert mode == "wal"
+
+    def test_get_fired_uses_index_without_sort(self, reminders):
+        """The fired-reminders query walks the status/trigger index in order."""
+        import sqlite3
+
+        conn = sqlite3.connect(reminders.db_path)
+        plan = " ".join(row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + GET_FIRED_SQL, (0,)))
+        conn.close()
+        assert "idx_reminders_status_trigger_epoch" in plan
+        assert "TEMP B-TREE" not in plan
+
 
 # ═══════════════════════════════════════════════════════════════════
 # Tasks
@@ -574,6 +754,28 @@ class TestTasks:
             result = await tasks.create({"title": f"Task {p}", "priority": p})
             assert result["priority"] == p
 
+    @pytest.mark.asyncio
+    async def test_create_converts_offset_to_local_time(self, tasks):
+        """A due_date with a UTC offset is stored as naive local time and counted as due today."""
+        local = datetime.now().replace(hour=12, minute=0, second=0, microsecond=0)
+        aware = local.astimezone().isoformat()
+        result = await tasks.create({"title": "Offset", "due_date": aware})
+        assert result["due_date"] == local.isoformat()
+        assert [t["title"] for t in await tasks.get_due_today()] == ["Offset"]
+
+    @pytest.mark.asyncio
+    async def test_create_many(self, tasks):
+        """create_many stores valid tasks and reports invalid ones in place."""
+        results = await tasks.create_many([
+            {"title": "Buy milk"},
+            {"title": "Bad", "priority": "urgent"},
+            {"title": "Buy eggs", "priority": "high"},
+        ])
+        assert [r.get("title") for r in results] == ["Buy milk", None, "Buy eggs"]
+        assert "Invalid priority" in results[1]["error"]
+        assert results[2]["status"] == "pending"
+        assert len(await tasks.list()) == 2
+
     # ── List ──────────────────────────────────────────────────────
 
     @pytest.mark.asyncio
@@ -695,6 +897,17 @@ class TestTasks:
         result = await tasks.get_due_today()
         assert result == []
 
+    # ── Storage ───────────────────────────────────────────────────
+
+    def test_database_uses_wal(self, tasks):
+        """Tasks database is initialized in WAL journal mode."""
+        import sqlite3
+
+        conn = sqlite3.connect(tasks.db_path)
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        conn.close()
+        assert mode == "wal"
+
 
 # ═══════════════════════════════════════════════════════════════════
 # System State
@@ -785,6 +998,40 @@ class TestSystemState:
             result = await ss.get()
             assert result["time_of_day"] == "night"
 
+    @pytest.mark.asyncio
+    async def test_battery_reading_cached(self):
+        """Battery is read once within the TTL and again after it expires."""
+        ss = SystemState()
+        with patch.object(ss, "_get_battery_percent", return_value=80) as read, \
+                patch("capabilities.system_state.time.monotonic", side_effect=[100.0, 130.0, 161.0]):
+            await ss.get()
+            await ss.get()
+            assert read.call_count == 1
+            await ss.get()
+            assert read.call_count == 2
+
+    def test_battery_from_pmset(self):
+        """Without sysfs, the percentage is parsed from the resolved pmset binary."""
+        ss = SystemState()
+        ss.close()
+        ss._pmset_path = "/usr/bin/pmset"
+        output = "Now drawing from 'Battery Power'\n -InternalBattery-0 (id=1)\t85%; discharging;\n"
+        with patch("capabilities.system_state.subprocess.run") as run:
+            run.return_value = MagicMock(stdout=output)
+            assert ss._get_battery_percent() == 85
+        assert run.call_args.args[0][0] == "/usr/bin/pmset"
+
+    def test_battery_from_open_sysfs_file(self, tmp_path):
+        """The Linux capacity file is opened once and re-read in place."""
+        capacity = tmp_path / "capacity"
+        capacity.write_text("42\n")
+        with patch("capabilities.system_state.LINUX_BATTERY_CAPACITY", str(capacity)):
+            ss = SystemState()
+        assert ss._get_battery_percent() == 42
+        capacity.write_text("41\n")
+        assert ss._get_battery_percent() == 41
+        ss.close()
+
 
 # ═══════════════════════════════════════════════════════════════════
 # Voice I/O
@@ -806,7 +1053,7 @@ class TestVoiceIO:
 
     def test_conversation_log_starts_empty(self, voice_io):
         """Conversation log starts empty."""
-        assert voice_io._conversation_log == []
+        assert len(voice_io._conversation_log) == 0
 
     # ── set_input_mode ────────────────────────────────────────────
 
@@ -831,6 +1078,15 @@ class TestVoiceIO:
             result = await voice_io.set_input_mode("voice")
             assert "error" in result
 
+    @pytest.mark.asyncio
+    async def test_warm_up_without_deps_is_noop(self, voice_io):
+        """warm_up returns done without loading anything when voice deps are missing."""
+        voice_io._audio_available = False
+        with patch.object(voice_io, "_ensure_voice_models_loaded") as mock_load:
+            result = await voice_io.warm_up()
+        assert result == {"status": "done"}
+        mock_load.assert_not_called()
+
     # ── listen (text mode) ────────────────────────────────────────
 
     @pytest.mark.asyncio
@@ -902,12 +1158,29 @@ class TestVoiceIO:
         assert len(voice_io._conversation_log) == 1
         assert voice_io._conversation_log[0]["role"] == "chitra"
 
+    @pytest.mark.asyncio
+    async def test_display_log_is_bounded(self, voice_io):
+        """The conversation log keeps only the most recent CONVERSATION_LOG_MAX entries."""
+        for i in range(voice_io.CONVERSATION_LOG_MAX):
+            await voice_io.display(f"user {i}", f"chitra {i}")
+        assert len(voice_io._conversation_log) == voice_io.CONVERSATION_LOG_MAX
+        assert voice_io._conversation_log[-1] == {"role": "chitra", "text": f"chitra {voice_io.CONVERSATION_LOG_MAX - 1}"}
+
     @pytest.mark.asyncio
     async def test_display_returns_done(self, voice_io):
         """Display returns status done."""
         result = await voice_io.display("Hello", "Hi!")
         assert result["status"] == "done"
 
+    @pytest.mark.asyncio
+    async def test_display_renders_exchange_in_one_print(self, voice_io):
+        """Both speaker lines and the blank separator are written with a single print."""
+        with patch.object(voice_io._console, "print") as mock_print:
+            await voice_io.display("Hello", "Hi!")
+
+        mock_print.assert_called_once()
+        assert mock_print.call_args.args[0].plain == "You  Hello\nChitra  Hi!\n"
+
     # ── confidence extraction ─────────────────────────────────────
 
     def test_extract_confidence_no_segments(self, voice_io):
@@ -943,6 +1216,13 @@ class TestVoiceIO:
         })
         assert result == 1.0
 
+    def test_extract_confidence_averages_segments(self, voice_io):
+        """_extract_confidence averages across segments, treating a missing logprob as -1.0."""
+        result = voice_io._extract_confidence({
+            "segments": [{"avg_logprob": -0.2}, {"avg_logprob": -0.4}, {}],
+        })
+        assert result == 0.47
+
 
 # ═══════════════════════════════════════════════════════════════════
 # Voice I/O — Voice Mode (mocked audio hardware)
@@ -983,13 +1263,30 @@ class TestVoiceIOVoice:
         assert vio._whisper_model is None
 
         mock_model = MagicMock()
-        with patch("capabilities.voice_io.whisper") as mock_whisper:
-            mock_whisper.load_model.return_value = mock_model
-            with patch.object(vio, "_load_silero_vad", return_value=MagicMock()):
+        with patch("capabilities.voice_io.WhisperModel") as mock_model_cls:
+            mock_model_cls.return_value = mock_model
+            with patch("capabilities.voice_io._HAS_FASTER_WHISPER", True), \
+                    patch.object(vio, "_load_silero_vad", return_value=MagicMock()):
                 await vio._ensure_voice_models_loaded()
 
         assert vio._whisper_model is mock_model
-        mock_whisper.load_model.assert_called_once_with(vio._whisper_model_name)
+        mock_model_cls.assert_called_once()
+        assert mock_model_cls.call_args[0][0] == vio._whisper_model_name
+
+    @pytest.mark.asyncio
+    async def test_ensure_whisper_prefers_int8_backend(self, voice_io_with_audio):
+        """faster-whisper is loaded with the int8 compute type, ahead of openai-whisper."""
+        vio = voice_io_with_audio
+
+        with patch("capabilities.voice_io._HAS_FASTER_WHISPER", True), \
+                patch("capabilities.voice_io.WhisperModel") as mock_model_cls, \
+                patch("capabilities.voice_io.whisper") as mock_whisper:
+            with patch.object(vio, "_load_silero_vad", return_value=MagicMock()):
+                await vio._ensure_voice_models_loaded()
+
+        mock_model_cls.assert_called_once_with(vio._whisper_model_name, device="cpu", compute_type="int8")
+        mock_whisper.load_model.assert_not_called()
+        assert vio._whisper_backend == "faster-whisper"
 
     @pytest.mark.asyncio
     async def test_ensure_vad_loaded_lazily(self, voice_io_with_audio):
@@ -998,13 +1295,20 @@ class TestVoiceIOVoice:
         assert vio._vad_model is None
 
         mock_vad = MagicMock()
-        with patch("capabilities.voice_io.whisper") as mock_whisper:
-            mock_whisper.load_model.return_value = MagicMock()
+        with patch.object(vio, "_load_whisper", return_value=MagicMock()):
             with patch.object(vio, "_load_silero_vad", return_value=mock_vad):
                 await vio._ensure_voice_models_loaded()
 
         assert vio._vad_model is mock_vad
 
+    def test_silero_vad_prefers_onnx(self, voice_io_with_audio):
+        """Silero VAD is loaded as its ONNX export when onnxruntime is installed."""
+        mock_sv = MagicMock()
+        with patch.dict("sys.modules", {"silero_vad": mock_sv}), \
+                patch("capabilities.voice_io._HAS_ONNXRUNTIME", True):
+            voice_io_with_audio._load_silero_vad()
+        mock_sv.load_silero_vad.assert_called_once_with(onnx=True)
+
     @pytest.mark.asyncio
     async def test_models_loaded_only_once(self, voice_io_with_audio):
         """Second call to _ensure_voice_models_loaded is a no-op."""
@@ -1012,10 +1316,56 @@ class TestVoiceIOVoice:
         vio._whisper_model = MagicMock()
         vio._vad_model = MagicMock()
 
-        with patch("capabilities.voice_io.whisper") as mock_whisper:
+        with patch.object(vio, "_load_whisper") as mock_load:
             await vio._ensure_voice_models_loaded()
 
-        mock_whisper.load_model.assert_not_called()
+        mock_load.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_warm_up_loads_and_runs_whisper(self, voice_io_with_audio):
+        """warm_up loads the models and transcribes one second of silence."""
+        vio = voice_io_with_audio
+        vio._tts_available = False
+        mock_model = MagicMock()
+        mock_model.transcribe.return_value = {"text": "", "segments": []}
+
+        with patch.object(vio, "_load_whisper", return_value=mock_model):
+            with patch.object(vio, "_load_silero_vad", return_value=MagicMock()):
+                result = await vio.warm_up()
+
+        assert result == {"status": "done"}
+        audio_arg = mock_model.transcribe.call_args[0][0]
+        assert len(audio_arg) == vio.SAMPLE_RATE
+
+    @pytest.mark.asyncio
+    async def test_concurrent_loads_share_one_model(self, voice_io_with_audio):
+        """A listen arriving during warm-up waits for the same load instead of starting another."""
+        vio = voice_io_with_audio
+
+        with patch.object(vio, "_load_whisper", return_value=MagicMock()) as mock_load:
+            with patch.object(vio, "_load_silero_vad", return_value=MagicMock()):
+                await asyncio.gather(vio._ensure_voice_models_loaded(), vio._ensure_voice_models_loaded())
+
+        mock_load.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_whisper_and_vad_load_concurrently(self, voice_io_with_audio):
+        """Whisper and Silero VAD load at the same time rather than one after the other."""
+        vio = voice_io_with_audio
+        # Each load waits for the other to start; sequential loading would break the barrier
+        both_loading = threading.Barrier(2, timeout=5)
+
+        def load(model):
+            both_loading.wait()
+            return model
+
+        whisper_model, vad_model = MagicMock(), MagicMock()
+        with patch.object(vio, "_load_whisper", side_effect=lambda: load(whisper_model)):
+            with patch.object(vio, "_load_silero_vad", side_effect=lambda: load(vad_model)):
+                await vio._ensure_voice_models_loaded()
+
+        assert vio._whisper_model is whisper_model
+        assert vio._vad_model is vad_model
 
     # ── voice input pipeline ───────────────────────────────────────
 
@@ -1026,7 +1376,7 @@ class TestVoiceIOVoice:
         vio._whisper_model = MagicMock()
         vio._vad_model = MagicMock()
 
-        fake_audio = np.zeros(16000, dtype=np.float32)
+        fake_audio = np.full(16000, 0.1, dtype=np.float32)
         whisper_result = {
             "text": " Hello Chitra ",
             "segments": [{"avg_logprob": -0.15}],
@@ -1039,6 +1389,27 @@ class TestVoiceIOVoice:
         assert result["text"] == "Hello Chitra"
         assert result["confidence"] > 0.5
 
+    @pytest.mark.asyncio
+    async def test_whisper_loads_and_runs_on_one_thread(self, voice_io_with_audio):
+        """Whisper is loaded and every transcription runs on the same dedicated thread."""
+        vio = voice_io_with_audio
+        threads = []
+
+        def record_thread(*args):
+            threads.append(threading.current_thread())
+            return {"text": "hi", "segments": []}
+
+        with patch.object(vio, "_load_whisper", side_effect=record_thread):
+            with patch.object(vio, "_load_silero_vad", return_value=MagicMock()):
+                with patch.object(vio, "_record_with_vad", return_value=np.ones(16000, dtype=np.float32)):
+                    with patch.object(vio, "_transcribe", side_effect=record_thread):
+                        await vio._listen_voice()
+                        await vio._listen_voice()
+
+        assert len(threads) == 3
+        assert len(set(threads)) == 1
+        assert threads[0].name.startswith("whisper")
+
     @pytest.mark.asyncio
     async def test_listen_voice_no_speech(self, voice_io_with_audio):
         """_listen_voice returns empty text when VAD detects no speech."""
@@ -1052,6 +1423,22 @@ class TestVoiceIOVoice:
         assert result["text"] == ""
         assert result["confidence"] == 0.0
 
+    @pytest.mark.asyncio
+    async def test_listen_voice_skips_short_or_quiet_audio(self, voice_io_with_audio):
+        """Recordings under 0.3 s or near-silent return empty text without running Whisper."""
+        vio = voice_io_with_audio
+        vio._whisper_model = MagicMock()
+        vio._vad_model = MagicMock()
+
+        short = np.full(vio.SAMPLE_RATE // 10, 0.1, dtype=np.float32)
+        quiet = np.full(vio.SAMPLE_RATE, 0.001, dtype=np.float32)
+        for audio in (short, quiet):
+            with patch.object(vio, "_record_with_vad", return_value=audio):
+                result = await vio._listen_voice()
+            assert result == {"text": "", "confidence": 0.0}
+
+        vio._whisper_model.transcribe.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_listen_voice_error_no_audio(self):
         """_listen_voice returns error when audio deps unavailable."""
@@ -1075,10 +1462,30 @@ class TestVoiceIOVoice:
     @pytest.mark.asyncio
     async def test_set_mode_voice_succeeds_with_deps(self, voice_io_with_audio):
         """Setting voice mode succeeds when audio deps are present."""
-        result = await voice_io_with_audio.set_input_mode("voice")
+        with patch.object(voice_io_with_audio, "warm_up", new=AsyncMock()):
+            result = await voice_io_with_audio.set_input_mode("voice")
         assert result["status"] == "done"
         assert result["mode"] == "voice"
 
+    @pytest.mark.asyncio
+    async def test_set_mode_voice_starts_warm_up(self, voice_io_with_audio):
+        """Switching to voice mode loads the voice models in the background."""
+        vio = voice_io_with_audio
+        with patch.object(vio, "warm_up", new=AsyncMock()) as mock_warm_up:
+            await vio.set_input_mode("voice")
+            await vio._warmup_task
+        mock_warm_up.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_set_mode_voice_skips_warm_up_when_loaded(self, voice_io_with_audio):
+        """No warm-up is started when the models are already loaded."""
+        vio = voice_io_with_audio
+        vio._whisper_model = MagicMock()
+        with patch.object(vio, "warm_up", new=AsyncMock()) as mock_warm_up:
+            await vio.set_input_mode("voice")
+        assert vio._warmup_task is None
+        mock_warm_up.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_listen_dispatches_by_mode(self, voice_io_with_audio):
         """Listen dispatches to _listen_voice when mode is voice."""
@@ -1127,7 +1534,7 @@ class TestVoiceIOVoice:
         mock_stream.__enter__ = lambda s: s
         mock_stream.__exit__ = lambda s, *a: None
 
-        with patch("capabilities.voice_io.sd.InputStream", return_value=mock_stream):
+        with patch("capabilities.voice_io.sd.RawInputStream", return_value=mock_stream):
             result = vio._record_with_vad()
 
         assert result is not None
@@ -1148,12 +1555,80 @@ class TestVoiceIOVoice:
         mock_stream.__enter__ = lambda s: s
         mock_stream.__exit__ = lambda s, *a: None
 
-        with patch("capabilities.voice_io.sd.InputStream", return_value=mock_stream):
+        with patch("capabilities.voice_io.sd.RawInputStream", return_value=mock_stream):
             with patch.object(vio, "MAX_RECORDING_SECONDS", 0.1):
                 result = vio._record_with_vad()
 
         assert result is None
 
+    def test_record_with_vad_keeps_pre_roll(self, voice_io_with_audio):
+        """Chunks captured just before speech onset are kept in the recording."""
+        vio = voice_io_with_audio
+        chunk_samples = int(vio.SAMPLE_RATE * 32 / 1000)
+        chunks = [np.full((chunk_samples, 1), i, dtype=np.float32) for i in range(4)]
+        # Chunks 0-1 read as silence, 2 as speech, 3 onwards as silence again
+        probs = iter([0.1, 0.1, 0.9])
+        vio._vad_model = MagicMock(side_effect=lambda tensor, sr: torch.tensor(next(probs, 0.1)))
+
+        reads = iter(chunks)
+        mock_stream = MagicMock()
+        mock_stream.read = lambda n: (next(reads, chunks[-1]), False)
+        mock_stream.__enter__ = lambda s: s
+        mock_stream.__exit__ = lambda s, *a: None
+
+        with patch("capabilities.voice_io.sd.RawInputStream", return_value=mock_stream):
+            result = vio._record_with_vad()
+
+        assert result[0] == 0.0
+        assert result[2 * chunk_samples] == 2.0
+
+    def test_record_with_vad_drops_trailing_silence(self, voice_io_with_audio):
+        """The recording ends a short post-roll after the last speech chunk, not after the silence window."""
+        vio = voice_io_with_audio
+        chunk_samples = int(vio.SAMPLE_RATE * 32 / 1000)
+        speech_chunk = np.full((chunk_samples, 1), 0.5, dtype=np.float32)
+        silence_chunk = np.zeros((chunk_samples, 1), dtype=np.float32)
+        # Three speech chunks, then silence until end of speech is detected
+        probs = iter([0.9, 0.9, 0.9])
+        vio._vad_model = MagicMock(side_effect=lambda tensor, sr: torch.tensor(next(probs, 0.1)))
+
+        reads = iter([speech_chunk] * 3)
+        mock_stream = MagicMock()
+        mock_stream.read = lambda n: (next(reads, silence_chunk), False)
+        mock_stream.__enter__ = lambda s: s
+        mock_stream.__exit__ = lambda s, *a: None
+
+        with patch("capabilities.voice_io.sd.RawInputStream", return_value=mock_stream):
+            result = vio._record_with_vad()
+
+        post_roll_samples = vio.POST_ROLL_MS // 32 * chunk_samples
+        assert len(result) == 3 * chunk_samples + post_roll_samples
+
+    def test_record_with_vad_skips_silero_on_gated_silence(self, voice_io_with_audio):
+        """Chunks the WebRTC silence gate rejects before speech never reach Silero."""
+        vio = voice_io_with_audio
+        chunk_samples = int(vio.SAMPLE_RATE * 32 / 1000)
+        silence_chunk = np.zeros((chunk_samples, 1), dtype=np.float32)
+        vio._vad_model = MagicMock(return_value=torch.tensor(0.1))
+        vio._silence_gate = MagicMock()
+        vio._silence_gate.is_speech.return_value = False
+
+        mock_stream = MagicMock()
+        mock_stream.read = lambda n: (silence_chunk, False)
+        mock_stream.__enter__ = lambda s: s
+        mock_stream.__exit__ = lambda s, *a: None
+
+        with patch("capabilities.voice_io.sd.RawInputStream", return_value=mock_stream):
+            with patch.object(vio, "MAX_RECORDING_SECONDS", 0.1):
+                result = vio._record_with_vad()
+
+        assert result is None
+        assert vio._silence_gate.is_speech.called
+        vio._vad_model.assert_not_called()
+        frame, rate = vio._silence_gate.is_speech.call_args.args
+        assert len(frame) == 480 * 2  # 30 ms of int16 at 16 kHz
+        assert rate == vio.SAMPLE_RATE
+
     # ── transcription ──────────────────────────────────────────────
 
     def test_transcribe_normalizes_audio(self, voice_io_with_audio):
@@ -1185,75 +1660,117 @@ class TestVoiceIOVoice:
         assert call_kwargs["language"] == "en"
         assert call_kwargs["fp16"] is False
 
+    def test_transcribe_int8_backend_result_shape(self, voice_io_with_audio):
+        """faster-whisper segments are converted to the openai-whisper result dict."""
+        vio = voice_io_with_audio
+        vio._whisper_backend = "faster-whisper"
+        segment = MagicMock(text=" Hello Chitra", avg_logprob=-0.2)
+        vio._whisper_model = MagicMock()
+        vio._whisper_model.transcribe.return_value = (iter([segment]), MagicMock())
+
+        result = vio._transcribe(np.zeros(16000, dtype=np.float32))
+
+        assert result == {"text": " Hello Chitra", "segments": [{"text": " Hello Chitra", "avg_logprob": -0.2}]}
+        assert vio._extract_confidence(result) == 0.8
+        call_kwargs = vio._whisper_model.transcribe.call_args[1]
+        assert call_kwargs["beam_size"] == 1
+        assert call_kwargs["vad_filter"] is False
+
     # ── TTS ────────────────────────────────────────────────────────
 
-    def test_speak_blocking_calls_piper(self, voice_io_with_audio):
-        """_speak_blocking calls Piper with correct args when available."""
+    @staticmethod
+    def _fake_piper(tmp_path, pcm=b"\x00\x00" * 22050, sample_rate=22050):
+        """Build a stand-in Piper process that answers each line with a WAV file path."""
+        wav_path = tmp_path / "utterance.wav"
+
+        def readline():
+            with wave.open(str(wav_path), "wb") as wav:
+                wav.setnchannels(1)
+                wav.setsampwidth(2)
+                wav.setframerate(sample_rate)
+                wav.writeframes(pcm)
+            return f"{wav_path}\n"
+
+        proc = MagicMock()
+        proc.pid = 1234
+        proc.poll.return_value = None
+        proc.stdout.readline.side_effect = readline
+        return proc
+
+    @pytest.fixture
+    def piper_ready(self, voice_io_with_audio):
+        """Voice I/O with Piper marked available and stdout always readable."""
         vio = voice_io_with_audio
         vio._tts_available = True
         vio._dev_tts_fallback = False
+        with patch("capabilities.voice_io.select.select", side_effect=lambda r, w, x, t: (r, w, x)):
+            yield vio
 
-        raw_pcm = np.zeros(22050, dtype=np.int16).tobytes()
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = raw_pcm
-        mock_result.stderr = b""
+    def test_speak_blocking_calls_piper(self, piper_ready, tmp_path):
+        """_speak_blocking starts Piper with correct args and writes the text as one line."""
+        vio = piper_ready
+        proc = self._fake_piper(tmp_path)
 
-        with patch("capabilities.voice_io.subprocess.run", return_value=mock_result) as mock_run:
+        with patch("capabilities.voice_io.subprocess.Popen", return_value=proc) as mock_popen:
             with patch("capabilities.voice_io.sd.play"):
                 with patch("capabilities.voice_io.sd.wait"):
-                    vio._speak_blocking("Hello")
+                    vio._speak_blocking("Hello\nthere")
 
-        mock_run.assert_called_once()
-        call_args = mock_run.call_args[0][0]
+        mock_popen.assert_called_once()
+        call_args = mock_popen.call_args[0][0]
         assert vio._piper_binary in call_args
         assert "--model" in call_args
-        assert "--output_raw" in call_args
+        assert "--output_dir" in call_args
+        proc.stdin.write.assert_called_once_with("Hello there\n")
 
-    def test_speak_blocking_piper_failure(self, voice_io_with_audio):
-        """_speak_blocking handles Piper non-zero exit gracefully."""
-        vio = voice_io_with_audio
-        vio._tts_available = True
-        vio._dev_tts_fallback = False
+    def test_speak_blocking_reuses_piper_process(self, piper_ready, tmp_path):
+        """Consecutive utterances go through the same Piper process."""
+        vio = piper_ready
+        proc = self._fake_piper(tmp_path)
 
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stderr = b"error"
+        with patch("capabilities.voice_io.subprocess.Popen", return_value=proc) as mock_popen:
+            with patch("capabilities.voice_io.sd.play"):
+                with patch("capabilities.voice_io.sd.wait"):
+                    assert vio._speak_blocking("Hello")
+                    assert vio._speak_blocking("Again")
+
+        mock_popen.assert_called_once()
+        assert proc.stdin.write.call_count == 2
+        assert not (tmp_path / "utterance.wav").exists()
 
-        with patch("capabilities.voice_io.subprocess.run", return_value=mock_result):
+    def test_speak_blocking_piper_failure(self, piper_ready, tmp_path):
+        """A Piper process that dies is killed, and the next utterance restarts it."""
+        vio = piper_ready
+        proc = self._fake_piper(tmp_path)
+        proc.stdout.readline.side_effect = None
+        proc.stdout.readline.return_value = ""
+
+        with patch("capabilities.voice_io.subprocess.Popen", return_value=proc) as mock_popen:
             with patch("capabilities.voice_io.sd.play") as mock_play:
+                assert vio._speak_blocking("Hello") is False
                 vio._speak_blocking("Hello")
 
         mock_play.assert_not_called()
+        proc.kill.assert_called()
+        assert mock_popen.call_count == 2
 
-    def test_speak_blocking_piper_empty_output(self, voice_io_with_audio):
+    def test_speak_blocking_piper_empty_output(self, piper_ready, tmp_path):
         """_speak_blocking handles empty Piper output gracefully."""
-        vio = voice_io_with_audio
-        vio._tts_available = True
-        vio._dev_tts_fallback = False
-
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = b""
+        vio = piper_ready
+        proc = self._fake_piper(tmp_path, pcm=b"")
 
-        with patch("capabilities.voice_io.subprocess.run", return_value=mock_result):
+        with patch("capabilities.voice_io.subprocess.Popen", return_value=proc):
             with patch("capabilities.voice_io.sd.play") as mock_play:
-                vio._speak_blocking("Hello")
+                assert vio._speak_blocking("Hello") is False
 
         mock_play.assert_not_called()
 
-    def test_speak_blocking_plays_audio(self, voice_io_with_audio):
-        """_speak_blocking plays PCM audio via sounddevice after Piper succeeds."""
-        vio = voice_io_with_audio
-        vio._tts_available = True
-        vio._dev_tts_fallback = False
+    def test_speak_blocking_plays_audio(self, piper_ready, tmp_path):
+        """_speak_blocking plays PCM audio via sounddevice at the voice's sample rate."""
+        vio = piper_ready
+        proc = self._fake_piper(tmp_path, sample_rate=16000)
 
-        raw_pcm = np.zeros(22050, dtype=np.int16).tobytes()
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = raw_pcm
-
-        with patch("capabilities.voice_io.subprocess.run", return_value=mock_result):
+        with patch("capabilities.voice_io.subprocess.Popen", return_value=proc):
             with patch("capabilities.voice_io.sd.play") as mock_play:
                 with patch("capabilities.voice_io.sd.wait") as mock_wait:
                     vio._speak_blocking("Hello")
@@ -1261,7 +1778,23 @@ class TestVoiceIOVoice:
         mock_play.assert_called_once()
         mock_wait.assert_called_once()
         audio_arg = mock_play.call_args[0][0]
-        assert audio_arg.dtype == np.float32
+        assert audio_arg.dtype == np.int16
+        assert mock_play.call_args[1]["samplerate"] == 16000
+
+    @pytest.mark.asyncio
+    async def test_aclose_stops_piper(self, piper_ready, tmp_path):
+        """Shutdown ends the Piper process and removes its output directory."""
+        vio = piper_ready
+        proc = self._fake_piper(tmp_path)
+
+        with patch("capabilities.voice_io.subprocess.Popen", return_value=proc):
+            vio._synthesize("Hello")
+        output_dir = vio._piper_output_dir
+        await vio.aclose()
+
+        proc.stdin.close.assert_called_once()
+        assert vio._piper_proc is None
+        assert not os.path.exists(output_dir)
 
     def test_speak_dev_fallback_uses_say(self, voice_io_with_audio):
         """_speak_blocking uses macOS say when dev fallback is active."""
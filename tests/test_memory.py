@@ -12,6 +12,7 @@ Tests:
 """
 
 import os
+from unittest.mock import patch
 
 import pytest
 
@@ -158,6 +159,41 @@ class TestMemoryStorage:
         assert "error" in result
         assert "Invalid source" in result["error"]
 
+    @pytest.mark.asyncio
+    async def test_store_many(self, memory):
+        """store_many saves valid entries and reports invalid ones in place."""
+        results = await memory.store_many([
+            {"category": "fact", "subject": "job", "content": "Works at Flipkart"},
+            {"category": "invalid", "subject": "x", "content": "y"},
+            {"category": "preference", "subject": "coffee", "content": "Likes filter coffee"},
+        ])
+        assert results[0]["active"] is True
+        assert "Invalid category" in results[1]["error"]
+        assert results[2]["subject"] == "coffee"
+        assert len(await memory.search("coffee")) == 1
+
+
+    @pytest.mark.asyncio
+    async def test_store_many_returns_stored_row(self, memory):
+        """Each store_many result is the row as stored, the same as store() returns."""
+        entry = {"category": "fact", "subject": "city", "content": "Lives in Bengaluru", "confidence": "0.8"}
+        single = await memory.store(entry)
+        [bulk] = await memory.store_many([entry])
+        assert bulk["confidence"] == 0.8
+        unstable = {"id": None, "created_at": None, "last_referenced": None}
+        assert {**bulk, **unstable} == {**single, **unstable}
+
+
+    @pytest.mark.asyncio
+    async def test_store_many_storage_failure_keeps_validation_errors(self, memory):
+        """A failed write reports storage failure only for entries that passed validation."""
+        with patch("capabilities.memory.INSERT_MEMORY_SQL", "INSERT INTO missing VALUES (?)"):
+            results = await memory.store_many([
+                {"category": "fact", "subject": "job", "content": "Works at Flipkart"},
+                {"category": "invalid", "subject": "x", "content": "y"},
+            ])
+        assert "Storage failure" in results[0]["error"]
+        assert "Invalid category" in results[1]["error"]
     # ── Search ────────────────────────────────────────────────────
 
     @pytest.mark.asyncio
@@ -179,7 +215,7 @@ class TestMemoryStorage:
 
     @pytest.mark.asyncio
     async def test_search_case_insensitive(self, memory):
-        """Search is case-insensitive via LIKE."""
+        """Search is case-insensitive."""
         await memory.store({"category": "fact", "subject": "work", "content": "Works at FLIPKART"})
         results = await memory.search("flipkart")
         assert len(results) == 1
@@ -208,6 +244,49 @@ class TestMemoryStorage:
         assert len(results) == 2
         assert results[0]["confidence"] >= results[1]["confidence"]
 
+    @pytest.mark.asyncio
+    async def test_search_limit(self, memory):
+        """Search returns at most limit entries, highest confidence first."""
+        for confidence in (0.5, 0.9, 0.7):
+            await memory.store({"category": "observation", "subject": "walk", "content": f"Walks {confidence}", "confidence": confidence, "source": "inferred"})
+        results = await memory.search("walks", limit=2)
+        assert [r["confidence"] for r in results] == [0.9, 0.7]
+
+    @pytest.mark.asyncio
+    async def test_search_prefix_match(self, memory):
+        """Search matches the last query word as a prefix."""
+        await memory.store({"category": "preference", "subject": "drink", "content": "Likes filter coffee"})
+        results = await memory.search("filter cof")
+        assert len(results) == 1
+
+    @pytest.mark.asyncio
+    async def test_search_reflects_update(self, memory):
+        """Search sees updated content, not the old text."""
+        stored = await memory.store({"category": "preference", "subject": "drink", "content": "Likes coffee"})
+        await memory.update(stored["id"], "Likes tea")
+        assert await memory.search("coffee") == []
+        assert len(await memory.search("tea")) == 1
+
+    @pytest.mark.asyncio
+    async def test_search_indexes_existing_entries(self, tmp_path):
+        """Entries stored before the full-text index existed are searchable."""
+        import sqlite3
+
+        from storage.schema import MEMORY_SCHEMA
+
+        db_path = str(tmp_path / "legacy.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute(MEMORY_SCHEMA)
+        conn.execute(
+            """INSERT INTO memories (id, category, subject, content, created_at, last_referenced)
+               VALUES ('m1', 'fact', 'job', 'Works at Flipkart', '2026-01-01', '2026-01-01')""",
+        )
+        conn.commit()
+        conn.close()
+
+        results = await Memory(db_path).search("Flipkart")
+        assert [r["id"] for r in results] == ["m1"]
+
     # ── Update ────────────────────────────────────────────────────
 
     @pytest.mark.asyncio
@@ -231,6 +310,14 @@ class TestMemoryStorage:
         result = await memory.update("nonexistent-id", "New content")
         assert "error" in result
 
+    @pytest.mark.asyncio
+    async def test_update_deactivated(self, memory):
+        """Update returns error for a deactivated entry."""
+        stored = await memory.store({"category": "fact", "subject": "temp", "content": "Temporary info"})
+        await memory.deactivate(stored["id"])
+        result = await memory.update(stored["id"], "New content")
+        assert "error" in result
+
     # ── Deactivate ────────────────────────────────────────────────
 
     @pytest.mark.asyncio
@@ -254,6 +341,26 @@ class TestMemoryStorage:
         result = await memory.deactivate("nonexistent-id")
         assert "error" in result
 
+    # ── Storage ───────────────────────────────────────────────────
+
+    def test_database_uses_wal(self, memory):
+        """Memory database is initialized in WAL journal mode."""
+        import sqlite3
+
+        conn = sqlite3.connect(memory.db_path)
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        conn.close()
+        assert mode == "wal"
+
+    def test_context_index_created(self, memory):
+        """The context window index exists after init."""
+        import sqlite3
+
+        conn = sqlite3.connect(memory.db_path)
+        names = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        conn.close()
+        assert "idx_memories_context" in names
+
 
 class TestMemoryContext:
     """Tests for context block assembly and injection."""
@@ -346,6 +453,38 @@ class TestMemoryContext:
         assert "People:" in block
         assert "Current patterns:" in block
 
+    @pytest.mark.asyncio
+    async def test_context_is_deterministic(self, memory, sample_entries):
+        """Repeated calls yield identical text and version; a new entry changes both."""
+        for entry in sample_entries:
+            await memory.store(entry)
+        first = await memory.get_context()
+        second = await memory.get_context()
+        assert first == second
+        await memory.store({"category": "preference", "subject": "tea", "content": "Likes masala chai", "source": "stated"})
+        third = await memory.get_context()
+        assert third["version"] != first["version"]
+
+    @pytest.mark.asyncio
+    async def test_context_split_static_and_dynamic(self, memory, sample_entries):
+        """Observations go in the dynamic block; everything else is static."""
+        for entry in sample_entries:
+            await memory.store(entry)
+        ctx = await memory.get_context()
+        assert "About the user:" in ctx["static_block"]
+        assert "People:" in ctx["static_block"]
+        assert "Current patterns:" not in ctx["static_block"]
+        assert ctx["dynamic_block"].startswith("Current patterns:")
+        assert ctx["context_block"] == ctx["static_block"] + "\n\n" + ctx["dynamic_block"]
+
+    @pytest.mark.asyncio
+    async def test_context_entries_in_insertion_order(self, memory):
+        """Entries within a section appear in the order they were stored."""
+        for content in ("Zebra fact", "Apple fact", "Mango fact"):
+            await memory.store({"category": "fact", "subject": "x", "content": content, "source": "stated"})
+        block = (await memory.get_context())["context_block"]
+        assert block.index("Zebra") < block.index("Apple") < block.index("Mango")
+
     # ── last_referenced tracking ──────────────────────────────────
 
     @pytest.mark.asyncio
@@ -391,6 +530,34 @@ class TestMemoryContext:
         # Should not have been updated since it was excluded
         assert row["last_referenced"] == original_ref
 
+    @pytest.mark.asyncio
+    async def test_get_context_updates_last_referenced_in_batches(self, memory):
+        """last_referenced is refreshed for every included entry, even past one UPDATE batch."""
+        import sqlite3
+
+        from capabilities.memory import UPDATE_BATCH_SIZE
+
+        stale = "2000-01-01T00:00:00"
+        conn = sqlite3.connect(memory.db_path)
+        conn.executemany(
+            """INSERT INTO memories
+               (id, category, subject, content, created_at, last_referenced)
+               VALUES (?, 'preference', 'bulk', ?, ?, ?)""",
+            [(f"m{i}", f"Preference {i}", stale, stale) for i in range(UPDATE_BATCH_SIZE + 10)],
+        )
+        conn.commit()
+        conn.close()
+
+        await memory.get_context()
+
+        conn = sqlite3.connect(memory.db_path)
+        remaining = conn.execute(
+            "SELECT COUNT(*) FROM memories WHERE last_referenced = ?", (stale,),
+        ).fetchone()[0]
+        conn.close()
+
+        assert remaining == 0
+
     # ── Context window rules: relationship aging ──────────────────
 
     @pytest.mark.asyncio
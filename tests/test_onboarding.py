@@ -12,6 +12,7 @@ Tests:
 """
 
 import os
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -55,13 +56,61 @@ class TestOnboarding:
     @pytest.mark.asyncio
     async def test_should_run_after_complete(self, onboarding):
         """should_run returns False after onboarding marker is created."""
-        onboarding._mark_complete()
+        await onboarding._mark_complete()
         assert await onboarding.should_run() is False
 
-    def test_mark_complete_creates_file(self, onboarding):
-        """_mark_complete creates the .onboarding_complete marker file."""
-        onboarding._mark_complete()
+    @pytest.mark.asyncio
+    async def test_should_run_checks_marker_once(self, onboarding):
+        """should_run stats the marker file only on its first call."""
+        with patch("onboarding.flow.os.path.exists", return_value=False) as mock_exists:
+            assert await onboarding.should_run() is True
+            assert await onboarding.should_run() is True
+        mock_exists.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_mark_complete_creates_file(self, onboarding):
+        """_mark_complete creates the .onboarding_complete marker file, leaving no temp file behind."""
+        await onboarding._mark_complete()
         assert os.path.exists(onboarding._onboarding_marker)
+        assert not os.path.exists(onboarding._onboarding_marker + ".tmp")
+
+    @pytest.mark.asyncio
+    async def test_run_stores_answers_in_one_batch(self, onboarding, core):
+        """run() stores every non-empty answer to Memory with a single store_many call."""
+        answers = iter(["Bala", "typing", "Amma is my mother", "9 to 5", "nothing"])
+        listen = AsyncMock(side_effect=lambda: {"text": next(answers), "confidence": 1.0})
+
+        with (
+            patch.object(core.voice_io, "listen", new=listen),
+            patch.object(core.memory, "store_many", wraps=core.memory.store_many) as mock_store_many,
+        ):
+            await onboarding.run()
+
+        mock_store_many.assert_called_once()
+        subjects = [entry["subject"] for entry in mock_store_many.call_args.args[0]]
+        assert subjects == ["name", "input_mode", "key_people", "work_schedule"]
+        assert await onboarding.should_run() is False
+
+    @pytest.mark.asyncio
+    async def test_run_keeps_answers_when_interrupted(self, onboarding, core):
+        """Answers already given are stored when onboarding is interrupted partway."""
+        answers = iter([{"text": "Bala", "confidence": 1.0}, {"text": "typing", "confidence": 1.0}])
+
+        def listen():
+            try:
+                return next(answers)
+            except StopIteration:
+                raise KeyboardInterrupt from None
+
+        with (
+            patch.object(core.voice_io, "listen", new=AsyncMock(side_effect=listen)),
+            pytest.raises(KeyboardInterrupt),
+        ):
+            await onboarding.run()
+
+        block = (await core.memory.get_context())["context_block"]
+        assert "Bala" in block
+        assert await onboarding.should_run() is True
 
     def test_marker_path(self, onboarding, core):
         """Marker file is in the correct data directory."""
@@ -137,6 +186,20 @@ class TestOnboarding:
         await onboarding._process_input_mode("keyboard please")
         assert core.voice_io._input_mode == "text"
 
+    @pytest.mark.asyncio
+    async def test_process_input_mode_voice(self, onboarding, core):
+        """_process_input_mode detects voice preference, including word forms like 'talking'."""
+        with patch.object(core.voice_io, "set_input_mode", new=AsyncMock(return_value={"status": "done"})) as mock_set:
+            await onboarding._process_input_mode("I'd rather be talking to you")
+        mock_set.assert_awaited_once_with("voice")
+
+    @pytest.mark.asyncio
+    async def test_process_input_mode_matches_whole_words(self, onboarding, core):
+        """A keyword inside a longer word ('context') does not pick a mode."""
+        with patch.object(core.voice_io, "set_input_mode", new=AsyncMock(return_value={"status": "done"})) as mock_set:
+            await onboarding._process_input_mode("depends on the context, mostly voice")
+        mock_set.assert_awaited_once_with("voice")
+
     @pytest.mark.asyncio
     async def test_process_input_mode_default(self, onboarding, core):
         """_process_input_mode defaults to text for ambiguous answers."""
@@ -6,29 +6,37 @@ Tests:
 - Text-mode E2E conversation loop tests
 - Proactive loop trigger and response
 - JSON parsing failure and retry behavior
+- Streamed replies spoken sentence by sentence
 - Context assembly correctness
 """
 
 import asyncio
+import inspect
+import json
 import os
 from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 
 # Set test data directory before any imports
 os.environ["CHITRA_DATA_DIR"] = "/tmp/chitra_test_orchestration"
 
 
-from llm.client import LLMClient
+from capabilities.memory import CATEGORIES, SOURCES
+from llm.client import KEEP_ALIVE, MEMORY_ENTRY_SCHEMA, RESPONSE_SCHEMA, LLMClient
 from llm.prompts import (
     CORRECTION_PROMPT,
     PROACTIVE_PROMPT_TEMPLATE,
     RESPONSE_FORMAT_INSTRUCTION,
+    STATIC_SYSTEM_PREFIX,
     SYSTEM_IDENTITY,
 )
+from llm.streaming import ResponseSentences
 from orchestration.context import ContextAssembler
-from orchestration.core import OrchestrationCore
-from orchestration.proactive import ProactiveLoop
+from orchestration.core import OrchestrationCore, _takes_single_dict
+from orchestration.proactive import REEVALUATE_SECONDS, ProactiveLoop
+from orchestration.speech import SpeechQueue
 
 # ── Fixtures ─────────────────────────────────────────────────────
 
@@ -99,6 +107,18 @@ class TestOrchestrationCore:
         assert core.conversation_history[0]["content"] == "msg 8"
         assert core.conversation_history[3]["content"] == "reply 9"
 
+    def test_update_history_character_budget(self, core):
+        """_update_history drops the oldest turns once history exceeds max_history_chars."""
+        core.max_history_chars = 100
+        core._update_history("a" * 40, "b" * 40)
+        core._update_history("c" * 20, "d" * 20)
+        # 120 characters > 100 — the first turn goes
+        assert [m["content"][0] for m in core.conversation_history] == ["c", "d"]
+
+        # A single oversized turn is still kept
+        core._update_history("e" * 200, "f")
+        assert [m["content"][0] for m in core.conversation_history] == ["e", "f"]
+
     @pytest.mark.asyncio
     async def test_execute_action_create_contact(self, core):
         """execute_action dispatches create() with single-dict parameter."""
@@ -128,6 +148,20 @@ class TestOrchestrationCore:
         assert result is not None
         assert result["name"] == "Amma"
 
+    @pytest.mark.asyncio
+    async def test_execute_action_inspects_signature_once(self, core):
+        """Repeated calls to the same action reuse the cached calling convention."""
+        _takes_single_dict.cache_clear()
+        with patch("orchestration.core.inspect.signature", wraps=inspect.signature) as signature:
+            for name in ("Ravi", "Amma"):
+                result = await core.execute_action({
+                    "capability": "contacts",
+                    "action": "create",
+                    "params": {"name": name},
+                })
+                assert result["name"] == name
+        assert signature.call_count == 1
+
     @pytest.mark.asyncio
     async def test_execute_action_no_params(self, core):
         """execute_action dispatches methods with no parameters."""
@@ -224,6 +258,14 @@ class TestOrchestrationCore:
         assert "Flipkart" in block
         assert "filter coffee" in block
 
+    @pytest.mark.asyncio
+    async def test_store_memories_in_one_batch(self, core):
+        """Valid entries are stored in a single store_many call; invalid ones are skipped."""
+        entry = {"category": "fact", "subject": "work", "content": "Works at Flipkart"}
+        with patch.object(core.memory, "store_many", AsyncMock(return_value=[{"id": "m1"}])) as store_many:
+            await core.store_memories([entry, "not a dict"])
+        store_many.assert_awaited_once_with([entry])
+
     @pytest.mark.asyncio
     async def test_store_memories_invalid_entries(self, core):
         """store_memories handles non-dict entries gracefully without crashing."""
@@ -259,7 +301,7 @@ class TestProactiveLoop:
     async def test_gather_empty_context(self, core):
         """_gather_proactive_context returns empty list when no data exists."""
         loop = ProactiveLoop(core)
-        parts = await loop._gather_proactive_context()
+        parts, _ = await loop._gather_proactive_context()
         assert parts == []
 
     @pytest.mark.asyncio
@@ -271,7 +313,7 @@ class TestProactiveLoop:
             "priority": "high",
         })
         loop = ProactiveLoop(core)
-        parts = await loop._gather_proactive_context()
+        parts, _ = await loop._gather_proactive_context()
         assert any("Submit report" in p for p in parts)
         assert any("Overdue tasks" in p for p in parts)
 
@@ -283,7 +325,7 @@ class TestProactiveLoop:
             "trigger_at": "2025-01-01T08:00:00",
         })
         loop = ProactiveLoop(core)
-        parts = await loop._gather_proactive_context()
+        parts, _ = await loop._gather_proactive_context()
         assert any("Take medicine" in p for p in parts)
 
     @pytest.mark.asyncio
@@ -299,9 +341,23 @@ class TestProactiveLoop:
         conn.close()
 
         loop = ProactiveLoop(core)
-        parts = await loop._gather_proactive_context()
+        parts, _ = await loop._gather_proactive_context()
         assert any("Amma" in p for p in parts)
 
+    @pytest.mark.asyncio
+    async def test_gather_skips_failed_source(self, core):
+        """A failing capability is skipped while the other sources are still reported."""
+        await core.tasks.create({
+            "title": "Submit report",
+            "due_date": "2025-01-01",
+            "priority": "high",
+        })
+        core.calendar.get_upcoming = AsyncMock(side_effect=RuntimeError("calendar db locked"))
+        loop = ProactiveLoop(core)
+        parts, _ = await loop._gather_proactive_context()
+        assert len(parts) == 1
+        assert "Submit report" in parts[0]
+
     @pytest.mark.asyncio
     async def test_tick_skips_when_user_active(self, core):
         """tick() skips when is_user_active is True."""
@@ -317,9 +373,73 @@ class TestProactiveLoop:
         loop = ProactiveLoop(core)
         await loop.tick()
 
+    @pytest.mark.asyncio
+    async def test_tick_skips_llm_for_unchanged_context(self, core):
+        """An unchanged context is sent to the LLM once, then again only after REEVALUATE_SECONDS."""
+        await core.tasks.create({"title": "Submit report", "due_date": "2025-01-01"})
+        quiet = {"should_speak": False, "response": "", "intent": "proactive", "action": None, "memory_store": []}
+        loop = ProactiveLoop(core)
+
+        with patch.object(core.llm, "call", AsyncMock(return_value=quiet)) as call:
+            await loop.tick()
+            await loop.tick()
+            assert call.await_count == 1
+
+            loop._last_evaluated_at -= REEVALUATE_SECONDS
+            await loop.tick()
+            assert call.await_count == 2
+
+            await core.tasks.create({"title": "File taxes", "due_date": "2025-02-01"})
+            await loop.tick()
+            assert call.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_tick_retries_context_after_llm_failure(self, core):
+        """A fallback reply or a failed call does not mark the context as evaluated."""
+        await core.tasks.create({"title": "Submit report", "due_date": "2025-01-01"})
+        speak = {
+            "should_speak": True, "response": "Your report is overdue.",
+            "intent": "proactive", "action": None, "memory_store": [],
+        }
+        loop = ProactiveLoop(core)
+        core.voice_io.display = AsyncMock()
+        core.voice_io.speak = AsyncMock()
+
+        # Ollama unreachable — the client returns its fallback reply
+        with patch.object(core.llm, "_send", AsyncMock(return_value=None)):
+            await loop.tick()
+        with patch.object(core.context_assembler, "assemble", AsyncMock(side_effect=RuntimeError("boom"))):
+            await loop.tick()
+        with patch.object(core.llm, "call", AsyncMock(return_value=speak)) as call:
+            await loop.tick()
+
+        assert call.await_count == 1
+        core.voice_io.display.assert_awaited_once_with("", "Your report is overdue.")
+
+    @pytest.mark.asyncio
+    async def test_tick_always_evaluates_fired_reminders(self, core):
+        """A context with fired reminders is sent to the LLM on every tick."""
+        await core.reminders.create({"text": "Take medicine", "trigger_at": "2025-01-01T08:00:00"})
+        quiet = {"should_speak": False, "response": "", "intent": "proactive", "action": None, "memory_store": []}
+        loop = ProactiveLoop(core)
+
+        with patch.object(core.llm, "call", AsyncMock(return_value=quiet)) as call:
+            await loop.tick()
+            await loop.tick()
+
+        assert call.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_databases(self, core):
+        """_checkpoint_databases folds committed writes back into the database files."""
+        await core.tasks.create({"title": "Buy groceries"})
+        loop = ProactiveLoop(core)
+        await loop._checkpoint_databases()
+        assert await core.tasks.list() != []
+
     @pytest.mark.asyncio
     async def test_dismiss_fired_reminders(self, core):
-        """_dismiss_fired_reminders dismisses all fired reminders."""
+        """_dismiss_fired_reminders dismisses the given fired reminders."""
         await core.reminders.create({
             "text": "Take medicine",
             "trigger_at": "2025-01-01T08:00:00",
@@ -328,11 +448,22 @@ class TestProactiveLoop:
         assert len(fired_before) == 1
 
         loop = ProactiveLoop(core)
-        await loop._dismiss_fired_reminders()
+        await loop._dismiss_fired_reminders(fired_before)
 
         fired_after = await core.reminders.get_fired()
         assert len(fired_after) == 0
 
+    @pytest.mark.asyncio
+    async def test_gather_returns_fired_reminders_for_dismissal(self, core):
+        """The fired reminders gathered for the prompt are returned for dismissal."""
+        created = await core.reminders.create({
+            "text": "Take medicine",
+            "trigger_at": "2025-01-01T08:00:00",
+        })
+        loop = ProactiveLoop(core)
+        _, fired = await loop._gather_proactive_context()
+        assert [r["id"] for r in fired] == [created["id"]]
+
 
 # ── Context Assembly Tests ───────────────────────────────────────
 
@@ -385,6 +516,22 @@ class TestContextAssembly:
         result = await core.context_assembler.assemble([])
         assert "Flipkart" in result["system_prompt"]
 
+    @pytest.mark.asyncio
+    async def test_assemble_skips_failed_source(self, core):
+        """A capability that raises drops only its own section from the prompt."""
+        core.system_state.get = AsyncMock(side_effect=RuntimeError("sensor read failed"))
+        result = await core.context_assembler.assemble([])
+        prompt = result["system_prompt"]
+        assert "Current state:" not in prompt
+        assert SYSTEM_IDENTITY[:50] in prompt
+        assert RESPONSE_FORMAT_INSTRUCTION[:50] in prompt
+
+    @pytest.mark.asyncio
+    async def test_assemble_starts_with_static_prefix(self, core):
+        """Every system prompt starts with the same fixed identity, catalog and format prefix."""
+        result = await core.context_assembler.assemble([])
+        assert result["system_prompt"].startswith(STATIC_SYSTEM_PREFIX)
+
     @pytest.mark.asyncio
     async def test_assemble_preserves_history(self, core):
         """assemble() passes through conversation history unchanged."""
@@ -406,6 +553,15 @@ class TestContextAssembly:
         assert "Saturday" in result
         assert "85%" in result
 
+    @pytest.mark.asyncio
+    async def test_format_system_state_reused_within_minute(self, core):
+        """States differing only in seconds format to the same cached string."""
+        base = {"day_of_week": "Saturday", "time_of_day": "night", "battery_percent": 85}
+        first = core.context_assembler._format_system_state({**base, "datetime": "2026-02-21T22:30:05"})
+        second = core.context_assembler._format_system_state({**base, "datetime": "2026-02-21T22:30:41"})
+        assert first is second
+        assert "Time: 2026-02-21T22:30." in first
+
     @pytest.mark.asyncio
     async def test_format_system_state_error(self, core):
         """_format_system_state returns empty string on error state."""
@@ -472,6 +628,33 @@ class TestLLMClient:
         client = LLMClient()
         assert client.model == os.environ.get("CHITRA_LLM_MODEL", "qwen2.5:7b")
 
+    @pytest.mark.asyncio
+    async def test_call_constrains_output_to_response_schema(self):
+        """Chat requests pass the response JSON schema as Ollama's format and keep the model loaded."""
+        requests = []
+
+        def reply(request):
+            requests.append(json.loads(request.content))
+            content = json.dumps({"intent": "chat", "action": None, "response": "Hi!", "memory_store": []})
+            return httpx.Response(200, json={"message": {"role": "assistant", "content": content}})
+
+        client = LLMClient()
+        client._client = httpx.AsyncClient(base_url=client.base_url, transport=httpx.MockTransport(reply))
+        result = await client.call("system", "hello")
+        await client.close()
+
+        assert result["response"] == "Hi!"
+        assert requests[0]["format"] == RESPONSE_SCHEMA
+        assert requests[0]["keep_alive"] == KEEP_ALIVE
+        assert RESPONSE_SCHEMA["required"] == ["intent", "action", "response", "memory_store"]
+
+    def test_memory_entry_schema_matches_memory_validation(self):
+        """The memory_store schema allows exactly the categories and sources Memory accepts."""
+        properties = MEMORY_ENTRY_SCHEMA["properties"]
+        assert set(properties["category"]["enum"]) == CATEGORIES
+        assert set(properties["source"]["enum"]) == SOURCES
+        assert RESPONSE_SCHEMA["properties"]["memory_store"]["items"] is MEMORY_ENTRY_SCHEMA
+
     def test_parse_valid_json(self):
         """_parse_response parses valid JSON correctly."""
         client = LLMClient()
@@ -497,6 +680,14 @@ class TestLLMClient:
         assert result is not None
         assert result["response"] == "Hello!"
 
+    def test_parse_json_with_brace_inside_string(self):
+        """_parse_response keeps a closing brace inside a string value when extracting JSON."""
+        client = LLMClient()
+        raw = 'Sure: {"intent": "chat", "response": "Use } sparingly."} hope that helps'
+        result = client._parse_response(raw)
+        assert result is not None
+        assert result["response"] == "Use } sparingly."
+
     def test_parse_missing_response_field(self):
         """_parse_response returns None when 'response' field is missing."""
         client = LLMClient()
@@ -534,6 +725,220 @@ class TestLLMClient:
         assert result["memory_store"] == []
 
 
+# ── Streaming Tests ──────────────────────────────────────────────
+
+
+def _feed_all(chunks):
+    """Feed chunks to a ResponseSentences and collect every sentence, including the flush."""
+    sentences = ResponseSentences()
+    out = []
+    for chunk in chunks:
+        out.extend(sentences.feed(chunk))
+    out.extend(sentences.flush())
+    return out
+
+
+def _chars(text):
+    """Split text into single-character chunks, the worst case for streaming."""
+    return list(text)
+
+
+class TestResponseSentences:
+    """Tests for sentence extraction from a streamed JSON reply."""
+
+    def test_sentences_released_as_they_complete(self):
+        """Each sentence is returned as soon as the whitespace after it arrives."""
+        sentences = ResponseSentences()
+        sentences.feed('{"intent": "chat", "action": null, "response": "Good morning, Bala. ')
+        assert sentences.feed("You have two meetings") == []
+        assert sentences.feed(' today."') == []
+        assert sentences.flush() == ["You have two meetings today."]
+
+    def test_single_character_chunks(self):
+        """Sentences come out whole even when every chunk is one character."""
+        raw = '{"action": null, "response": "First sentence here. Second one is here too!", "memory_store": []}'
+        assert _feed_all(_chars(raw)) == ["First sentence here.", "Second one is here too!"]
+
+    def test_abbreviations_do_not_split(self):
+        """A period after Dr. or PM does not end the sentence."""
+        raw = '{"action": null, "response": "Your appointment with Dr. Rao is at 4 PM. today. Bring the report."}'
+        assert _feed_all([raw]) == ["Your appointment with Dr. Rao is at 4 PM. today.", "Bring the report."]
+
+    def test_short_fragments_join_next_sentence(self):
+        """Fragments under the minimum length are spoken with the following sentence."""
+        raw = '{"action": null, "response": "Hi! Ravi called about dinner. Ok."}'
+        assert _feed_all([raw]) == ["Hi! Ravi called about dinner.", "Ok."]
+
+    def test_escapes_split_across_chunks(self):
+        """Escape sequences cut mid-way by the stream are decoded once complete."""
+        raw = '{"action": null, "response": "He said \\"call me\\" twice. Caf\\u00e9 at 5 works."}'
+        assert _feed_all(_chars(raw)) == ['He said "call me" twice.', "Café at 5 works."]
+
+    def test_nothing_released_with_action(self):
+        """No sentences are released when the reply carries an action."""
+        raw = (
+            '{"action": {"capability": "tasks", "action": "create", "params": {}}, '
+            '"response": "Adding that task now. Done soon."}'
+        )
+        assert _feed_all(_chars(raw)) == []
+
+
+class TestLLMStreaming:
+    """Tests for LLMClient.call_streaming against a mocked Ollama stream."""
+
+    @staticmethod
+    def _streaming_client(content):
+        """LLMClient whose transport streams content as Ollama chat chunks, a few characters each."""
+        lines = [
+            json.dumps({"message": {"role": "assistant", "content": content[i:i + 7]}, "done": False})
+            for i in range(0, len(content), 7)
+        ]
+        lines.append(json.dumps({"message": {"role": "assistant", "content": ""}, "done": True}))
+        body = ("\n".join(lines) + "\n").encode()
+
+        client = LLMClient()
+        client._client = httpx.AsyncClient(
+            base_url=client.base_url,
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, content=body)),
+        )
+        return client
+
+    @pytest.mark.asyncio
+    async def test_call_streaming_speaks_and_parses(self):
+        """Sentences reach on_sentence in order, and the full reply is still parsed."""
+        content = json.dumps({
+            "intent": "chat", "action": None,
+            "response": "Good evening, Bala. Dinner with Ravi is at eight.", "memory_store": [],
+        })
+        client = self._streaming_client(content)
+        spoken = []
+
+        async def on_sentence(sentence):
+            spoken.append(sentence)
+
+        result = await client.call_streaming("system", "hello", on_sentence=on_sentence)
+        await client.close()
+
+        assert spoken == ["Good evening, Bala.", "Dinner with Ravi is at eight."]
+        assert result["response"] == "Good evening, Bala. Dinner with Ravi is at eight."
+
+    @pytest.mark.asyncio
+    async def test_call_streaming_discards_rejected_attempt(self):
+        """A malformed streamed attempt is discarded and the unstreamed retry is returned."""
+        truncated = '{"intent": "chat", "action": null, "response": "Sorry about that. Let me check again.", "memory_store": ['
+        retry = json.dumps({"intent": "chat", "action": None, "response": "Dinner is at eight.", "memory_store": []})
+        client = self._streaming_client(truncated)
+        client._send = AsyncMock(return_value=retry)
+        spoken = []
+
+        class FakeVoice:
+            async def speak(self, text):
+                spoken.append(text)
+                return {"status": "done"}
+
+        speech = SpeechQueue(FakeVoice())
+        result = await client.call_streaming(
+            "system", "hello", on_sentence=speech.say, on_discard=speech.discard,
+        )
+        await client.close()
+
+        assert result["response"] == "Dinner is at eight."
+        # The queue is unstarted again, so the conversation loop speaks the retry in full
+        assert not speech.started
+        assert "Dinner is at eight." not in spoken
+
+    @pytest.mark.asyncio
+    async def test_call_streaming_keeps_parsed_attempt(self):
+        """on_discard is not called when the streamed attempt parses."""
+        content = json.dumps({"intent": "chat", "action": None, "response": "Hello there, Bala.", "memory_store": []})
+        client = self._streaming_client(content)
+        on_discard = AsyncMock()
+
+        await client.call_streaming("system", "hello", on_sentence=AsyncMock(), on_discard=on_discard)
+        await client.close()
+
+        on_discard.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_call_streaming_connection_failure(self):
+        """A failed stream falls back to the safe response without speaking."""
+        client = LLMClient()
+
+        def refuse(request):
+            raise httpx.ConnectError("refused")
+
+        client._client = httpx.AsyncClient(base_url=client.base_url, transport=httpx.MockTransport(refuse))
+        on_sentence = AsyncMock()
+
+        result = await client.call_streaming("system", "hello", on_sentence=on_sentence)
+        await client.close()
+
+        assert result == client._fallback_response()
+        on_sentence.assert_not_called()
+
+
+class TestSpeechQueue:
+    """Tests for the sentence-by-sentence speech queue."""
+
+    @pytest.mark.asyncio
+    async def test_speaks_in_order_and_finishes(self):
+        """Queued sentences are spoken in order, and finish waits for the last one."""
+        spoken = []
+
+        class FakeVoice:
+            async def speak(self, text):
+                await asyncio.sleep(0)
+                spoken.append(text)
+                return {"status": "done"}
+
+        speech = SpeechQueue(FakeVoice())
+        await speech.say("One.")
+        await speech.say("Two.")
+        await speech.finish()
+
+        assert speech.started
+        assert spoken == ["One.", "Two."]
+
+    @pytest.mark.asyncio
+    async def test_discard_drops_unspoken_sentences(self):
+        """discard() drops queued sentences and leaves the queue unstarted and reusable."""
+        spoken = []
+        release = asyncio.Event()
+
+        class FakeVoice:
+            async def speak(self, text):
+                await release.wait()
+                spoken.append(text)
+                return {"status": "done"}
+
+        speech = SpeechQueue(FakeVoice())
+        await speech.say("One.")
+        await speech.say("Two.")
+        await asyncio.sleep(0)
+        release.set()
+        await speech.discard()
+
+        assert spoken == ["One."]
+        assert not speech.started
+
+        await speech.say("Three.")
+        await speech.finish()
+        assert spoken == ["One.", "Three."]
+
+    @pytest.mark.asyncio
+    async def test_handle_input_streams_when_given_on_sentence(self, core):
+        """handle_input uses the streaming call when a sentence callback is passed."""
+        on_sentence = AsyncMock()
+        reply = _make_llm_response("Hello there, how can I help?")
+
+        with patch.object(core.llm, "call_streaming", new_callable=AsyncMock, return_value=reply) as mock_stream:
+            response_text = await core.handle_input("hi", on_sentence=on_sentence)
+
+        assert response_text == "Hello there, how can I help?"
+        assert mock_stream.call_args[1]["on_sentence"] is on_sentence
+        assert mock_stream.call_args[1]["on_discard"] is None
+
+
 # ── Prompt Tests ─────────────────────────────────────────────────
 
 
@@ -772,6 +1177,53 @@ class TestTextModeE2E:
         ctx = await core.memory.get_context()
         assert "Amma" in ctx.get("context_block", "")
 
+    @pytest.mark.asyncio
+    async def test_action_overlaps_first_memory_store(self, e2e_core):
+        """The first call's memories are stored alongside the action; the follow-up's after it."""
+        core = e2e_core
+        first_llm = _make_llm_response(
+            "Checking.",
+            action={"capability": "contacts", "action": "list", "params": {}},
+            memory_store=[{"category": "fact", "subject": "work", "content": "Works at Flipkart"}],
+        )
+        followup_llm = _make_llm_response(
+            "You have no contacts yet.",
+            memory_store=[{"category": "preference", "subject": "coffee", "content": "Prefers filter coffee"}],
+        )
+        stored_during_action = []
+
+        async def mock_execute_action(action):
+            await asyncio.sleep(0.05)
+            stored_during_action.append((await core.memory.get_context())["context_block"])
+            return []
+
+        with patch.object(core.llm, "call", AsyncMock(side_effect=[first_llm, followup_llm])), \
+                patch.object(core, "execute_action", side_effect=mock_execute_action):
+            await core.handle_input("who are my contacts?")
+
+        assert "Flipkart" in stored_during_action[0]
+        block = (await core.memory.get_context())["context_block"]
+        assert "Flipkart" in block
+        assert "filter coffee" in block
+
+    @pytest.mark.asyncio
+    async def test_first_memory_store_finishes_when_followup_fails(self, e2e_core):
+        """The overlapped memory write is awaited even when the follow-up call raises."""
+        core = e2e_core
+        first_llm = _make_llm_response(
+            "Checking.",
+            action={"capability": "contacts", "action": "list", "params": {}},
+            memory_store=[{"category": "fact", "subject": "work", "content": "Works at Flipkart"}],
+        )
+        store_many = AsyncMock(return_value=[{"id": "m1"}])
+
+        with patch.object(core.llm, "call", AsyncMock(side_effect=[first_llm, RuntimeError("ollama down")])), \
+                patch.object(core.memory, "store_many", store_many):
+            response = await core.handle_input("who are my contacts?")
+
+        assert "trouble" in response
+        store_many.assert_awaited_once()
+
     # ── 4. Multi-turn conversation with history ──────────────────
 
     @pytest.mark.asyncio
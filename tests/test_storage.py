@@ -0,0 +1,202 @@
+"""
+Storage layer tests.
+
+Tests:
+- Connection pool reuse and limits
+- Writer transaction cleanup on return to the pool
+- Pool shutdown
+- Passive WAL checkpoints
+- Blocking methods run off the event loop
+- Capability column order against the table schemas
+- Record ID generation
+- Epoch conversion against SQLite's strftime
+- Today's epoch range
+"""
+
+import asyncio
+import sqlite3
+import threading
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from capabilities.calendar import Calendar
+from capabilities.contacts import Contacts
+from capabilities.memory import Memory
+from capabilities.reminders import Reminders
+from capabilities.tasks import Tasks
+from storage.epoch import epoch_seconds, to_local_naive, today_range
+from storage.ids import new_id
+from storage.pool import ConnectionPool, run_in_thread
+
+
+@pytest.fixture
+def pool(tmp_path):
+    """Create a connection pool over an isolated database with one table."""
+    pool = ConnectionPool(str(tmp_path / "pool.db"), max_size=2)
+    with pool.connection(write=True) as conn:
+        conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+        conn.commit()
+    yield pool
+    pool.close()
+
+
+class TestConnectionPool:
+    """Tests for the SQLite connection pool."""
+
+    def test_writer_is_reused(self, pool):
+        """The same write connection is handed out on every borrow."""
+        with pool.connection(write=True) as first:
+            pass
+        with pool.connection(write=True) as second:
+            pass
+        assert first is second
+
+    def test_reader_is_reused(self, pool):
+        """An idle read connection is reused rather than reopened."""
+        with pool.connection() as first:
+            pass
+        with pool.connection() as second:
+            pass
+        assert first is second
+
+    def test_readers_open_up_to_max_size(self, pool):
+        """Concurrent borrows open distinct read connections."""
+        with pool.connection() as first, pool.connection() as second:
+            assert first is not second
+
+    def test_rows_support_column_access(self, pool):
+        """Pooled connections return rows addressable by column name."""
+        with pool.connection(write=True) as conn:
+            conn.execute("INSERT INTO items (name) VALUES ('a')")
+            conn.commit()
+        with pool.connection() as conn:
+            row = conn.execute("SELECT * FROM items").fetchone()
+        assert row["name"] == "a"
+
+    def test_uncommitted_write_rolled_back(self, pool):
+        """A write left uncommitted is rolled back when the connection returns."""
+        with pool.connection(write=True) as conn:
+            conn.execute("INSERT INTO items (name) VALUES ('lost')")
+        with pool.connection() as conn:
+            count = conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+        assert count == 0
+
+    def test_failed_write_rolled_back(self, pool):
+        """An exception inside the block rolls back and returns the writer."""
+        with pytest.raises(RuntimeError), pool.connection(write=True) as conn:
+            conn.execute("INSERT INTO items (name) VALUES ('lost')")
+            raise RuntimeError("boom")
+        with pool.connection(write=True) as conn:
+            assert not conn.in_transaction
+            count = conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+        assert count == 0
+
+    def test_close_then_reopen(self, pool):
+        """After close, the pool transparently opens fresh connections."""
+        with pool.connection() as before:
+            pass
+        pool.close()
+        with pool.connection() as after:
+            count = after.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+        assert after is not before
+        assert count == 0
+
+
+class TestCheckpoint:
+    """Tests for passive WAL checkpoints on the pool's writer."""
+
+    def test_checkpoint_empties_wal(self, pool):
+        """A checkpoint with no readers active copies every WAL frame back."""
+        with pool.connection(write=True) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("INSERT INTO items (name) VALUES ('a')")
+            conn.commit()
+        assert pool.checkpoint() is True
+        with pool.connection(write=True) as conn:
+            busy, log_frames, checkpointed = conn.execute("PRAGMA wal_checkpoint(PASSIVE)").fetchone()
+        assert busy == 0
+        assert log_frames == checkpointed
+
+    def test_checkpoint_skips_busy_writer(self, pool):
+        """A busy writer makes checkpoint return immediately rather than wait."""
+        with pool.connection(write=True):
+            assert pool.checkpoint() is False
+
+
+class TestRunInThread:
+    """Tests for the run_in_thread decorator."""
+
+    @pytest.mark.asyncio
+    async def test_runs_on_worker_thread(self):
+        """The wrapped function runs outside the event loop thread."""
+
+        @run_in_thread
+        def current_thread():
+            return threading.get_ident()
+
+        assert await current_thread() != threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_capability_calls(self, tmp_path):
+        """Concurrent actions on one capability share the pool safely."""
+        contacts = Contacts(str(tmp_path / "contacts.db"))
+        await asyncio.gather(*(contacts.create({"name": f"Friend {i}"}) for i in range(20)))
+        assert len(await contacts.list()) == 20
+        contacts.close()
+
+
+@pytest.mark.parametrize(
+    ("capability_cls", "table"),
+    [
+        (Calendar, "events"),
+        (Contacts, "contacts"),
+        (Memory, "memories"),
+        (Reminders, "reminders"),
+        (Tasks, "tasks"),
+    ],
+)
+def test_capability_columns_match_schema(tmp_path, capability_cls, table):
+    """Each capability's positional column list matches its table's column order."""
+    instance = capability_cls(str(tmp_path / f"{table}.db"))
+    conn = sqlite3.connect(instance.db_path)
+    columns = tuple(row[1] for row in conn.execute(f"PRAGMA table_info({table})"))
+    conn.close()
+    assert capability_cls._COLUMNS == columns
+
+
+def test_new_id_unique():
+    """new_id never repeats within a process."""
+    ids = [new_id() for _ in range(10000)]
+    assert len(set(ids)) == len(ids)
+    assert all(isinstance(i, str) for i in ids)
+
+
+@pytest.mark.parametrize("value", [date(2026, 2, 22), datetime(2026, 2, 22, 10, 30, 15, 123456)])
+def test_epoch_seconds_matches_sqlite(value):
+    """epoch_seconds agrees with strftime('%s') on the stored ISO text."""
+    conn = sqlite3.connect(":memory:")
+    expected = conn.execute("SELECT CAST(strftime('%s', ?) AS INTEGER)", (value.isoformat(),)).fetchone()[0]
+    conn.close()
+    assert epoch_seconds(value) == expected
+
+
+def test_today_range_is_local_date():
+    """today_range spans the current local date, in epoch_seconds terms."""
+    today = date.today()
+    assert today_range() == (epoch_seconds(today), epoch_seconds(today + timedelta(days=1)))
+
+
+@pytest.mark.parametrize("value", ["2026-01-01T10:00:00+05:30", "2026-01-01T10:00:00Z"])
+def test_to_local_naive_keeps_the_instant(value):
+    """An offset-bearing time becomes naive local time for the same instant."""
+    result = to_local_naive(value)
+    parsed = datetime.fromisoformat(result)
+    assert parsed.tzinfo is None
+    assert parsed.astimezone() == datetime.fromisoformat(value)
+
+
+@pytest.mark.parametrize("value", ["2026-01-01T10:00:00", "2026-01-01", "tomorrow", None])
+def test_to_local_naive_passes_other_values_through(value):
+    """Naive times, dates and unparseable values are returned unchanged."""
+    assert to_local_naive(value) == value